@@ -54,6 +54,33 @@ namespace DigitalTwinLoc
         public ZoneBlock zone = new ZoneBlock();
     }
 
+    /// <summary>
+    /// 시계 오프셋 왕복 표본을 위해 이전 요청/응답의 네 시각(나노초)을 서버로 되돌려 보내는 클래스
+    /// 값이 0이면 서버는 단방향 표본을 사용
+    /// </summary>
+    [Serializable]
+    public class ClockSyncBlock
+    {
+        public long t0_ns; // 이전 FramePacket의 timestamp_ns (클라이언트 전송 시각)
+        public long t1_ns; // 이전 응답의 time_stamps[0] (서버 도착 시각)
+        public long t2_ns; // 이전 응답의 time_stamps[1] (서버 출발 시각)
+        public long t3_ns; // 이전 응답을 받은 시각 (클라이언트 시계)
+
+        /// <summary>
+        /// 이전 요청과 그 응답으로 네 시각 설정
+        /// </summary>
+        /// <param name="sent">이전에 보낸 FramePacket</param>
+        /// <param name="response">그 요청의 응답</param>
+        /// <param name="receivedNs">응답을 받은 시각(나노초, SetCurrentTimestamp와 같은 시계)</param>
+        public void Set(FramePacket sent, PosePacket response, long receivedNs)
+        {
+            t0_ns = sent.timestamp_ns;
+            t1_ns = response.time_stamps[0];
+            t2_ns = response.time_stamps[1];
+            t3_ns = receivedNs;
+        }
+    }
+
     /// <summary>
     /// 유니티 앱에서 서버로 전송되는 이미지 데이터를 표현하는 클래스
     /// </summary>
@@ -65,6 +92,7 @@ namespace DigitalTwinLoc
         public CameraBlock camera = new CameraBlock();
         public PoseBlock pose = new PoseBlock();
         public string image = "";
+        public ClockSyncBlock clock_sync = new ClockSyncBlock(); // 선택: 이전 요청/응답의 시각 에코
 
         /// <summary>
         /// 이미지 데이터를 Base64 문자열로 변환
@@ -1,3 +1,4 @@
+import os
 from flask import Flask
 
 def create_app():
@@ -13,4 +14,42 @@ def create_app():
     # 루트 라우트 등록
     app.register_blueprint(routes.root_bp)
     
+    # 다중 워커 프로세스 실행 시 지연 전략을 공유 메모리로 동기화
+    shared_state_name = os.environ.get('DELAY_SHARED_STATE_NAME')
+    if shared_state_name and routes.delay_simulator.shared_state is None:
+        from app.services.shared_delay_state import SharedDelayState
+        routes.delay_simulator.attach_shared_state(SharedDelayState(shared_state_name))
+    
+    # 포즈 변형 난수 시드 (모든 워커가 같은 프레임에 같은 변형을 적용)
+    pose_noise_seed = os.environ.get('POSE_NOISE_SEED')
+    if pose_noise_seed:
+        from app.services.image_processor import set_pose_noise_seed
+        set_pose_noise_seed(int(pose_noise_seed))
+    
+    # 선박 배치 파일로 위치에서 영역(데크/구획) 결정
+    ship_layout_path = os.environ.get('SHIP_LAYOUT_PATH')
+    if ship_layout_path:
+        from app.services.zone_index import load_layout_file
+        load_layout_file(ship_layout_path)
+    
+    # 좌표계 변환 그래프 (카메라 → 몸체 → 데크 → 선박)
+    transform_graph_path = os.environ.get('TRANSFORM_GRAPH_PATH')
+    if transform_graph_path:
+        from app.services.transform_graph import default_graph
+        default_graph.load_file(transform_graph_path)
+    
+    # CPU 사용량이 큰 파이프라인 단계를 프로세스 풀로 분리 (워커는 위에서 적재한 시드/배치/변환 그래프로 초기화)
+    stage_workers = os.environ.get('POSE_STAGE_WORKERS')
+    if stage_workers and routes.pose_pipeline.executor is None:
+        from app.services.stage_executor import StageExecutor
+        max_pending = os.environ.get('POSE_STAGE_MAX_PENDING')
+        submit_timeout = os.environ.get('POSE_STAGE_SUBMIT_TIMEOUT')
+        executor = StageExecutor(
+            max_workers=int(stage_workers),
+            max_pending=int(max_pending) if max_pending else None,
+            submit_timeout=float(submit_timeout) if submit_timeout else None
+        )
+        offload = os.environ.get('POSE_OFFLOAD_STAGES', 'localize')
+        routes.pose_pipeline.set_executor(executor, tuple(kind.strip() for kind in offload.split(',') if kind.strip()))
+    
     return app
@@ -1,8 +1,20 @@
 from flask import Blueprint, request, jsonify, render_template_string
+import os
 import time
 import json
-from app.services.image_processor import process_image
-from app.services.delay_simulator import DelaySimulator
+import tempfile
+from app.services.pose_pipeline import default_pipeline as pose_pipeline, STAGE_KINDS
+from app.services.delay_simulator import DelaySimulator, STRATEGY_DEFAULTS
+from app.services.delay_strategies import RequestDropped, EmpiricalDelayStrategy
+from app.services.scenario_runner import ScenarioRunner
+from app.services.stage_executor import StageQueueFull
+from app.services.pose_tracking import default_tracker
+from app.services import zone_index
+from app.services.frame_grouping import FrameGrouper
+from app.services.frame_coalescing import FrameCoalescer
+from app.services.transform_graph import default_graph as transform_graph
+from app.services.clock_sync import ClockSync
+from app.services.clock import RealClock, ScaledClock
 
 # API 블루프린트 생성
 api_bp = Blueprint('api', __name__, url_prefix='/api')
@@ -13,6 +25,18 @@ root_bp = Blueprint('root', __name__)
 # 지연 시뮬레이터 인스턴스 생성
 delay_simulator = DelaySimulator()
 
+# 시나리오 자동 실행기 인스턴스 생성
+scenario_runner = ScenarioRunner(delay_simulator)
+
+# 다중 카메라 프레임 그룹화기 인스턴스 생성 (기본값: 사용 안 함)
+frame_grouper = FrameGrouper()
+
+# 카메라별 최신 프레임 우선 처리기 인스턴스 생성 (기본값: 사용 안 함)
+frame_coalescer = FrameCoalescer()
+
+# 클라이언트별 시계 오프셋 추정기 인스턴스 생성
+clock_sync = ClockSync()
+
 # 최근 요청과 응답 정보 저장 (최대 20개)
 recent_requests = []
 MAX_RECENT_REQUESTS = 20
@@ -63,6 +87,16 @@ def index():
             time_diff_ns = time_depart - time_arrive
             time_diff_s = time_diff_ns / 1_000_000_000
             
+            # 지연 계측 정보 추출 (요청 지연 / 실제 대기 / 초과 지연)
+            delay_record = req.get('delay_record')
+            delay_record_html = ""
+            if delay_record:
+                delay_record_html = (
+                    f"<p>요청 지연: {delay_record['requested_ms']:.3f}ms, "
+                    f"실제 대기: {delay_record['actual_ms']:.3f}ms, "
+                    f"초과: {delay_record['overshoot_ms']:.3f}ms</p>"
+                )
+            
             recent_requests_html += f"""
             <div class="request-item">
                 <h4>요청 {i+1} - {request_time_str}</h4>
@@ -83,6 +117,7 @@ def index():
                         <h5>지연 정보</h5>
                         <p>전략: {strategy_name}</p>
                         <p>지연 시간: {time_diff_s:.6f}초</p>
+                        {delay_record_html}
                         <pre>{json.dumps(delay_params, indent=2, ensure_ascii=False)}</pre>
                     </div>
                 </div>
@@ -235,7 +270,8 @@ def index():
       "deck": 1,
       "compartment": "Main",
       "zone_id": 1
-    }
+    },
+    "frame": "ship"
   }
 }</pre>
         </div>
@@ -542,6 +578,22 @@ def index():
     """
     return render_template_string(html)
 
+def _build_request_info(image_data):
+    """
+    지연 전략에 전달할 요청 정보 생성
+    
+    Args:
+        image_data (dict): 요청 JSON 데이터
+        
+    Returns:
+        dict: 요청 크기(바이트), ID 블록, 클라이언트 타임스탬프
+    """
+    return {
+        'payload_bytes': request.content_length or len(request.get_data()),
+        'ID': image_data.get('ID') or {},
+        'timestamp_ns': image_data.get('timestamp_ns', 0)
+    }
+
 @api_bp.route('/image', methods=['POST'])
 def upload_image():
     """
@@ -551,47 +603,233 @@ def upload_image():
     """
     global recent_requests
     
+    # 서버 도착 시각 (시계 오프셋 추정에 사용하므로 최신 프레임 대기, 그룹화 대기, 파이프라인 처리 전에 기록)
+    arrival_ns = time.time_ns()
+    
     try:
         # 요청 데이터 파싱
         image_data = request.json
         
-        # 요청 시간 기록
-        request_time = time.time()
-        
-        # 이미지 처리
-        result = process_image(image_data)
-        
-        # 설정된 지연 적용
-        delay_simulator.apply_delay()
-        
-        # PosePacket 객체 생성 (결과에서 복원)
-        from app.models.pose_packet import PosePacket
-        pose_packet = PosePacket.from_dict(result)
-        
-        # 출발 시간 설정 (서버에서 응답을 보내는 시간)
-        pose_packet.set_departure_time()
-        
-        # 응답 데이터 생성
-        response_data = pose_packet.to_dict()
-        
-        # 최근 요청 및 응답 정보 저장
-        request_info = {
-            'request_time': request_time,
-            'request_data': image_data,
-            'response_data': response_data,
-            'delay_config': delay_simulator.get_config()
-        }
-        
-        # 최근 요청 목록 업데이트 (최대 MAX_RECENT_REQUESTS개 유지)
-        recent_requests.insert(0, request_info)
-        if len(recent_requests) > MAX_RECENT_REQUESTS:
-            recent_requests = recent_requests[:MAX_RECENT_REQUESTS]
-        
-        # 업데이트된 결과 반환
-        return jsonify(response_data), 200
+        # 최신 프레임 우선 처리: 같은 카메라의 더 새로운 프레임에 대체된 프레임은 처리하지 않고 즉시 응답
+        coalesce_key = None
+        if frame_coalescer.enabled and image_data.get('ID'):
+            coalesce_key = frame_coalescer.stream_key(image_data)
+            if not frame_coalescer.acquire(coalesce_key, image_data.get('timestamp_ns', 0)):
+                return jsonify({
+                    "superseded": True,
+                    "ID": image_data.get('ID'),
+                    "timestamp_ns": image_data.get('timestamp_ns', 0)
+                }), 409
+        
+        try:
+            # 요청 시간 기록
+            request_time = time.time()
+            
+            # 이미지 처리 (쿼리 문자열로 이번 요청의 단계 구현 선택 가능, 예: ?localize=passthrough)
+            # 결과 좌표계와 대상도 쿼리 문자열로 선택 (예: ?frame=deck&subject=body)
+            # 그룹화를 사용하면 같은 사용자의 카메라 프레임을 모아 파이프라인을 배치로 실행하고 융합 포즈를 함께 반환
+            fused = None
+            stage_overrides = {kind: request.args[kind] for kind in STAGE_KINDS if request.args.get(kind)}
+            if frame_grouper.enabled and image_data.get('ID'):
+                result, pipeline_timings, fused = frame_grouper.process(
+                    image_data, stage_overrides,
+                    output_frame=request.args.get('frame'),
+                    subject=request.args.get('subject')
+                )
+            else:
+                result, pipeline_timings = pose_pipeline.run(
+                    image_data, stage_overrides,
+                    output_frame=request.args.get('frame'),
+                    subject=request.args.get('subject')
+                )
+            
+            # 클라이언트 시계 오프셋 추정 갱신 및 보정된 업링크 지연 계산
+            clock_record = clock_sync.observe(image_data, arrival_ns)
+            
+            # 설정된 지연 적용 (요청 크기와 식별 정보를 전략에 전달)
+            phase = scenario_runner.current_phase()
+            try:
+                delay_record = delay_simulator.apply_delay(_build_request_info(image_data))
+            except RequestDropped as dropped:
+                scenario_runner.observe(phase, dropped.record)
+                raise
+            delay_record['phase'] = phase
+            scenario_runner.observe(phase, delay_record)
+            
+            # PosePacket 객체 생성 (결과에서 복원)
+            from app.models.pose_packet import PosePacket
+            pose_packet = PosePacket.from_dict(result)
+            
+            # 출발 시간 설정 (서버에서 응답을 보내는 시간)
+            pose_packet.set_departure_time()
+            
+            # 응답 데이터 생성
+            response_data = pose_packet.to_dict()
+            if fused is not None:
+                response_data['fused'] = fused
+            
+            # 최근 요청 및 응답 정보 저장
+            request_info = {
+                'request_time': request_time,
+                'request_data': image_data,
+                'response_data': response_data,
+                'delay_config': delay_simulator.get_config(),
+                'delay_record': delay_record,
+                'clock_sync': clock_record,
+                'pipeline_timings_us': {kind: elapsed_ns / 1000 for kind, elapsed_ns in pipeline_timings.items()}
+            }
+            
+            # 최근 요청 목록 업데이트 (최대 MAX_RECENT_REQUESTS개 유지)
+            recent_requests.insert(0, request_info)
+            if len(recent_requests) > MAX_RECENT_REQUESTS:
+                recent_requests = recent_requests[:MAX_RECENT_REQUESTS]
+            
+            # 업데이트된 결과 반환
+            return jsonify(response_data), 200
+        finally:
+            if coalesce_key is not None:
+                frame_coalescer.release(coalesce_key)
+    except StageQueueFull as e:
+        # 측위 단계 대기열 초과: 처리하지 않고 즉시 거절
+        return jsonify({"error": str(e)}), 503
+    except RequestDropped as dropped:
+        # 손실 요청: WSGI에서는 연결을 리셋할 수 없으므로 본문 없이 연결을 닫는 응답으로 대신함
+        # ('abort'는 즉시 503, 'hang'은 hang_seconds 동안 응답하지 않은 뒤 504)
+        status = 504 if dropped.mode == 'hang' else 503
+        return '', status, {'Connection': 'close'}
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@api_bp.route('/pipeline', methods=['GET'])
+def get_pipeline_config():
+    """
+    포즈 처리 파이프라인 설정 및 단계별 소요 시간 조회 API
+    """
+    config = pose_pipeline.get_config()
+    config['tracker'] = default_tracker.get_config()
+    return jsonify(config), 200
+
+@api_bp.route('/pipeline', methods=['POST'])
+def set_pipeline_config():
+    """
+    포즈 처리 파이프라인 단계 구현 변경 API
+    """
+    try:
+        data = request.json or {}
+        pose_pipeline.set_stages(data.get('stages') or {})
+        if data.get('tracker'):
+            default_tracker.configure(**data['tracker'])
+        config = pose_pipeline.get_config()
+        config['tracker'] = default_tracker.get_config()
+        return jsonify({
+            "message": "파이프라인 단계가 변경되었습니다.",
+            "config": config
+        }), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 400
+
+@api_bp.route('/grouping', methods=['GET'])
+def get_grouping_config():
+    """
+    다중 카메라 프레임 그룹화 설정 및 통계 조회 API
+    """
+    return jsonify(frame_grouper.get_config()), 200
+
+@api_bp.route('/grouping', methods=['POST'])
+def set_grouping_config():
+    """
+    다중 카메라 프레임 그룹화 설정 변경 API
+    """
+    try:
+        frame_grouper.configure(**(request.json or {}))
+        frame_grouper.reset_stats()
+        return jsonify({
+            "message": "프레임 그룹화 설정이 변경되었습니다.",
+            "config": frame_grouper.get_config()
+        }), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 400
+
+@api_bp.route('/coalescing', methods=['GET'])
+def get_coalescing_config():
+    """
+    최신 프레임 우선 처리 설정 및 통계 조회 API
+    """
+    return jsonify(frame_coalescer.get_config()), 200
+
+@api_bp.route('/coalescing', methods=['POST'])
+def set_coalescing_config():
+    """
+    최신 프레임 우선 처리 설정 변경 API
+    """
+    try:
+        frame_coalescer.configure(**(request.json or {}))
+        frame_coalescer.reset_stats()
+        return jsonify({
+            "message": "최신 프레임 우선 처리 설정이 변경되었습니다.",
+            "config": frame_coalescer.get_config()
+        }), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 400
+
+@api_bp.route('/transforms', methods=['GET'])
+def get_transforms():
+    """
+    좌표계 변환 그래프 조회 API
+    """
+    return jsonify(transform_graph.get_config()), 200
+
+@api_bp.route('/transforms', methods=['POST'])
+def set_transforms():
+    """
+    좌표계 변환 그래프 적재 API (기존 변환은 모두 대체)
+    """
+    try:
+        transform_graph.load(request.json or {})
+        return jsonify({
+            "message": "좌표계 변환이 적재되었습니다.",
+            "config": transform_graph.get_config()
+        }), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 400
+
+@api_bp.route('/zones/layout', methods=['GET'])
+def get_zone_layout():
+    """
+    선박 구역 색인 요약 조회 API
+    """
+    index = zone_index.get_zone_index()
+    return jsonify({"layout": index.get_config() if index is not None else None}), 200
+
+@api_bp.route('/zones/layout', methods=['POST'])
+def set_zone_layout():
+    """
+    선박 배치 적재 API (본문이 null이면 색인 해제)
+    """
+    try:
+        index = zone_index.load_layout(request.get_json(silent=True))
+        return jsonify({
+            "message": "선박 배치가 적재되었습니다." if index is not None else "선박 배치가 해제되었습니다.",
+            "layout": index.get_config() if index is not None else None
+        }), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 400
+
+@api_bp.route('/zones/resolve', methods=['POST'])
+def resolve_zones():
+    """
+    위치 목록이 속한 영역 조회 API
+    """
+    try:
+        index = zone_index.get_zone_index()
+        if index is None:
+            return jsonify({"error": "적재된 선박 배치가 없습니다."}), 404
+        positions = (request.json or {}).get('positions') or []
+        zones = index.resolve_batch(positions) if positions else []
+        return jsonify({"zones": [zone.to_dict() if zone is not None else None for zone in zones]}), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 400
+
 @api_bp.route('/delay/config', methods=['GET'])
 def get_delay_config():
     """
@@ -607,11 +845,117 @@ def set_delay_config():
     """
     try:
         config = request.json
-        delay_simulator.set_strategy(config.get('strategy'), config.get('params', {}))
+        delay_simulator.set_strategy(
+            config.get('strategy'),
+            config.get('params', {}),
+            in_flight_policy=config.get('in_flight_policy')
+        )
         return jsonify({"message": "지연 설정이 변경되었습니다."}), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 400
 
+@api_bp.route('/delay/timing', methods=['GET'])
+def get_delay_timing():
+    """
+    지연 정확도 통계 조회 API
+
+    요청 지연 대비 실제 대기 시간의 초과 지연 분포 반환
+    """
+    return jsonify(delay_simulator.get_timing_stats()), 200
+
+@api_bp.route('/delay/timing', methods=['POST'])
+def set_delay_timing():
+    """
+    정밀 대기 모드 설정 API
+    """
+    try:
+        data = request.json or {}
+        spin_threshold_ms = data.get('spin_threshold_ms')
+        delay_simulator.set_precise_mode(
+            precise=bool(data.get('precise', False)),
+            spin_threshold_ns=int(spin_threshold_ms * 1_000_000) if spin_threshold_ms is not None else None
+        )
+        return jsonify({
+            "message": "정밀 대기 모드가 설정되었습니다.",
+            "timing": delay_simulator.get_timing_stats()
+        }), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 400
+
+@api_bp.route('/delay/metrics', methods=['GET'])
+def get_delay_metrics():
+    """
+    지연 계측 조회 API
+
+    전략별 요청 지연, 실제 대기, 초과 지연 히스토그램 반환
+    """
+    return jsonify(delay_simulator.get_metrics()), 200
+
+@api_bp.route('/clock-sync', methods=['GET'])
+def get_clock_sync():
+    """
+    클라이언트별 시계 오프셋 추정 결과와 보정된 업링크/다운링크 지연 조회 API
+    """
+    return jsonify(clock_sync.get_stats(int(time.time() * 1_000_000_000))), 200
+
+@api_bp.route('/clock-sync/reset', methods=['POST'])
+def reset_clock_sync():
+    """
+    시계 오프셋 추정 상태 초기화 API
+    """
+    clock_sync.reset()
+    return jsonify({"message": "시계 오프셋 추정 상태가 초기화되었습니다."}), 200
+
+@api_bp.route('/delay/in-flight', methods=['GET'])
+def get_in_flight_delays():
+    """
+    진행 중인 지연 조회 API
+
+    전략 변경 시 정책, 현재 대기 중인 요청 수, 단축된 지연 누적 수 반환
+    """
+    return jsonify(delay_simulator.get_in_flight_stats()), 200
+
+@api_bp.route('/delay/in-flight', methods=['POST'])
+def set_in_flight_policy():
+    """
+    전략 변경 시 진행 중인 지연 처리 정책 설정 API (keep, cancel, recompute)
+    """
+    try:
+        data = request.json or {}
+        delay_simulator.set_in_flight_policy(data.get('policy'))
+        return jsonify({
+            "message": f"진행 중 지연 정책이 {data.get('policy')}(으)로 설정되었습니다.",
+            "in_flight": delay_simulator.get_in_flight_stats()
+        }), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 400
+
+@api_bp.route('/delay/clock', methods=['GET'])
+def get_delay_clock():
+    """
+    지연 시뮬레이션 시계 조회 API
+    """
+    return jsonify(delay_simulator.get_clock_config()), 200
+
+@api_bp.route('/delay/clock', methods=['POST'])
+def set_delay_clock():
+    """
+    지연 시뮬레이션 시계 설정 API
+
+    scale이 1이면 실제 시계, 그 외에는 배속 시계를 사용
+    """
+    try:
+        data = request.json or {}
+        scale = float(data.get('scale', 1.0))
+        delay_simulator.set_clock(RealClock() if scale == 1.0 else ScaledClock(scale))
+        return jsonify({
+            "message": f"지연 시뮬레이션 시계가 {scale}배속으로 설정되었습니다.",
+            "clock": delay_simulator.get_clock_config(),
+            "config": delay_simulator.get_config()
+        }), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 400
+
 # 지연 시나리오별 엔드포인트
 
 @api_bp.route('/delay/fixed/<float:delay_seconds>', methods=['POST'])
@@ -639,10 +983,10 @@ def set_progressive_increase_delay():
     try:
         data = request.json or {}
         delay_simulator.set_progressive_increase_delay(
-            initial_delay=data.get('initial_delay', 0.0),
-            increment=data.get('increment', 0.5),
-            interval=data.get('interval', 5.0),
-            max_steps=data.get('max_steps', 10)
+            initial_delay=data.get('initial_delay'),
+            increment=data.get('increment'),
+            interval=data.get('interval'),
+            max_steps=data.get('max_steps')
         )
         return jsonify({
             "message": "점진적 증가 지연이 설정되었습니다.",
@@ -659,10 +1003,10 @@ def set_progressive_decrease_delay():
     try:
         data = request.json or {}
         delay_simulator.set_progressive_decrease_delay(
-            initial_delay=data.get('initial_delay', 5.0),
-            decrement=data.get('decrement', 0.5),
-            interval=data.get('interval', 5.0),
-            min_delay=data.get('min_delay', 0.0)
+            initial_delay=data.get('initial_delay'),
+            decrement=data.get('decrement'),
+            interval=data.get('interval'),
+            min_delay=data.get('min_delay')
         )
         return jsonify({
             "message": "점진적 감소 지연이 설정되었습니다.",
@@ -679,12 +1023,12 @@ def set_step_delay():
     try:
         data = request.json or {}
         delay_simulator.set_step_delay(
-            normal_delay=data.get('normal_delay', 0.0),
-            high_delay=data.get('high_delay', 5.0),
-            normal_duration=data.get('normal_duration', 5.0),
-            high_duration=data.get('high_duration', 5.0),
-            step_increment=data.get('step_increment', 5.0),
-            total_duration=data.get('total_duration', 300.0)
+            normal_delay=data.get('normal_delay'),
+            high_delay=data.get('high_delay'),
+            normal_duration=data.get('normal_duration'),
+            high_duration=data.get('high_duration'),
+            step_increment=data.get('step_increment'),
+            total_duration=data.get('total_duration')
         )
         return jsonify({
             "message": "계단식 지연이 설정되었습니다.",
@@ -718,10 +1062,10 @@ def set_random_delay():
     try:
         data = request.json or {}
         delay_simulator.set_random_delay(
-            min_delay=data.get('min_delay', 0.5),
-            max_delay=data.get('max_delay', 5.0),
-            change_interval=data.get('change_interval', 5.0),
-            total_duration=data.get('total_duration', 300.0)
+            min_delay=data.get('min_delay'),
+            max_delay=data.get('max_delay'),
+            change_interval=data.get('change_interval'),
+            total_duration=data.get('total_duration')
         )
         return jsonify({
             "message": "랜덤 지연이 설정되었습니다.",
@@ -730,6 +1074,115 @@ def set_random_delay():
     except Exception as e:
         return jsonify({"error": str(e)}), 400
 
+@api_bp.route('/delay/empirical', methods=['POST'])
+def set_empirical_delay():
+    """
+    경험적 분포 지연 설정 API
+    
+    JSON 본문(samples 또는 bin_edges/counts) 또는 multipart 파일(file)로 분포를 받음
+    업로드 파일은 지연 데이터 디렉터리의 고정 이름 파일(형식별 하나)에 덮어써 모든 워커가 같은 경로로 읽도록 함
+    (업로드마다 파일이 쌓이지 않으며, 읽을 수 없는 파일은 기존 파일을 덮어쓰기 전에 거부)
+    """
+    try:
+        upload = request.files.get('file')
+        if upload is not None:
+            extension = os.path.splitext(upload.filename or '')[1].lower()
+            if extension not in ('.npy', '.json'):
+                extension = '.txt'
+            os.makedirs(delay_simulator.data_dir, exist_ok=True)
+            samples_path = os.path.join(delay_simulator.data_dir, f'empirical_upload{extension}')
+            fd, upload_path = tempfile.mkstemp(prefix='.empirical_upload_', suffix=extension, dir=delay_simulator.data_dir)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    upload.save(f)
+                EmpiricalDelayStrategy.from_file(upload_path)
+                os.replace(upload_path, samples_path)
+            finally:
+                if os.path.exists(upload_path):
+                    os.remove(upload_path)
+            params = {
+                'samples_path': samples_path,
+                'block_size': int(request.form.get('block_size', 4096)),
+                'seed': int(request.form['seed']) if request.form.get('seed') else None
+            }
+        else:
+            data = request.json or {}
+            params = {
+                'samples': data.get('samples'),
+                'bin_edges': data.get('bin_edges'),
+                'counts': data.get('counts'),
+                'block_size': data.get('block_size', 4096),
+                'seed': data.get('seed')
+            }
+        
+        delay_simulator.set_strategy('EmpiricalDelayStrategy', params)
+        return jsonify({
+            "message": "경험적 분포 지연이 설정되었습니다.",
+            "config": delay_simulator.get_config()
+        }), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 400
+
+@api_bp.route('/delay/timeline', methods=['POST'])
+def set_timeline_delay():
+    """
+    시나리오 타임라인 설정 API
+    
+    구간(segments)을 순서대로 이어 붙이고 중첩 전략(overlays)을 더한 타임라인을 설치
+    """
+    try:
+        data = request.json or {}
+        delay_simulator.set_strategy(
+            'TimelineDelayStrategy',
+            {
+                'segments': data.get('segments'),
+                'overlays': data.get('overlays'),
+                'loop': bool(data.get('loop', False))
+            },
+            in_flight_policy=data.get('in_flight_policy')
+        )
+        return jsonify({
+            "message": "시나리오 타임라인이 설정되었습니다.",
+            "config": delay_simulator.get_config()
+        }), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 400
+
+@api_bp.route('/delay/runner', methods=['GET'])
+def get_scenario_runner():
+    """
+    시나리오 자동 실행 상태 및 단계별 요약 조회 API
+    """
+    return jsonify(scenario_runner.get_status()), 200
+
+@api_bp.route('/delay/runner', methods=['POST'])
+def start_scenario_runner():
+    """
+    시나리오 자동 실행 시작 API
+    
+    (시나리오, 매개변수, 지속 시간) 단계 목록을 받아 정해진 시각마다 전략을 전환
+    """
+    try:
+        data = request.json or {}
+        scenario_runner.start(data.get('phases') or [], restore=bool(data.get('restore', True)))
+        return jsonify({
+            "message": "시나리오 자동 실행이 시작되었습니다.",
+            "status": scenario_runner.get_status()
+        }), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 400
+
+@api_bp.route('/delay/runner/stop', methods=['POST'])
+def stop_scenario_runner():
+    """
+    시나리오 자동 실행 중단 API
+    """
+    scenario_runner.stop()
+    return jsonify({
+        "message": "시나리오 자동 실행이 중단되었습니다.",
+        "status": scenario_runner.get_status()
+    }), 200
+
 # 시나리오별 간편 엔드포인트 (기본 설정 사용)
 
 @api_bp.route('/delay/scenario/1', methods=['POST'])
@@ -738,9 +1191,10 @@ def set_scenario_1():
     시나리오 1: 고정 지연 (0.2, 0.5, 1, 3, 5, 10초)
     """
     try:
-        delay_seconds = float(request.args.get('delay', 1.0))
+        default_delay = STRATEGY_DEFAULTS['FixedDelayStrategy']['delay_seconds']
+        delay_seconds = float(request.args.get('delay', default_delay))
         if delay_seconds not in [0.2, 0.5, 1.0, 3.0, 5.0, 10.0]:
-            delay_seconds = 1.0
+            delay_seconds = default_delay
         
         delay_simulator.set_fixed_delay(delay_seconds)
         return jsonify({
@@ -756,12 +1210,7 @@ def set_scenario_2():
     시나리오 2: 점진적 증가 지연 (초기 5초부터 0.5초씩 5초 간격으로 10단계 증가)
     """
     try:
-        delay_simulator.set_progressive_increase_delay(
-            initial_delay=0.0,
-            increment=0.5,
-            interval=5.0,
-            max_steps=10
-        )
+        delay_simulator.set_progressive_increase_delay()
         return jsonify({
             "message": "시나리오 2: 점진적 증가 지연이 설정되었습니다.",
             "config": delay_simulator.get_config()
@@ -775,12 +1224,7 @@ def set_scenario_3():
     시나리오 3: 점진적 감소 지연 (5000→0ms로 500ms씩 10단계 감소)
     """
     try:
-        delay_simulator.set_progressive_decrease_delay(
-            initial_delay=5.0,
-            decrement=0.5,
-            interval=5.0,
-            min_delay=0.0
-        )
+        delay_simulator.set_progressive_decrease_delay()
         return jsonify({
             "message": "시나리오 3: 점진적 감소 지연이 설정되었습니다.",
             "config": delay_simulator.get_config()
@@ -794,14 +1238,7 @@ def set_scenario_4():
     시나리오 4: 계단식 지연 (5초 정상 5초 지연 5초 정상 10초 지연 5초 정상 15초 지연 5분간)
     """
     try:
-        delay_simulator.set_step_delay(
-            normal_delay=0.0,
-            high_delay=5.0,
-            normal_duration=5.0,
-            high_duration=5.0,
-            step_increment=5.0,
-            total_duration=300.0
-        )
+        delay_simulator.set_step_delay()
         return jsonify({
             "message": "시나리오 4: 계단식 지연이 설정되었습니다.",
             "config": delay_simulator.get_config()
@@ -815,9 +1252,10 @@ def set_scenario_5():
     시나리오 5: 무응답 (10, 30, 60초 무응답)
     """
     try:
-        duration = int(request.args.get('duration', 10))
+        default_duration = int(STRATEGY_DEFAULTS['NoResponseDelayStrategy']['no_response_duration'])
+        duration = int(request.args.get('duration', default_duration))
         if duration not in [10, 30, 60]:
-            duration = 10
+            duration = default_duration
         
         delay_simulator.set_no_response(duration)
         return jsonify({
@@ -833,12 +1271,7 @@ def set_scenario_6():
     시나리오 6: 랜덤 지연 (5분간 0.5에서 5초를 랜덤하게 지연)
     """
     try:
-        delay_simulator.set_random_delay(
-            min_delay=0.5,
-            max_delay=5.0,
-            change_interval=5.0,
-            total_duration=300.0
-        )
+        delay_simulator.set_random_delay()
         return jsonify({
             "message": "시나리오 6: 랜덤 지연이 설정되었습니다.",
             "config": delay_simulator.get_config()
@@ -891,6 +1324,16 @@ def get_recent_requests():
             time_diff_ns = time_depart - time_arrive
             time_diff_s = time_diff_ns / 1_000_000_000
             
+            # 지연 계측 정보 추출 (요청 지연 / 실제 대기 / 초과 지연)
+            delay_record = req.get('delay_record')
+            delay_record_html = ""
+            if delay_record:
+                delay_record_html = (
+                    f"<p>요청 지연: {delay_record['requested_ms']:.3f}ms, "
+                    f"실제 대기: {delay_record['actual_ms']:.3f}ms, "
+                    f"초과: {delay_record['overshoot_ms']:.3f}ms</p>"
+                )
+            
             recent_requests_html += f"""
             <div class="request-item">
                 <h4>요청 {i+1} - {request_time_str}</h4>
@@ -911,6 +1354,7 @@ def get_recent_requests():
                         <h5>지연 정보</h5>
                         <p>전략: {strategy_name}</p>
                         <p>지연 시간: {time_diff_s:.6f}초</p>
+                        {delay_record_html}
                         <pre>{json.dumps(delay_params, indent=2, ensure_ascii=False)}</pre>
                     </div>
                 </div>
@@ -1129,6 +1573,25 @@ namespace DigitalTwinLoc
         public float[] position_m = new float[3];
         public float[] quaternion = new float[4] { 0, 0, 0, 1 };
         public ZoneBlock zone = new ZoneBlock();
+        public string frame = "ship";
+    }
+
+    // 이전 요청/응답의 네 시각(나노초) 에코 (값이 0이면 서버는 단방향 표본 사용)
+    [Serializable]
+    public class ClockSyncBlock
+    {
+        public long t0_ns; // 이전 FramePacket의 timestamp_ns
+        public long t1_ns; // 이전 응답의 time_stamps[0]
+        public long t2_ns; // 이전 응답의 time_stamps[1]
+        public long t3_ns; // 이전 응답을 받은 시각
+
+        public void Set(FramePacket sent, PosePacket response, long receivedNs)
+        {
+            t0_ns = sent.timestamp_ns;
+            t1_ns = response.time_stamps[0];
+            t2_ns = response.time_stamps[1];
+            t3_ns = receivedNs;
+        }
     }
 
     [Serializable]
@@ -1139,6 +1602,7 @@ namespace DigitalTwinLoc
         public CameraBlock camera = new CameraBlock();
         public PoseBlock pose = new PoseBlock();
         public string image = "";
+        public ClockSyncBlock clock_sync = new ClockSyncBlock(); // 선택: 이전 요청/응답의 시각 에코
 
         // 이미지 데이터를 Base64 문자열로 변환
         public void SetImageFromTexture(Texture2D texture)
@@ -1970,6 +2434,54 @@ public class ImageSender : MonoBehaviour
     """
     return html
 
+def _render_delay_metrics_html(metrics):
+    """
+    전략별 지연 계측 결과를 HTML 표로 변환
+    
+    Args:
+        metrics (dict): DelaySimulator.get_metrics() 결과
+        
+    Returns:
+        str: HTML 문자열
+    """
+    if not metrics:
+        return "<p>아직 계측된 지연이 없습니다.</p>"
+    
+    rows = ""
+    for name, histograms in metrics.items():
+        requested = histograms['requested']
+        actual = histograms['actual']
+        overshoot = histograms['overshoot']
+        undershoot = histograms['undershoot']
+        rows += f"""
+            <tr>
+                <td>{name}</td>
+                <td>{requested['count']}</td>
+                <td>{requested['mean_ms']:.3f}</td>
+                <td>{actual['mean_ms']:.3f}</td>
+                <td>{overshoot['mean_ms']:.3f}</td>
+                <td>{overshoot['max_ms'] or 0.0:.3f}</td>
+                <td>{undershoot['count']}</td>
+                <td>{undershoot['max_ms'] or 0.0:.3f}</td>
+            </tr>
+        """
+    
+    return f"""
+        <table class="metrics-table">
+            <tr>
+                <th>전략</th>
+                <th>요청 수</th>
+                <th>평균 요청 지연(ms)</th>
+                <th>평균 실제 대기(ms)</th>
+                <th>평균 초과(ms)</th>
+                <th>최대 초과(ms)</th>
+                <th>미달 수</th>
+                <th>최대 미달(ms)</th>
+            </tr>
+            {rows}
+        </table>
+    """
+
 @root_bp.route('/monitor')
 def monitor():
     """
@@ -2013,6 +2525,16 @@ def monitor():
             time_diff_ns = time_depart - time_arrive
             time_diff_s = time_diff_ns / 1_000_000_000
             
+            # 지연 계측 정보 추출 (요청 지연 / 실제 대기 / 초과 지연)
+            delay_record = req.get('delay_record')
+            delay_record_html = ""
+            if delay_record:
+                delay_record_html = (
+                    f"<p>요청 지연: {delay_record['requested_ms']:.3f}ms, "
+                    f"실제 대기: {delay_record['actual_ms']:.3f}ms, "
+                    f"초과: {delay_record['overshoot_ms']:.3f}ms</p>"
+                )
+            
             recent_requests_html += f"""
             <div class="request-item">
                 <h4>요청 {i+1} - {request_time_str}</h4>
@@ -2033,6 +2555,7 @@ def monitor():
                         <h5>지연 정보</h5>
                         <p>전략: {strategy_name}</p>
                         <p>지연 시간: {time_diff_s:.6f}초</p>
+                        {delay_record_html}
                         <pre>{json.dumps(delay_params, indent=2, ensure_ascii=False)}</pre>
                     </div>
                 </div>
@@ -2044,6 +2567,9 @@ def monitor():
     # 현재 지연 전략 정보 가져오기
     strategy_name = delay_simulator.get_config()['strategy']
     
+    # 전략별 지연 계측 요약
+    delay_metrics_html = _render_delay_metrics_html(delay_simulator.get_metrics())
+    
     html = f"""
     <!DOCTYPE html>
     <html>
@@ -2113,6 +2639,20 @@ def monitor():
                 margin-bottom: 20px;
                 font-weight: bold;
             }}
+            .metrics-table {{
+                width: 100%;
+                border-collapse: collapse;
+                background-color: white;
+                margin-bottom: 20px;
+            }}
+            .metrics-table th, .metrics-table td {{
+                border: 1px solid #ddd;
+                padding: 8px;
+                text-align: right;
+            }}
+            .metrics-table th:first-child, .metrics-table td:first-child {{
+                text-align: left;
+            }}
             .back-link {{
                 display: inline-block;
                 margin-top: 20px;
@@ -2134,6 +2674,10 @@ def monitor():
             현재 지연 전략: {strategy_name}
         </div>
         
+        <h2>전략별 지연 정확도</h2>
+        {delay_metrics_html}
+        
+        <h2>최근 요청</h2>
         <div id="recent-requests">
             {recent_requests_html}
         </div>
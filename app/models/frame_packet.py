@@ -196,7 +196,7 @@ class PoseBlock:
     위치 및 자세 정보를 포함
     """
     
-    def __init__(self, position_m=None, quaternion=None, zone=None):
+    def __init__(self, position_m=None, quaternion=None, zone=None, frame=None):
         """
         PoseBlock 객체 초기화
         
@@ -204,10 +204,12 @@ class PoseBlock:
             position_m (list): 위치 좌표 (미터 단위)
             quaternion (list): 쿼터니언 (회전)
             zone (ZoneBlock): 영역 정보
+            frame (str): 위치와 회전의 좌표계 (기본값: "ship")
         """
         self.position_m = position_m or [0.0, 0.0, 0.0]
         self.quaternion = quaternion or [0.0, 0.0, 0.0, 1.0]
         self.zone = zone or ZoneBlock()
+        self.frame = frame or "ship"
     
     @classmethod
     def from_dict(cls, data):
@@ -226,7 +228,8 @@ class PoseBlock:
         return cls(
             position_m=data.get('position_m', [0.0, 0.0, 0.0]),
             quaternion=data.get('quaternion', [0.0, 0.0, 0.0, 1.0]),
-            zone=ZoneBlock.from_dict(data.get('zone', {}))
+            zone=ZoneBlock.from_dict(data.get('zone', {})),
+            frame=data.get('frame')
         )
     
     def to_dict(self):
@@ -239,7 +242,66 @@ class PoseBlock:
         return {
             'position_m': self.position_m,
             'quaternion': self.quaternion,
-            'zone': self.zone.to_dict()
+            'zone': self.zone.to_dict(),
+            'frame': self.frame
+        }
+
+
+class ClockSyncBlock:
+    """
+    ClockSyncBlock 클래스
+    
+    이전 요청/응답 한 번의 네 시각(나노초)을 서버로 되돌려 보내 시계 오프셋 왕복 표본으로 사용하게 함
+    """
+    
+    def __init__(self, t0_ns=0, t1_ns=0, t2_ns=0, t3_ns=0):
+        """
+        ClockSyncBlock 객체 초기화
+        
+        Args:
+            t0_ns (long): 이전 FramePacket의 timestamp_ns (클라이언트 전송 시각)
+            t1_ns (long): 이전 응답의 time_stamps[0] (서버 도착 시각)
+            t2_ns (long): 이전 응답의 time_stamps[1] (서버 출발 시각)
+            t3_ns (long): 이전 응답을 받은 시각 (클라이언트 시계)
+        """
+        self.t0_ns = t0_ns
+        self.t1_ns = t1_ns
+        self.t2_ns = t2_ns
+        self.t3_ns = t3_ns
+    
+    @classmethod
+    def from_dict(cls, data):
+        """
+        딕셔너리에서 ClockSyncBlock 객체 생성
+        
+        Args:
+            data (dict): ClockSyncBlock 데이터를 포함한 딕셔너리
+            
+        Returns:
+            ClockSyncBlock: 생성된 ClockSyncBlock 객체 (데이터가 없으면 None)
+        """
+        if not data:
+            return None
+        
+        return cls(
+            t0_ns=data.get('t0_ns', 0),
+            t1_ns=data.get('t1_ns', 0),
+            t2_ns=data.get('t2_ns', 0),
+            t3_ns=data.get('t3_ns', 0)
+        )
+    
+    def to_dict(self):
+        """
+        ClockSyncBlock 객체를 딕셔너리로 변환
+        
+        Returns:
+            dict: ClockSyncBlock 데이터를 포함한 딕셔너리
+        """
+        return {
+            't0_ns': self.t0_ns,
+            't1_ns': self.t1_ns,
+            't2_ns': self.t2_ns,
+            't3_ns': self.t3_ns
         }
 
 
@@ -250,7 +312,7 @@ class FramePacket:
     유니티 앱에서 서버로 전송되는 이미지 데이터를 표현
     """
     
-    def __init__(self, ID=None, timestamp_ns=0, camera=None, pose=None, image=""):
+    def __init__(self, ID=None, timestamp_ns=0, camera=None, pose=None, image="", clock_sync=None):
         """
         FramePacket 객체 초기화
         
@@ -260,12 +322,14 @@ class FramePacket:
             camera (CameraBlock): 카메라 정보
             pose (PoseBlock): 위치 및 자세 정보
             image (str): Base64 또는 Hex 인코딩된 이미지 데이터
+            clock_sync (ClockSyncBlock, optional): 이전 요청/응답의 시각 에코 (없으면 단방향 표본 사용)
         """
         self.ID = ID or IdBlock()
         self.timestamp_ns = timestamp_ns
         self.camera = camera or CameraBlock()
         self.pose = pose or PoseBlock()
         self.image = image
+        self.clock_sync = clock_sync
     
     @classmethod
     def from_dict(cls, data):
@@ -286,7 +350,8 @@ class FramePacket:
             timestamp_ns=data.get('timestamp_ns', 0),
             camera=CameraBlock.from_dict(data.get('camera', {})),
             pose=PoseBlock.from_dict(data.get('pose', {})),
-            image=data.get('image', "")
+            image=data.get('image', ""),
+            clock_sync=ClockSyncBlock.from_dict(data.get('clock_sync'))
         )
     
     def to_dict(self):
@@ -296,13 +361,16 @@ class FramePacket:
         Returns:
             dict: FramePacket 데이터를 포함한 딕셔너리
         """
-        return {
+        data = {
             'ID': self.ID.to_dict(),
             'timestamp_ns': self.timestamp_ns,
             'camera': self.camera.to_dict(),
             'pose': self.pose.to_dict(),
             'image': self.image
         }
+        if self.clock_sync is not None:
+            data['clock_sync'] = self.clock_sync.to_dict()
+        return data
     
     def get_image_bytes(self):
         """
@@ -0,0 +1,164 @@
+"""
+지연 시뮬레이션용 시계
+
+지연 전략과 지연 시뮬레이터가 공유하는 시간 원천을 정의
+실제 시간, 수동 테스트 시계, 배속 시계를 지원
+"""
+
+import time
+import threading
+from abc import ABC, abstractmethod
+
+from app.services.delay_timing import DEFAULT_SPIN_THRESHOLD_NS, sleep_until
+
+
+class Clock(ABC):
+    """
+    시계 추상 클래스
+
+    모든 시각은 단조 증가하는 나노초 정수로 표현
+    """
+
+    @abstractmethod
+    def now_ns(self):
+        """
+        현재 시각(나노초) 반환
+
+        Returns:
+            int: 현재 시각(나노초)
+        """
+        pass
+
+    def now(self):
+        """
+        현재 시각(초) 반환
+
+        Returns:
+            float: 현재 시각(초)
+        """
+        return self.now_ns() / 1_000_000_000
+
+    @abstractmethod
+    def sleep_until(self, deadline_ns, precise=False, spin_threshold_ns=DEFAULT_SPIN_THRESHOLD_NS, event=None):
+        """
+        지정된 시각까지 대기
+
+        Args:
+            deadline_ns (int): 이 시계 기준 마감 시각(나노초)
+            precise (bool, optional): 정밀 대기 모드 사용 여부
+            spin_threshold_ns (int, optional): 스핀으로 전환하는 남은 시간(나노초)
+            event (threading.Event, optional): 대기를 중단시키는 이벤트
+
+        Returns:
+            bool: event로 인해 마감 전에 깨어난 경우 True
+        """
+        pass
+
+    def sleep(self, seconds):
+        """
+        지정된 시간(초) 동안 대기
+
+        Args:
+            seconds (float): 대기 시간(초)
+        """
+        self.sleep_until(self.now_ns() + int(seconds * 1_000_000_000))
+
+    def get_config(self):
+        """
+        시계 설정 반환
+
+        Returns:
+            dict: 시계 설정 정보
+        """
+        return {'clock': self.__class__.__name__}
+
+
+class RealClock(Clock):
+    """
+    실제 시계
+
+    time.monotonic_ns()를 그대로 사용
+    """
+
+    def now_ns(self):
+        return time.monotonic_ns()
+
+    def sleep_until(self, deadline_ns, precise=False, spin_threshold_ns=DEFAULT_SPIN_THRESHOLD_NS, event=None):
+        return sleep_until(deadline_ns, precise, spin_threshold_ns, event)
+
+
+class ManualClock(Clock):
+    """
+    수동 시계
+
+    테스트용 시계로, advance() 호출 시에만 시간이 흐르며
+    대기 요청은 실제로 잠들지 않고 즉시 시각을 마감 시각으로 이동
+    """
+
+    def __init__(self, start_ns=0):
+        """
+        수동 시계 초기화
+
+        Args:
+            start_ns (int, optional): 시작 시각(나노초)
+        """
+        self._lock = threading.Lock()
+        self._now_ns = start_ns
+
+    def now_ns(self):
+        return self._now_ns
+
+    def advance(self, seconds):
+        """
+        시각을 지정된 시간(초)만큼 진행
+
+        Args:
+            seconds (float): 진행할 시간(초)
+        """
+        with self._lock:
+            self._now_ns += int(seconds * 1_000_000_000)
+
+    def sleep_until(self, deadline_ns, precise=False, spin_threshold_ns=DEFAULT_SPIN_THRESHOLD_NS, event=None):
+        if event is not None and event.is_set():
+            return True
+        with self._lock:
+            if deadline_ns > self._now_ns:
+                self._now_ns = deadline_ns
+        return False
+
+
+class ScaledClock(Clock):
+    """
+    배속 시계
+
+    실제 시간보다 scale배 빠르게 흐르는 시계
+    시나리오 타임라인과 대기 시간이 모두 같은 비율로 단축됨
+    """
+
+    def __init__(self, scale=60.0):
+        """
+        배속 시계 초기화
+
+        Args:
+            scale (float, optional): 배속 (실제 1초당 흐르는 시계 시간(초))
+
+        Raises:
+            ValueError: 배속이 0 이하인 경우
+        """
+        if scale <= 0:
+            raise ValueError(f"배속은 0보다 커야 합니다: {scale}")
+
+        self.scale = scale
+        self._origin_real_ns = time.monotonic_ns()
+
+    def now_ns(self):
+        return self._origin_real_ns + int((time.monotonic_ns() - self._origin_real_ns) * self.scale)
+
+    def sleep_until(self, deadline_ns, precise=False, spin_threshold_ns=DEFAULT_SPIN_THRESHOLD_NS, event=None):
+        real_deadline_ns = self._origin_real_ns + int((deadline_ns - self._origin_real_ns) / self.scale)
+        return sleep_until(real_deadline_ns, precise, spin_threshold_ns, event)
+
+    def get_config(self):
+        config = super().get_config()
+        config['scale'] = self.scale
+        return config
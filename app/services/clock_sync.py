@@ -0,0 +1,250 @@
+"""
+클라이언트/서버 시계 오프셋 추정
+
+클라이언트(shipID, UserID)마다 NTP 방식으로 시계 오프셋(서버 시계 - 클라이언트 시계)과 드리프트를 추정하고,
+보정한 업링크/다운링크 지연을 히스토그램으로 집계
+
+- 왕복 표본: 클라이언트가 이전 응답의 네 시각(t0 전송, t1 서버 도착, t2 서버 출발, t3 클라이언트 수신)을
+  FramePacket의 clock_sync 필드로 보내면 오프셋 ((t1 - t0) + (t2 - t3)) / 2와 왕복 지연 (t3 - t0) - (t2 - t1)을 계산
+- 단방향 표본: 왕복 표본이 없으면 t1 - t0(오프셋 + 업링크 지연)을 사용하며, 최소 업링크 지연만큼 치우침
+
+최근 window개 표본 중 지연이 가장 작은 표본(최소 필터)의 오프셋을 사용하고,
+표본 window개마다 그 구간의 최소 필터 결과를 기록하여 시간에 따른 변화를 최소제곱으로 맞춰 드리프트를 추적
+"""
+
+import threading
+from collections import OrderedDict, deque
+
+from app.services.delay_metrics import LatencyHistogram
+
+
+class ClockOffsetEstimator:
+    """
+    클라이언트 하나의 시계 오프셋 추정기
+    """
+
+    def __init__(self, window=32, max_points=16):
+        """
+        시계 오프셋 추정기 초기화
+
+        Args:
+            window (int, optional): 최소 필터를 적용할 최근 표본 수
+            max_points (int, optional): 드리프트 추정에 사용할 구간별 최소 필터 결과 수
+        """
+        self.window = window
+        self.max_points = max_points
+        self._since_point = 0
+        # 표본은 (필터 기준 지연, 오프셋, 서버 시각) - 모두 나노초
+        self._round_trip = deque(maxlen=window)
+        self._one_way = deque(maxlen=window)
+        self._points = deque(maxlen=max_points)
+        self.samples = 0
+
+    @property
+    def mode(self):
+        """
+        현재 사용하는 표본 종류 ('round_trip', 'one_way', 표본이 없으면 None)
+        """
+        if self._round_trip:
+            return 'round_trip'
+        if self._one_way:
+            return 'one_way'
+        return None
+
+    def add_round_trip(self, t0, t1, t2, t3):
+        """
+        왕복 표본 추가
+
+        Args:
+            t0 (int): 클라이언트 전송 시각(클라이언트 시계, 나노초)
+            t1 (int): 서버 도착 시각(서버 시계, 나노초)
+            t2 (int): 서버 출발 시각(서버 시계, 나노초)
+            t3 (int): 클라이언트 수신 시각(클라이언트 시계, 나노초)
+
+        Returns:
+            bool: 표본 사용 여부 (왕복 지연이 음수인 잘못된 표본은 버림)
+        """
+        delay = (t3 - t0) - (t2 - t1)
+        if delay < 0 or t2 < t1:
+            return False
+        if not self._round_trip:
+            # 단방향 표본으로 추정한 드리프트 기준점은 치우침이 다르므로 버림
+            self._points.clear()
+            self._since_point = 0
+        self._round_trip.append((delay, ((t1 - t0) + (t2 - t3)) / 2, t1))
+        self.samples += 1
+        self._update_points(self._round_trip)
+        return True
+
+    def add_one_way(self, t0, t1):
+        """
+        단방향 표본 추가 (왕복 표본이 있으면 오프셋 추정에 사용하지 않음)
+
+        Args:
+            t0 (int): 클라이언트 전송 시각(클라이언트 시계, 나노초)
+            t1 (int): 서버 도착 시각(서버 시계, 나노초)
+        """
+        self._one_way.append((t1 - t0, t1 - t0, t1))
+        self.samples += 1
+        if not self._round_trip:
+            self._update_points(self._one_way)
+
+    def _update_points(self, samples):
+        """
+        표본 window개가 새로 모일 때마다 그 구간의 최소 필터 결과를 드리프트 추정점으로 추가
+
+        Args:
+            samples (deque): 사용 중인 표본
+        """
+        self._since_point += 1
+        if self._since_point < self.window:
+            return
+        self._since_point = 0
+        _, offset, server_ns = min(samples)
+        self._points.append((server_ns, offset))
+
+    def drift(self):
+        """
+        시계 드리프트 (서버 시계 1ns당 오프셋 변화)
+
+        Returns:
+            float: 드리프트 (추정점이 2개 미만이면 0)
+        """
+        count = len(self._points)
+        if count < 2:
+            return 0.0
+        mean_t = sum(t for t, _ in self._points) / count
+        mean_o = sum(o for _, o in self._points) / count
+        var = sum((t - mean_t) ** 2 for t, _ in self._points)
+        if var == 0:
+            return 0.0
+        return sum((t - mean_t) * (o - mean_o) for t, o in self._points) / var
+
+    def offset_ns(self, server_ns):
+        """
+        서버 시각 기준 시계 오프셋 (서버 시계 - 클라이언트 시계)
+
+        Args:
+            server_ns (int): 서버 시각(나노초)
+
+        Returns:
+            float: 오프셋(나노초, 표본이 없으면 None)
+        """
+        samples = self._round_trip or self._one_way
+        if not samples:
+            return None
+        _, offset, reference_ns = min(samples)
+        return offset + self.drift() * (server_ns - reference_ns)
+
+    def summary(self, server_ns):
+        """
+        추정 결과 요약
+
+        Args:
+            server_ns (int): 기준 서버 시각(나노초)
+
+        Returns:
+            dict: 표본 종류, 오프셋(ms), 드리프트(ppm), 최소 왕복 지연(ms), 표본 수
+        """
+        offset = self.offset_ns(server_ns)
+        return {
+            'mode': self.mode,
+            'offset_ms': offset / 1_000_000 if offset is not None else None,
+            'drift_ppm': self.drift() * 1_000_000,
+            'min_round_trip_ms': min(self._round_trip)[0] / 1_000_000 if self._round_trip else None,
+            'samples': self.samples
+        }
+
+
+class ClockSync:
+    """
+    클라이언트별 시계 오프셋 추정과 보정된 네트워크 지연 집계
+    """
+
+    def __init__(self, window=32, max_points=16, max_clients=1024):
+        """
+        클라이언트별 시계 동기화 초기화
+
+        Args:
+            window (int, optional): 최소 필터를 적용할 최근 표본 수
+            max_points (int, optional): 드리프트 추정에 사용할 구간별 최소 필터 결과 수
+            max_clients (int, optional): 상태를 보관할 최대 클라이언트 수 (초과 시 오래 보지 못한 클라이언트부터 제거)
+        """
+        self.window = window
+        self.max_points = max_points
+        self.max_clients = max_clients
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """
+        모든 추정 상태와 집계 초기화
+        """
+        with self._lock:
+            self._clients = OrderedDict()
+            self.uplink = LatencyHistogram()
+            self.downlink = LatencyHistogram()
+
+    def observe(self, image_data, arrival_ns):
+        """
+        요청 하나를 관찰하여 추정을 갱신하고 보정된 업링크 지연 계산
+
+        Args:
+            image_data (dict): 요청 JSON 데이터 (ID, timestamp_ns, 선택적으로 clock_sync)
+            arrival_ns (int): 서버 도착 시각(나노초)
+
+        Returns:
+            dict: 오프셋(ms), 업링크 지연(ms), 이전 응답의 다운링크 지연(ms) (클라이언트 타임스탬프가 없으면 None)
+        """
+        t0 = image_data.get('timestamp_ns')
+        if not t0 or not image_data.get('ID'):
+            return None
+        id_data = image_data['ID']
+        key = (id_data.get('shipID', 0), id_data.get('UserID', 0))
+
+        with self._lock:
+            estimator = self._clients.get(key)
+            if estimator is None:
+                estimator = self._clients[key] = ClockOffsetEstimator(self.window, self.max_points)
+                if len(self._clients) > self.max_clients:
+                    self._clients.popitem(last=False)
+            self._clients.move_to_end(key)
+
+            # 프레임당 표본 하나만 기록 (이전 응답의 왕복 에코가 유효하면 왕복 표본, 아니면 단방향 표본)
+            downlink_ms = None
+            echo = image_data.get('clock_sync') or {}
+            times = [echo.get(name) for name in ('t0_ns', 't1_ns', 't2_ns', 't3_ns')]
+            if all(times) and estimator.add_round_trip(*times):
+                downlink_ms = (times[3] + estimator.offset_ns(times[2]) - times[2]) / 1_000_000
+                self.downlink.add(max(downlink_ms, 0.0))
+            else:
+                estimator.add_one_way(t0, arrival_ns)
+            offset = estimator.offset_ns(arrival_ns)
+            uplink_ms = (arrival_ns - (t0 + offset)) / 1_000_000
+            self.uplink.add(max(uplink_ms, 0.0))
+            return {
+                'mode': estimator.mode,
+                'offset_ms': offset / 1_000_000,
+                'uplink_ms': uplink_ms,
+                'downlink_ms': downlink_ms
+            }
+
+    def get_stats(self, server_ns):
+        """
+        클라이언트별 추정 결과와 보정된 네트워크 지연 히스토그램 반환
+
+        Args:
+            server_ns (int): 기준 서버 시각(나노초)
+
+        Returns:
+            dict: {'clients': {"shipID:UserID": 요약}, 'uplink': 히스토그램, 'downlink': 히스토그램}
+        """
+        with self._lock:
+            return {
+                'clients': {
+                    f"{ship_id}:{user_id}": estimator.summary(server_ns)
+                    for (ship_id, user_id), estimator in self._clients.items()
+                },
+                'uplink': self.uplink.to_dict(),
+                'downlink': self.downlink.to_dict()
+            }
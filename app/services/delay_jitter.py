@@ -0,0 +1,167 @@
+"""
+지연 지터 생성
+
+로그정규, 파레토, 감마 분포의 꼬리가 긴 지터를 NumPy 블록 단위로 미리 생성하고,
+임의의 지연 전략 위에 더하는 래퍼 전략을 제공
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from app.services.delay_strategies import DelayStrategy
+from app.services.clock import RealClock
+
+JITTER_DISTRIBUTIONS = ('lognormal', 'pareto', 'gamma')
+
+# 다음 지터 블록을 미리 생성하는 공용 백그라운드 스레드
+_REFILL_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix='jitter-refill')
+
+
+class JitterBuffer:
+    """
+    지터 표본 버퍼
+
+    현재 블록을 소비하는 동안 다음 블록을 백그라운드에서 생성
+    블록은 하나의 난수 생성기에서 순서대로 만들어지므로 같은 시드는 항상 같은 지터 순서를 만듦
+    """
+
+    def __init__(self, distribution='lognormal', scale=0.01, sigma=1.0, shape=2.0, max_jitter=None,
+                 block_size=4096, seed=None):
+        """
+        지터 표본 버퍼 초기화
+
+        Args:
+            distribution (str, optional): 분포 ('lognormal', 'pareto', 'gamma')
+            scale (float, optional): 지터 크기(초) (로그정규는 중앙값, 파레토/감마는 척도)
+            sigma (float, optional): 로그정규 분포의 로그 표준편차
+            shape (float, optional): 파레토/감마 분포의 형상 모수
+            max_jitter (float, optional): 지터 상한(초)
+            block_size (int, optional): 한 번에 생성할 표본 수
+            seed (int, optional): 난수 시드
+
+        Raises:
+            ValueError: 유효하지 않은 분포 또는 매개변수
+        """
+        if distribution not in JITTER_DISTRIBUTIONS:
+            raise ValueError(f"유효하지 않은 지터 분포: {distribution}")
+        if scale < 0 or sigma <= 0 or shape <= 0 or block_size <= 0:
+            raise ValueError("지터 매개변수는 양수여야 합니다.")
+
+        self.distribution = distribution
+        self.scale = scale
+        self.sigma = sigma
+        self.shape = shape
+        self.max_jitter = max_jitter
+        self.block_size = block_size
+        self.seed = seed
+
+        self._rng = np.random.default_rng(seed)
+        self._lock = threading.Lock()
+        self._block = self._generate()
+        self._position = 0
+        self._pending = _REFILL_EXECUTOR.submit(self._generate)
+
+    def _generate(self):
+        """
+        지터 블록 생성
+
+        Returns:
+            list: 지터 표본(초)
+        """
+        size = self.block_size
+        if self.distribution == 'lognormal':
+            values = self.scale * self._rng.lognormal(0.0, self.sigma, size)
+        elif self.distribution == 'pareto':
+            values = self.scale * self._rng.pareto(self.shape, size)
+        else:
+            values = self._rng.gamma(self.shape, self.scale, size)
+
+        if self.max_jitter is not None:
+            values = np.minimum(values, self.max_jitter)
+        return values.tolist()
+
+    def next(self):
+        """
+        다음 지터 표본 반환
+
+        Returns:
+            float: 지터(초)
+        """
+        with self._lock:
+            if self._position >= len(self._block):
+                # 미리 생성된 블록으로 교체하고 그다음 블록 생성을 요청
+                self._block = self._pending.result()
+                self._position = 0
+                self._pending = _REFILL_EXECUTOR.submit(self._generate)
+            value = self._block[self._position]
+            self._position += 1
+        return value
+
+    def get_config(self):
+        """
+        지터 설정 반환
+
+        Returns:
+            dict: 지터 매개변수
+        """
+        return {
+            'distribution': self.distribution,
+            'scale': self.scale,
+            'sigma': self.sigma,
+            'shape': self.shape,
+            'max_jitter': self.max_jitter,
+            'block_size': self.block_size,
+            'seed': self.seed
+        }
+
+
+class JitteredDelayStrategy(DelayStrategy):
+    """
+    지터 중첩 전략
+
+    기반 전략의 지연 시간에 요청마다 지터 버퍼의 표본을 더함
+    """
+
+    def __init__(self, base, jitter, clock=None):
+        """
+        지터 중첩 전략 초기화
+
+        Args:
+            base (DelayStrategy): 기반 전략
+            jitter (JitterBuffer): 지터 표본 버퍼
+            clock (Clock, optional): 시간 원천 (기본값: 실제 시계)
+        """
+        self.base = base
+        self.jitter = jitter
+        self.clock = clock or RealClock()
+        self.current_jitter = 0.0
+
+    def get_delay(self):
+        return self.base.get_delay() + self.current_jitter
+
+    def peek_delay(self):
+        return self.base.peek_delay() + self.current_jitter
+
+    def get_request_delay(self, request_info=None):
+        self.current_jitter = self.jitter.next()
+        return self.base.get_request_delay(request_info) + self.current_jitter
+
+    def update(self):
+        self.base.update()
+
+    def set_start_time(self, start_time):
+        self.base.set_start_time(start_time)
+
+    @property
+    def name(self):
+        # 설정 조회 결과와 같이 기반 전략 이름으로 계측
+        return self.base.name
+
+    def get_config(self):
+        config = self.base.get_config()
+        config['params'] = dict(config['params'])
+        config['params']['tail_jitter'] = self.jitter.get_config()
+        config['params']['current_jitter'] = self.current_jitter
+        return config
@@ -0,0 +1,144 @@
+"""
+지연 계측 모듈
+
+요청별로 선택된 지연 시간과 실제 대기 시간을 기록하고 전략별 히스토그램으로 집계
+(스케줄러 오차의 초과/미달 분포는 delay_timing.DelayErrorStats에서 집계)
+"""
+
+import bisect
+import threading
+
+# 히스토그램 버킷 상한(밀리초), 마지막 버킷은 상한 없음
+DEFAULT_BUCKET_BOUNDS_MS = [
+    0.1, 0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500,
+    1000, 2000, 5000, 10000, 30000, 60000
+]
+
+
+class LatencyHistogram:
+    """
+    지연 히스토그램
+
+    고정 버킷 경계를 사용하여 값을 O(log B)로 누적
+    """
+
+    def __init__(self, bucket_bounds_ms=None):
+        """
+        지연 히스토그램 초기화
+
+        Args:
+            bucket_bounds_ms (list, optional): 버킷 상한 목록(밀리초, 오름차순)
+        """
+        self.bucket_bounds_ms = list(bucket_bounds_ms or DEFAULT_BUCKET_BOUNDS_MS)
+        self.counts = [0] * (len(self.bucket_bounds_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = None
+        self.max_ms = None
+
+    def add(self, value_ms):
+        """
+        값 추가
+
+        Args:
+            value_ms (float): 추가할 값(밀리초)
+        """
+        self.counts[bisect.bisect_left(self.bucket_bounds_ms, value_ms)] += 1
+        self.count += 1
+        self.total_ms += value_ms
+        if self.min_ms is None or value_ms < self.min_ms:
+            self.min_ms = value_ms
+        if self.max_ms is None or value_ms > self.max_ms:
+            self.max_ms = value_ms
+
+    def to_dict(self):
+        """
+        히스토그램을 딕셔너리로 변환
+
+        Returns:
+            dict: 요약 통계와 버킷별 개수
+        """
+        buckets = []
+        for i, count in enumerate(self.counts):
+            le = self.bucket_bounds_ms[i] if i < len(self.bucket_bounds_ms) else None
+            buckets.append({'le_ms': le, 'count': count})
+
+        return {
+            'count': self.count,
+            'mean_ms': self.total_ms / self.count if self.count else 0.0,
+            'min_ms': self.min_ms,
+            'max_ms': self.max_ms,
+            'buckets': buckets
+        }
+
+
+class DelayMetrics:
+    """
+    지연 계측 집계기
+
+    전략 이름별로 요청 지연, 실제 대기 히스토그램을 유지
+    """
+
+    def __init__(self, bucket_bounds_ms=None):
+        """
+        지연 계측 집계기 초기화
+
+        Args:
+            bucket_bounds_ms (list, optional): 히스토그램 버킷 상한 목록(밀리초)
+        """
+        self.bucket_bounds_ms = bucket_bounds_ms
+        self._lock = threading.Lock()
+        self._by_strategy = {}
+
+    def record(self, strategy_name, requested_ns, actual_ns):
+        """
+        요청 한 건의 지연 기록
+
+        Args:
+            strategy_name (str): 지연을 선택한 전략 이름
+            requested_ns (int): 선택된 지연 시간(나노초)
+            actual_ns (int): 실제 대기 시간(나노초)
+
+        Returns:
+            dict: 기록된 요청 지연 정보 (overshoot_ms는 부호 있는 오차)
+        """
+        record = {
+            'strategy': strategy_name,
+            'requested_ms': requested_ns / 1_000_000,
+            'actual_ms': actual_ns / 1_000_000,
+            'overshoot_ms': (actual_ns - requested_ns) / 1_000_000
+        }
+
+        with self._lock:
+            histograms = self._by_strategy.get(strategy_name)
+            if histograms is None:
+                histograms = {
+                    'requested': LatencyHistogram(self.bucket_bounds_ms),
+                    'actual': LatencyHistogram(self.bucket_bounds_ms)
+                }
+                self._by_strategy[strategy_name] = histograms
+
+            histograms['requested'].add(record['requested_ms'])
+            histograms['actual'].add(record['actual_ms'])
+
+        return record
+
+    def reset(self):
+        """
+        집계 초기화
+        """
+        with self._lock:
+            self._by_strategy = {}
+
+    def summary(self):
+        """
+        전략별 집계 결과 반환
+
+        Returns:
+            dict: 전략 이름별 히스토그램 딕셔너리
+        """
+        with self._lock:
+            return {
+                name: {key: hist.to_dict() for key, hist in histograms.items()}
+                for name, histograms in self._by_strategy.items()
+            }
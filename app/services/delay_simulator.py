@@ -1,4 +1,6 @@
-import time
+import os
+import tempfile
+import threading
 from app.services.delay_strategies import (
     DelayStrategy,
     FixedDelayStrategy,
@@ -6,8 +8,86 @@ from app.services.delay_strategies import (
     ProgressiveDecreaseDelayStrategy,
     StepDelayStrategy,
     NoResponseDelayStrategy,
-    RandomDelayStrategy
+    RandomDelayStrategy,
+    TraceReplayDelayStrategy,
+    EmpiricalDelayStrategy,
+    BandwidthDelayStrategy,
+    QueueingDelayStrategy,
+    GilbertElliottDelayStrategy,
+    ReorderDelayStrategy,
+    TimelineDelayStrategy,
+    RequestDropped
 )
+from app.services.delay_jitter import JitterBuffer, JitteredDelayStrategy
+from app.services.delay_timing import DEFAULT_SPIN_THRESHOLD_NS, DelayErrorStats
+from app.services.clock import RealClock
+from app.services.delay_metrics import DelayMetrics
+
+# 전략 변경 시 진행 중인 지연 처리 정책
+IN_FLIGHT_POLICY_KEEP = 'keep'            # 원래 지연 시간 그대로 유지
+IN_FLIGHT_POLICY_CANCEL = 'cancel'        # 즉시 대기 종료
+IN_FLIGHT_POLICY_RECOMPUTE = 'recompute'  # 새 전략 기준으로 지연 재계산
+IN_FLIGHT_POLICIES = (IN_FLIGHT_POLICY_KEEP, IN_FLIGHT_POLICY_CANCEL, IN_FLIGHT_POLICY_RECOMPUTE)
+
+# 손실 요청이 응답 없이 붙잡아 둘 수 있는 최대 동시 스레드 수
+DEFAULT_MAX_HUNG_REQUESTS = 8
+
+# 전략 매개변수의 파일 경로(trace_path 등)를 허용하는 기본 데이터 디렉터리 (DELAY_DATA_DIR 환경 변수로 변경)
+DEFAULT_DATA_DIR = os.path.join(tempfile.gettempdir(), 'dtlt_delay_data')
+
+# 시나리오 전략의 기본 매개변수 (_create_strategy(), /api/delay/* 엔드포인트, 시나리오 실행기가 공유)
+STRATEGY_DEFAULTS = {
+    'FixedDelayStrategy': {'delay_seconds': 1.0},
+    'ProgressiveIncreaseDelayStrategy': {'initial_delay': 0.0, 'increment': 0.5, 'interval': 5.0, 'max_steps': 10},
+    'ProgressiveDecreaseDelayStrategy': {'initial_delay': 5.0, 'decrement': 0.5, 'interval': 5.0, 'min_delay': 0.0},
+    'StepDelayStrategy': {'normal_delay': 0.0, 'high_delay': 5.0, 'normal_duration': 5.0, 'high_duration': 5.0,
+                          'step_increment': 5.0, 'total_duration': 300.0},
+    'NoResponseDelayStrategy': {'no_response_duration': 10.0},
+    'RandomDelayStrategy': {'min_delay': 0.5, 'max_delay': 5.0, 'change_interval': 5.0, 'total_duration': 300.0}
+}
+
+def _given_params(**params):
+    """
+    값이 지정된(None이 아닌) 매개변수만 남김 (나머지는 _create_strategy()에서 STRATEGY_DEFAULTS 적용)
+    
+    Returns:
+        dict: 전략 매개변수
+    """
+    return {key: value for key, value in params.items() if value is not None}
+
+class InFlightDelay:
+    """
+    진행 중인 지연
+    
+    apply_delay()에서 대기 중인 요청 하나의 마감 시각과 깨우기 이벤트를 보관
+    """
+    
+    def __init__(self, start_ns, deadline_ns, request_info=None):
+        """
+        진행 중인 지연 초기화
+        
+        Args:
+            start_ns (int): 대기 시작 시각(나노초)
+            deadline_ns (int): 대기 마감 시각(나노초)
+            request_info (dict, optional): 지연을 적용 중인 요청 정보
+        """
+        self.start_ns = start_ns
+        self.deadline_ns = deadline_ns
+        self.request_info = request_info
+        self.wakeup = threading.Event()
+        self.cut_short = False
+    
+    def reschedule(self, deadline_ns):
+        """
+        마감 시각 변경 후 대기 중인 스레드를 깨움
+        
+        Args:
+            deadline_ns (int): 새 마감 시각(나노초)
+        """
+        if deadline_ns < self.deadline_ns:
+            self.cut_short = True
+        self.deadline_ns = deadline_ns
+        self.wakeup.set()
 
 class DelaySimulator:
     """
@@ -16,84 +96,537 @@ class DelaySimulator:
     다양한 지연 시나리오를 시뮬레이션하기 위한 클래스
     """
     
-    def __init__(self, strategy=None):
+    def __init__(self, strategy=None, precise=False, spin_threshold_ns=DEFAULT_SPIN_THRESHOLD_NS, clock=None,
+                 max_hung_requests=DEFAULT_MAX_HUNG_REQUESTS, data_dir=None):
         """
         지연 시뮬레이터 초기화
         
         Args:
             strategy (DelayStrategy, optional): 초기 지연 전략
+            precise (bool, optional): 정밀 대기 모드 사용 여부
+            spin_threshold_ns (int, optional): 정밀 대기 시 스핀으로 전환하는 남은 시간(나노초)
+            clock (Clock, optional): 시간 원천 (기본값: 실제 시계)
+            max_hung_requests (int, optional): 손실 요청이 동시에 붙잡아 둘 수 있는 최대 스레드 수
+            data_dir (str, optional): 전략이 읽는 파일을 둘 수 있는 디렉터리
+                (기본값: DELAY_DATA_DIR 환경 변수 또는 DEFAULT_DATA_DIR)
         """
-        self.strategy = strategy or FixedDelayStrategy(0.0)  # 기본값: 지연 없음
+        self.data_dir = os.path.realpath(data_dir or os.environ.get('DELAY_DATA_DIR') or DEFAULT_DATA_DIR)
+        self.clock = clock or RealClock()
+        self.strategy = strategy or FixedDelayStrategy(0.0, clock=self.clock)  # 기본값: 지연 없음
+        self.precise = precise
+        self.spin_threshold_ns = spin_threshold_ns
+        self.error_stats = DelayErrorStats()
+        self.metrics = DelayMetrics()
+        self.in_flight_policy = IN_FLIGHT_POLICY_KEEP
+        self.cut_short_count = 0
+        self._in_flight = set()
+        self._in_flight_lock = threading.Lock()
+        self.shared_state = None
+        self._shared_version = 0
+        self._strategy_spec = None  # set_strategy()에 전달된 (전략 이름, 매개변수)
+        self.max_hung_requests = max_hung_requests
+        self._hang_slots = threading.BoundedSemaphore(max_hung_requests)
+        self.hung_count = 0
+        self.dropped_count = 0
+        self.hang_capped_count = 0
     
-    def apply_delay(self):
+    def apply_delay(self, request_info=None):
         """
         현재 전략에 따라 지연 적용
+        
+        Args:
+            request_info (dict, optional): 요청 정보 ('payload_bytes', 'ID', 'timestamp_ns' 등)
+        
+        Returns:
+            dict: 선택된 지연 시간, 실제 대기 시간, 초과 지연 정보
+        
+        Raises:
+            RequestDropped: 전략이 요청을 손실 처리한 경우 (record 속성에 계측 정보 포함)
         """
+        # 다른 프로세스에서 변경된 공유 전략 반영
+        if self.shared_state is not None and self.shared_state.read_version() != self._shared_version:
+            self._sync_shared_state()
+        
+        strategy = self.strategy
+        
         # 전략 상태 업데이트
-        self.strategy.update()
+        strategy.update()
         
         # 지연 시간 계산
-        delay_seconds = self.strategy.get_delay()
+        try:
+            delay_seconds = strategy.get_request_delay(request_info)
+        except RequestDropped as dropped:
+            self._apply_drop(strategy, dropped, request_info)
+            raise
+        requested_ns = int(delay_seconds * 1_000_000_000) if delay_seconds > 0 else 0
+        
+        # 지연 적용 (단조 시계 기준 마감 시각까지 대기)
+        start_ns = self.clock.now_ns()
+        cut_short = False
+        if requested_ns > 0:
+            entry = InFlightDelay(start_ns, start_ns + requested_ns, request_info)
+            with self._in_flight_lock:
+                self._in_flight.add(entry)
+            try:
+                self._wait(entry)
+            finally:
+                with self._in_flight_lock:
+                    self._in_flight.discard(entry)
+            cut_short = entry.cut_short
+            if not cut_short:
+                requested_ns = entry.deadline_ns - start_ns
+        actual_ns = self.clock.now_ns() - start_ns
+        
+        strategy_name = strategy.name
+        if requested_ns > 0 and not cut_short:
+            self.error_stats.record(requested_ns, actual_ns, strategy_name)
+        record = self.metrics.record(strategy_name, requested_ns, actual_ns)
+        record['cut_short'] = cut_short
+        return record
+    
+    def _apply_drop(self, strategy, dropped, request_info=None):
+        """
+        손실된 요청 처리
+        
+        'hang' 방식은 응답 없이 hang_seconds 동안 대기하되, 동시에 붙잡힌 스레드 수가
+        max_hung_requests에 도달하면 대기 없이 즉시 끊어 워커 고갈을 방지
+        
+        Args:
+            strategy (DelayStrategy): 요청을 손실 처리한 전략
+            dropped (RequestDropped): 손실 예외 (record 속성을 채움)
+            request_info (dict, optional): 요청 정보
+        """
+        with self._in_flight_lock:
+            self.dropped_count += 1
+        
+        start_ns = self.clock.now_ns()
+        hang_ns = int(dropped.hang_seconds * 1_000_000_000) if dropped.mode == 'hang' else 0
+        hung = False
+        if hang_ns > 0:
+            if self._hang_slots.acquire(blocking=False):
+                hung = True
+                entry = InFlightDelay(start_ns, start_ns + hang_ns, request_info)
+                with self._in_flight_lock:
+                    self.hung_count += 1
+                    self._in_flight.add(entry)
+                try:
+                    self._wait(entry)
+                finally:
+                    with self._in_flight_lock:
+                        self.hung_count -= 1
+                        self._in_flight.discard(entry)
+                    self._hang_slots.release()
+            else:
+                with self._in_flight_lock:
+                    self.hang_capped_count += 1
+        actual_ns = self.clock.now_ns() - start_ns
+        
+        record = self.metrics.record(strategy.name, actual_ns if hung else 0, actual_ns)
+        record['cut_short'] = False
+        record['dropped'] = dropped.mode
+        record['hang_capped'] = hang_ns > 0 and not hung
+        dropped.record = record
+    
+    def _wait(self, entry):
+        """
+        진행 중인 지연의 마감 시각까지 대기
+        
+        대기 중 마감 시각이 변경되면 깨어나서 새 마감 시각 기준으로 다시 대기
+        
+        Args:
+            entry (InFlightDelay): 진행 중인 지연
+        """
+        while True:
+            interrupted = self.clock.sleep_until(
+                entry.deadline_ns, self.precise, self.spin_threshold_ns, entry.wakeup
+            )
+            if not interrupted:
+                return
+            entry.wakeup.clear()
+            if self.clock.now_ns() >= entry.deadline_ns:
+                return
+    
+    def _apply_in_flight_policy(self, strategy, policy):
+        """
+        전략 변경 시 진행 중인 지연에 정책 적용
+        
+        Args:
+            strategy (DelayStrategy): 새로 설정된 전략
+            policy (str): 진행 중인 지연 처리 정책
+        """
+        if policy == IN_FLIGHT_POLICY_KEEP:
+            return
+        
+        with self._in_flight_lock:
+            entries = list(self._in_flight)
+        if not entries:
+            return
+        
+        now_ns = self.clock.now_ns()
+        if policy == IN_FLIGHT_POLICY_RECOMPUTE:
+            # 요청 단위 상태(토큰, 상태 전이, 표본)를 소비하거나 요청을 손실시키지 않도록 peek_delay() 사용
+            strategy.update()
+            recomputed_ns = int(max(strategy.peek_delay(), 0.0) * 1_000_000_000)
         
-        # 지연 적용
-        if delay_seconds > 0:
-            time.sleep(delay_seconds)
+        cut_short = 0
+        for entry in entries:
+            if policy == IN_FLIGHT_POLICY_CANCEL:
+                deadline_ns = now_ns
+            else:
+                deadline_ns = max(entry.start_ns + recomputed_ns, now_ns)
+            if deadline_ns < entry.deadline_ns:
+                cut_short += 1
+            entry.reschedule(deadline_ns)
+        
+        with self._in_flight_lock:
+            self.cut_short_count += cut_short
+    
+    def set_in_flight_policy(self, policy):
+        """
+        전략 변경 시 진행 중인 지연 처리 정책 설정
+        
+        Args:
+            policy (str): 'keep', 'cancel', 'recompute' 중 하나
+        
+        Raises:
+            ValueError: 유효하지 않은 정책 이름
+        """
+        if policy not in IN_FLIGHT_POLICIES:
+            raise ValueError(f"유효하지 않은 진행 중 지연 정책: {policy}")
+        self.in_flight_policy = policy
+    
+    def get_in_flight_stats(self):
+        """
+        진행 중인 지연 통계 조회
+        
+        Returns:
+            dict: 정책, 진행 중인 지연 수, 단축된 지연 누적 수, 손실 요청 통계
+        """
+        with self._in_flight_lock:
+            return {
+                'policy': self.in_flight_policy,
+                'in_flight': len(self._in_flight),
+                'cut_short_count': self.cut_short_count,
+                'hung': self.hung_count,
+                'max_hung_requests': self.max_hung_requests,
+                'dropped_count': self.dropped_count,
+                'hang_capped_count': self.hang_capped_count
+            }
+    
+    def set_precise_mode(self, precise, spin_threshold_ns=None):
+        """
+        정밀 대기 모드 설정
+        
+        Args:
+            precise (bool): 정밀 대기 모드 사용 여부
+            spin_threshold_ns (int, optional): 스핀으로 전환하는 남은 시간(나노초)
+        """
+        self.precise = precise
+        if spin_threshold_ns is not None:
+            self.spin_threshold_ns = spin_threshold_ns
+        self.error_stats.reset()
     
-    def set_strategy(self, strategy_name, params=None):
+    def get_timing_stats(self):
+        """
+        지연 정확도 통계 조회
+        
+        Returns:
+            dict: 대기 모드와 초과 지연 분포
+        """
+        return {
+            'precise': self.precise,
+            'spin_threshold_ns': self.spin_threshold_ns,
+            'overshoot': self.error_stats.summary()
+        }
+    
+    def get_metrics(self):
+        """
+        전략별 지연 계측 히스토그램 조회
+        
+        초과/미달 히스토그램은 지연 오차 통계(get_timing_stats())와 같은 기록이며, 실제로 대기한 요청만 포함
+        
+        Returns:
+            dict: 전략 이름별 요청 지연/실제 대기/초과 지연/미달 지연(절대값) 히스토그램
+        """
+        summary = self.metrics.summary()
+        for name, histograms in summary.items():
+            histograms.update(self.error_stats.histograms(name))
+        return summary
+    
+    def set_strategy(self, strategy_name, params=None, in_flight_policy=None):
         """
         지연 전략 설정
         
         Args:
             strategy_name (str): 전략 이름
             params (dict, optional): 전략 매개변수
+            in_flight_policy (str, optional): 진행 중인 지연 처리 정책 (기본값: 설정된 정책)
         
         Raises:
-            ValueError: 유효하지 않은 전략 이름
+            ValueError: 유효하지 않은 전략 이름 또는 정책 이름, 공유 상태에 기록할 수 없는 크기의 설정
         """
+        policy = in_flight_policy or self.in_flight_policy
+        if policy not in IN_FLIGHT_POLICIES:
+            raise ValueError(f"유효하지 않은 진행 중 지연 정책: {policy}")
+        
         params = params or {}
+        strategy = self._create_strategy(strategy_name, params)
+        
+        # 공유 상태가 연결된 경우 같은 기준 시각으로 다른 프로세스에 전파
+        # 기록에 실패하면(설정 크기 초과 등) 현재 프로세스의 전략도 바꾸지 않아 프로세스 간 설정이 어긋나지 않음
+        if self.shared_state is not None:
+            origin_ns = self.clock.now_ns()
+            strategy.set_start_time(origin_ns / 1_000_000_000)
+            self._shared_version = self.shared_state.write(
+                {'strategy': strategy_name, 'params': params},
+                origin_ns
+            )
+        
+        self.strategy = strategy
+        self._strategy_spec = (strategy_name, params)
+        self._apply_in_flight_policy(strategy, policy)
+    
+    def attach_shared_state(self, shared_state):
+        """
+        프로세스 간 공유 상태 연결
+        
+        공유 상태에 이미 전략이 기록되어 있으면 그 전략과 기준 시각을 따르고,
+        비어 있으면 현재 전략을 기록함
         
-        # 전략 이름에 따라 적절한 전략 객체 생성
+        Args:
+            shared_state (SharedDelayState): 공유 상태
+        """
+        self.shared_state = shared_state
+        if shared_state.read_version() == 0:
+            strategy_name, params = self._get_strategy_spec()
+            self._shared_version = shared_state.write(
+                {'strategy': strategy_name, 'params': params},
+                self.clock.now_ns()
+            )
+        else:
+            self._sync_shared_state()
+    
+    def _sync_shared_state(self):
+        """
+        공유 상태의 전략 설정과 기준 시각을 현재 프로세스에 적용
+        """
+        version, origin_ns, config = self.shared_state.read()
+        self._shared_version = version
+        if not config:
+            return
+        
+        strategy = self._create_strategy(config['strategy'], config.get('params') or {})
+        strategy.set_start_time(origin_ns / 1_000_000_000)
+        self.strategy = strategy
+        self._strategy_spec = (config['strategy'], config.get('params') or {})
+        self._apply_in_flight_policy(strategy, self.in_flight_policy)
+    
+    def resolve_data_path(self, path):
+        """
+        전략 매개변수의 파일 경로를 데이터 디렉터리 안의 실제 경로로 변환
+        
+        요청 본문으로 받은 경로로 서버의 임의 파일을 읽지 못하도록, 심볼릭 링크와 '..'를 해석한 경로가
+        데이터 디렉터리 밖이면 거부 (상대 경로는 데이터 디렉터리 기준)
+        
+        Args:
+            path (str): 파일 경로
+        
+        Returns:
+            str: 데이터 디렉터리 안의 실제 경로
+        
+        Raises:
+            ValueError: 데이터 디렉터리 밖의 경로
+        """
+        resolved = os.path.realpath(os.path.join(self.data_dir, os.fspath(path)))
+        if os.path.commonpath([resolved, self.data_dir]) != self.data_dir:
+            raise ValueError(f"데이터 디렉터리({self.data_dir}) 밖의 파일은 사용할 수 없습니다: {path}")
+        return resolved
+    
+    def _create_strategy(self, strategy_name, params):
+        """
+        전략 이름과 매개변수로 전략 객체 생성
+        
+        Args:
+            strategy_name (str): 전략 이름
+            params (dict): 전략 매개변수
+        
+        Returns:
+            DelayStrategy: 생성된 전략 객체
+        
+        Raises:
+            ValueError: 유효하지 않은 전략 이름 또는 데이터 디렉터리 밖의 파일 경로
+        """
+        # 'tail_jitter' 매개변수가 있으면 기반 전략 위에 꼬리가 긴 지터를 중첩
+        if params.get('tail_jitter'):
+            base_params = {key: value for key, value in params.items() if key != 'tail_jitter'}
+            return JitteredDelayStrategy(
+                self._create_strategy(strategy_name, base_params),
+                JitterBuffer(**params['tail_jitter']),
+                clock=self.clock
+            )
+        
+        # 전략 이름에 따라 적절한 전략 객체 생성 (지정하지 않은 매개변수는 STRATEGY_DEFAULTS 사용)
+        params = dict(STRATEGY_DEFAULTS.get(strategy_name, {}), **params)
         if strategy_name == 'FixedDelayStrategy':
-            self.strategy = FixedDelayStrategy(
-                delay_seconds=params.get('delay_seconds', 1.0)
+            return FixedDelayStrategy(
+                delay_seconds=params['delay_seconds'],
+                clock=self.clock
             )
         elif strategy_name == 'ProgressiveIncreaseDelayStrategy':
-            self.strategy = ProgressiveIncreaseDelayStrategy(
-                initial_delay=params.get('initial_delay', 0.0),
-                increment=params.get('increment', 0.5),
-                interval=params.get('interval', 5.0),
-                max_steps=params.get('max_steps', 10)
+            return ProgressiveIncreaseDelayStrategy(
+                initial_delay=params['initial_delay'],
+                increment=params['increment'],
+                interval=params['interval'],
+                max_steps=params['max_steps'],
+                clock=self.clock
             )
         elif strategy_name == 'ProgressiveDecreaseDelayStrategy':
-            self.strategy = ProgressiveDecreaseDelayStrategy(
-                initial_delay=params.get('initial_delay', 5.0),
-                decrement=params.get('decrement', 0.5),
-                interval=params.get('interval', 5.0),
-                min_delay=params.get('min_delay', 0.0)
+            return ProgressiveDecreaseDelayStrategy(
+                initial_delay=params['initial_delay'],
+                decrement=params['decrement'],
+                interval=params['interval'],
+                min_delay=params['min_delay'],
+                clock=self.clock
             )
         elif strategy_name == 'StepDelayStrategy':
-            self.strategy = StepDelayStrategy(
-                normal_delay=params.get('normal_delay', 0.0),
-                high_delay=params.get('high_delay', 5.0),
-                normal_duration=params.get('normal_duration', 5.0),
-                high_duration=params.get('high_duration', 5.0),
-                step_increment=params.get('step_increment', 5.0),
-                total_duration=params.get('total_duration', 300.0)
+            return StepDelayStrategy(
+                normal_delay=params['normal_delay'],
+                high_delay=params['high_delay'],
+                normal_duration=params['normal_duration'],
+                high_duration=params['high_duration'],
+                step_increment=params['step_increment'],
+                total_duration=params['total_duration'],
+                clock=self.clock
             )
         elif strategy_name == 'NoResponseDelayStrategy':
-            self.strategy = NoResponseDelayStrategy(
-                no_response_duration=params.get('no_response_duration', 10.0)
+            return NoResponseDelayStrategy(
+                no_response_duration=params['no_response_duration'],
+                clock=self.clock
             )
         elif strategy_name == 'RandomDelayStrategy':
-            self.strategy = RandomDelayStrategy(
-                min_delay=params.get('min_delay', 0.5),
-                max_delay=params.get('max_delay', 5.0),
-                change_interval=params.get('change_interval', 5.0),
-                total_duration=params.get('total_duration', 300.0)
+            return RandomDelayStrategy(
+                min_delay=params['min_delay'],
+                max_delay=params['max_delay'],
+                change_interval=params['change_interval'],
+                total_duration=params['total_duration'],
+                seed=params.get('seed'),
+                clock=self.clock
+            )
+        elif strategy_name == 'TraceReplayDelayStrategy':
+            if not params.get('trace_path'):
+                raise ValueError("TraceReplayDelayStrategy에는 trace_path가 필요합니다.")
+            return TraceReplayDelayStrategy(
+                trace_path=self.resolve_data_path(params['trace_path']),
+                loop=params.get('loop', True),
+                speed_factor=params.get('speed_factor', 1.0),
+                start_offset=params.get('start_offset', 0.0),
+                clock=self.clock
+            )
+        elif strategy_name == 'EmpiricalDelayStrategy':
+            options = {
+                'block_size': params.get('block_size', 4096),
+                'seed': params.get('seed'),
+                'clock': self.clock
+            }
+            if params.get('samples_path'):
+                return EmpiricalDelayStrategy.from_file(self.resolve_data_path(params['samples_path']), **options)
+            return EmpiricalDelayStrategy(
+                samples=params.get('samples'),
+                bin_edges=params.get('bin_edges'),
+                counts=params.get('counts'),
+                **options
+            )
+        elif strategy_name == 'BandwidthDelayStrategy':
+            return BandwidthDelayStrategy(
+                bandwidth_mbps=params.get('bandwidth_mbps', 10.0),
+                base_latency=params.get('base_latency', 0.02),
+                bucket_size_bytes=params.get('bucket_size_bytes', 65536),
+                clock=self.clock
+            )
+        elif strategy_name == 'QueueingDelayStrategy':
+            return QueueingDelayStrategy(
+                servers=params.get('servers', 4),
+                mean_service_time=params.get('mean_service_time', 0.1),
+                service_distribution=params.get('service_distribution', 'exponential'),
+                service_time_sigma=params.get('service_time_sigma', 0.5),
+                discipline=params.get('discipline', 'fifo'),
+                priority_field=params.get('priority_field', 'cameraId'),
+                priority_levels=params.get('priority_levels', 2),
+                history_interval=params.get('history_interval', 1.0),
+                history_size=params.get('history_size', 600),
+                seed=params.get('seed'),
+                clock=self.clock
+            )
+        elif strategy_name == 'GilbertElliottDelayStrategy':
+            return GilbertElliottDelayStrategy(
+                p_good_to_bad=params.get('p_good_to_bad', 0.05),
+                p_bad_to_good=params.get('p_bad_to_good', 0.3),
+                good_delay=params.get('good_delay', 0.05),
+                good_jitter=params.get('good_jitter', 0.0),
+                bad_loss_probability=params.get('bad_loss_probability', 1.0),
+                bad_delay=params.get('bad_delay', 1.0),
+                drop_mode=params.get('drop_mode', 'abort'),
+                hang_seconds=params.get('hang_seconds', 10.0),
+                seed=params.get('seed'),
+                clock=self.clock
+            )
+        elif strategy_name == 'ReorderDelayStrategy':
+            return ReorderDelayStrategy(
+                base_delay=params.get('base_delay', 0.1),
+                jitter=params.get('jitter', 0.05),
+                reorder_rate=params.get('reorder_rate', 0.1),
+                hold_delay=params.get('hold_delay', 0.2),
+                stream_fields=params.get('stream_fields', ('shipID', 'UserID', 'cameraId')),
+                max_streams=params.get('max_streams', 256),
+                seed=params.get('seed'),
+                clock=self.clock
+            )
+        elif strategy_name == 'TimelineDelayStrategy':
+            return TimelineDelayStrategy(
+                segments=params.get('segments') or [],
+                factory=self._create_strategy,
+                overlays=params.get('overlays'),
+                loop=params.get('loop', False),
+                clock=self.clock
             )
         else:
             raise ValueError(f"유효하지 않은 전략 이름: {strategy_name}")
     
+    def set_clock(self, clock):
+        """
+        시간 원천 교체
+        
+        현재 전략은 같은 매개변수로 새 시계 기준에서 다시 시작됨
+        
+        Args:
+            clock (Clock): 새 시간 원천
+        """
+        strategy_name, params = self._get_strategy_spec()
+        self.clock = clock
+        self.set_strategy(strategy_name, params)
+        self.error_stats.reset()
+    
+    def _get_strategy_spec(self):
+        """
+        현재 전략을 다시 만들 수 있는 전략 이름과 매개변수 반환
+        
+        Returns:
+            tuple: (전략 이름, 매개변수 dict)
+        """
+        if self._strategy_spec is not None:
+            return self._strategy_spec
+        config = self.strategy.get_config()
+        return config['strategy'], config['params']
+    
+    def get_clock_config(self):
+        """
+        현재 시간 원천 설정 조회
+        
+        Returns:
+            dict: 시계 설정 정보
+        """
+        return self.clock.get_config()
+    
     def get_config(self):
         """
         현재 지연 설정 조회
@@ -101,6 +634,8 @@ class DelaySimulator:
         Returns:
             dict: 현재 지연 설정 정보
         """
+        if self.shared_state is not None and self.shared_state.read_version() != self._shared_version:
+            self._sync_shared_state()
         return self.strategy.get_config()
     
     # 편의 메서드: 특정 시나리오를 쉽게 설정할 수 있는 메서드들
@@ -114,9 +649,9 @@ class DelaySimulator:
         """
         self.set_strategy('FixedDelayStrategy', {'delay_seconds': delay_seconds})
     
-    def set_progressive_increase_delay(self, initial_delay=0.0, increment=0.5, interval=5.0, max_steps=10):
+    def set_progressive_increase_delay(self, initial_delay=None, increment=None, interval=None, max_steps=None):
         """
-        점진적 증가 지연 설정
+        점진적 증가 지연 설정 (지정하지 않은 매개변수는 STRATEGY_DEFAULTS 사용)
         
         Args:
             initial_delay (float, optional): 초기 지연 시간(초)
@@ -124,16 +659,16 @@ class DelaySimulator:
             interval (float, optional): 증가 간격(초)
             max_steps (int, optional): 최대 증가 단계 수
         """
-        self.set_strategy('ProgressiveIncreaseDelayStrategy', {
-            'initial_delay': initial_delay,
-            'increment': increment,
-            'interval': interval,
-            'max_steps': max_steps
-        })
+        self.set_strategy('ProgressiveIncreaseDelayStrategy', _given_params(
+            initial_delay=initial_delay,
+            increment=increment,
+            interval=interval,
+            max_steps=max_steps
+        ))
     
-    def set_progressive_decrease_delay(self, initial_delay=5.0, decrement=0.5, interval=5.0, min_delay=0.0):
+    def set_progressive_decrease_delay(self, initial_delay=None, decrement=None, interval=None, min_delay=None):
         """
-        점진적 감소 지연 설정
+        점진적 감소 지연 설정 (지정하지 않은 매개변수는 STRATEGY_DEFAULTS 사용)
         
         Args:
             initial_delay (float, optional): 초기 지연 시간(초)
@@ -141,16 +676,16 @@ class DelaySimulator:
             interval (float, optional): 감소 간격(초)
             min_delay (float, optional): 최소 지연 시간(초)
         """
-        self.set_strategy('ProgressiveDecreaseDelayStrategy', {
-            'initial_delay': initial_delay,
-            'decrement': decrement,
-            'interval': interval,
-            'min_delay': min_delay
-        })
+        self.set_strategy('ProgressiveDecreaseDelayStrategy', _given_params(
+            initial_delay=initial_delay,
+            decrement=decrement,
+            interval=interval,
+            min_delay=min_delay
+        ))
     
-    def set_step_delay(self, normal_delay=0.0, high_delay=5.0, normal_duration=5.0, high_duration=5.0, step_increment=5.0, total_duration=300.0):
+    def set_step_delay(self, normal_delay=None, high_delay=None, normal_duration=None, high_duration=None, step_increment=None, total_duration=None):
         """
-        계단식 지연 설정
+        계단식 지연 설정 (지정하지 않은 매개변수는 STRATEGY_DEFAULTS 사용)
         
         Args:
             normal_delay (float, optional): 정상 지연 시간(초)
@@ -160,27 +695,27 @@ class DelaySimulator:
             step_increment (float, optional): 높은 지연 증가량(초)
             total_duration (float, optional): 총 지속 시간(초)
         """
-        self.set_strategy('StepDelayStrategy', {
-            'normal_delay': normal_delay,
-            'high_delay': high_delay,
-            'normal_duration': normal_duration,
-            'high_duration': high_duration,
-            'step_increment': step_increment,
-            'total_duration': total_duration
-        })
+        self.set_strategy('StepDelayStrategy', _given_params(
+            normal_delay=normal_delay,
+            high_delay=high_delay,
+            normal_duration=normal_duration,
+            high_duration=high_duration,
+            step_increment=step_increment,
+            total_duration=total_duration
+        ))
     
-    def set_no_response(self, duration=10.0):
+    def set_no_response(self, duration=None):
         """
         무응답 시뮬레이션 설정
         
         Args:
-            duration (float, optional): 무응답 지속 시간(초)
+            duration (float, optional): 무응답 지속 시간(초) (기본값: STRATEGY_DEFAULTS)
         """
-        self.set_strategy('NoResponseDelayStrategy', {'no_response_duration': duration})
+        self.set_strategy('NoResponseDelayStrategy', _given_params(no_response_duration=duration))
     
-    def set_random_delay(self, min_delay=0.5, max_delay=5.0, change_interval=5.0, total_duration=300.0):
+    def set_random_delay(self, min_delay=None, max_delay=None, change_interval=None, total_duration=None):
         """
-        랜덤 지연 설정
+        랜덤 지연 설정 (지정하지 않은 매개변수는 STRATEGY_DEFAULTS 사용)
         
         Args:
             min_delay (float, optional): 최소 지연 시간(초)
@@ -188,9 +723,9 @@ class DelaySimulator:
             change_interval (float, optional): 지연 시간 변경 간격(초)
             total_duration (float, optional): 총 지속 시간(초)
         """
-        self.set_strategy('RandomDelayStrategy', {
-            'min_delay': min_delay,
-            'max_delay': max_delay,
-            'change_interval': change_interval,
-            'total_duration': total_duration
-        })
+        self.set_strategy('RandomDelayStrategy', _given_params(
+            min_delay=min_delay,
+            max_delay=max_delay,
+            change_interval=change_interval,
+            total_duration=total_duration
+        ))
@@ -1,6 +1,40 @@
-import time
+import bisect
+import heapq
+import json
+import math
 import random
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+import numpy as np
+from app.services.clock import RealClock
+from app.services.deterministic_rng import CounterRNG
+
+class RequestDropped(Exception):
+    """
+    요청 손실 예외
+    
+    지연 전략이 요청을 손실 처리할 때 발생
+    mode가 'abort'이면 즉시 연결을 끊고, 'hang'이면 hang_seconds 동안 응답하지 않은 뒤 끊음
+    
+    WSGI 애플리케이션에서는 TCP 연결을 직접 리셋할 수 없으므로 'abort'는 본문 없는 503 응답과
+    'Connection: close'로 대신함 (클라이언트는 즉시 실패한 요청으로 관찰)
+    'hang'은 hang_seconds 동안 아무 응답도 보내지 않은 뒤 504로 끊어 타임아웃으로 관찰됨
+    """
+    
+    def __init__(self, mode='abort', hang_seconds=0.0):
+        """
+        요청 손실 예외 초기화
+        
+        Args:
+            mode (str, optional): 손실 방식 ('abort', 'hang')
+            hang_seconds (float, optional): 'hang' 방식에서 응답하지 않을 시간(초)
+        """
+        super().__init__(f"요청 손실 ({mode})")
+        self.mode = mode
+        self.hang_seconds = hang_seconds
+        self.record = None
+
 
 class DelayStrategy(ABC):
     """
@@ -9,6 +43,16 @@ class DelayStrategy(ABC):
     다양한 지연 시나리오를 구현하기 위한 기본 클래스
     """
     
+    @property
+    def name(self):
+        """
+        설정 조회 결과와 지연 계측에 사용하는 전략 이름
+        
+        요청마다 get_config()를 호출하지 않고 계측 버킷을 정하기 위해 사용하며,
+        다른 전략을 감싸는 전략은 get_config()['strategy']와 같은 이름을 반환하도록 재정의
+        """
+        return self.__class__.__name__
+    
     @abstractmethod
     def get_delay(self):
         """
@@ -28,6 +72,45 @@ class DelayStrategy(ABC):
         """
         pass
     
+    def get_request_delay(self, request_info=None):
+        """
+        요청 정보를 반영한 지연 시간(초) 반환
+        
+        기본 구현은 요청과 무관하게 get_delay() 결과를 반환하며,
+        요청 크기나 식별 정보에 따라 지연이 달라지는 전략에서 재정의
+        
+        Args:
+            request_info (dict, optional): 요청 정보 ('payload_bytes', 'ID', 'timestamp_ns' 등)
+            
+        Returns:
+            float: 지연 시간(초)
+        """
+        return self.get_delay()
+    
+    def peek_delay(self):
+        """
+        상태를 바꾸지 않고 현재 지연 시간(초) 반환
+        
+        진행 중인 지연을 새 전략 기준으로 재계산할 때 사용하며, 요청마다 상태가 바뀌는 전략도
+        표본 소비, 상태 전이, 요청 손실 없이 마지막으로 계산한 지연 시간을 반환
+        
+        Returns:
+            float: 지연 시간(초)
+        """
+        return self.get_delay()
+    
+    def set_start_time(self, start_time):
+        """
+        타임라인 기준 시각 설정
+        
+        기준 시각부터 요청이 계속 들어온 것처럼 전략 상태를 현재 시각까지 진행
+        여러 프로세스가 같은 기준 시각을 공유하면 같은 지연 일정을 따름
+        
+        Args:
+            start_time (float): 기준 시각(초, 전략 시계 기준)
+        """
+        pass
+    
     def get_config(self):
         """
         현재 전략 설정 반환
@@ -36,7 +119,7 @@ class DelayStrategy(ABC):
             dict: 전략 설정 정보
         """
         return {
-            'strategy': self.__class__.__name__,
+            'strategy': self.name,
             'params': {}
         }
 
@@ -48,14 +131,16 @@ class FixedDelayStrategy(DelayStrategy):
     항상 동일한 지연 시간을 반환
     """
     
-    def __init__(self, delay_seconds=1.0):
+    def __init__(self, delay_seconds=1.0, clock=None):
         """
         고정 지연 전략 초기화
         
         Args:
             delay_seconds (float, optional): 지연 시간(초)
+            clock (Clock, optional): 시간 원천 (기본값: 실제 시계)
         """
         self.delay_seconds = delay_seconds
+        self.clock = clock or RealClock()
     
     def get_delay(self):
         return self.delay_seconds
@@ -77,7 +162,7 @@ class ProgressiveIncreaseDelayStrategy(DelayStrategy):
     시간이 지남에 따라 지연 시간이 점진적으로 증가
     """
     
-    def __init__(self, initial_delay=0.0, increment=0.5, interval=5.0, max_steps=10):
+    def __init__(self, initial_delay=0.0, increment=0.5, interval=5.0, max_steps=10, clock=None):
         """
         점진적 증가 지연 전략 초기화
         
@@ -86,21 +171,23 @@ class ProgressiveIncreaseDelayStrategy(DelayStrategy):
             increment (float, optional): 증가량(초)
             interval (float, optional): 증가 간격(초)
             max_steps (int, optional): 최대 증가 단계 수
+            clock (Clock, optional): 시간 원천 (기본값: 실제 시계)
         """
         self.initial_delay = initial_delay
         self.increment = increment
         self.interval = interval
         self.max_steps = max_steps
+        self.clock = clock or RealClock()
         
         self.current_delay = initial_delay
         self.current_step = 0
-        self.last_update_time = time.time()
+        self.last_update_time = self.clock.now()
     
     def get_delay(self):
         return self.current_delay
     
     def update(self):
-        current_time = time.time()
+        current_time = self.clock.now()
         elapsed = current_time - self.last_update_time
         
         if elapsed >= self.interval and self.current_step < self.max_steps:
@@ -108,6 +195,13 @@ class ProgressiveIncreaseDelayStrategy(DelayStrategy):
             self.current_delay = self.initial_delay + (self.increment * self.current_step)
             self.last_update_time = current_time
     
+    def set_start_time(self, start_time):
+        elapsed = max(self.clock.now() - start_time, 0.0)
+        steps = int(elapsed // self.interval) if self.interval > 0 else self.max_steps
+        self.current_step = min(steps, self.max_steps)
+        self.current_delay = self.initial_delay + (self.increment * self.current_step)
+        self.last_update_time = start_time + self.interval * self.current_step
+    
     def get_config(self):
         config = super().get_config()
         config['params'] = {
@@ -128,7 +222,7 @@ class ProgressiveDecreaseDelayStrategy(DelayStrategy):
     시간이 지남에 따라 지연 시간이 점진적으로 감소
     """
     
-    def __init__(self, initial_delay=5.0, decrement=0.5, interval=5.0, min_delay=0.0):
+    def __init__(self, initial_delay=5.0, decrement=0.5, interval=5.0, min_delay=0.0, clock=None):
         """
         점진적 감소 지연 전략 초기화
         
@@ -137,20 +231,22 @@ class ProgressiveDecreaseDelayStrategy(DelayStrategy):
             decrement (float, optional): 감소량(초)
             interval (float, optional): 감소 간격(초)
             min_delay (float, optional): 최소 지연 시간(초)
+            clock (Clock, optional): 시간 원천 (기본값: 실제 시계)
         """
         self.initial_delay = initial_delay
         self.decrement = decrement
         self.interval = interval
         self.min_delay = min_delay
+        self.clock = clock or RealClock()
         
         self.current_delay = initial_delay
-        self.last_update_time = time.time()
+        self.last_update_time = self.clock.now()
     
     def get_delay(self):
         return self.current_delay
     
     def update(self):
-        current_time = time.time()
+        current_time = self.clock.now()
         elapsed = current_time - self.last_update_time
         
         if elapsed >= self.interval and self.current_delay > self.min_delay:
@@ -158,6 +254,16 @@ class ProgressiveDecreaseDelayStrategy(DelayStrategy):
             self.current_delay = max(new_delay, self.min_delay)
             self.last_update_time = current_time
     
+    def set_start_time(self, start_time):
+        elapsed = max(self.clock.now() - start_time, 0.0)
+        steps = int(elapsed // self.interval) if self.interval > 0 else 0
+        if self.decrement > 0:
+            # 최소 지연에 도달한 이후에는 더 이상 감소 단계가 없음
+            max_steps = int(-(-(self.initial_delay - self.min_delay) // self.decrement))
+            steps = min(steps, max(max_steps, 0))
+        self.current_delay = max(self.initial_delay - self.decrement * steps, self.min_delay)
+        self.last_update_time = start_time + self.interval * steps
+    
     def get_config(self):
         config = super().get_config()
         config['params'] = {
@@ -177,7 +283,7 @@ class StepDelayStrategy(DelayStrategy):
     정상 지연과 높은 지연을 번갈아가며 적용
     """
     
-    def __init__(self, normal_delay=0.0, high_delay=5.0, normal_duration=5.0, high_duration=5.0, step_increment=5.0, total_duration=300.0):
+    def __init__(self, normal_delay=0.0, high_delay=5.0, normal_duration=5.0, high_duration=5.0, step_increment=5.0, total_duration=300.0, clock=None):
         """
         계단식 지연 전략 초기화
         
@@ -188,6 +294,7 @@ class StepDelayStrategy(DelayStrategy):
             high_duration (float, optional): 높은 지연 지속 시간(초)
             step_increment (float, optional): 높은 지연 증가량(초)
             total_duration (float, optional): 총 지속 시간(초)
+            clock (Clock, optional): 시간 원천 (기본값: 실제 시계)
         """
         self.normal_delay = normal_delay
         self.high_delay = high_delay
@@ -195,18 +302,19 @@ class StepDelayStrategy(DelayStrategy):
         self.high_duration = high_duration
         self.step_increment = step_increment
         self.total_duration = total_duration
+        self.clock = clock or RealClock()
         
         self.is_high_delay = False
         self.current_high_delay = high_delay
         self.current_delay = normal_delay
-        self.start_time = time.time()
+        self.start_time = self.clock.now()
         self.last_switch_time = self.start_time
     
     def get_delay(self):
         return self.current_delay
     
     def update(self):
-        current_time = time.time()
+        current_time = self.clock.now()
         total_elapsed = current_time - self.start_time
         
         if total_elapsed > self.total_duration:
@@ -232,6 +340,33 @@ class StepDelayStrategy(DelayStrategy):
             self.current_high_delay += self.step_increment
             self.last_switch_time = current_time
     
+    def set_start_time(self, start_time):
+        current_time = self.clock.now()
+        elapsed = max(current_time - start_time, 0.0)
+        
+        # 총 지속 시간 단위로 반복되는 주기의 시작 시각으로 이동
+        cycles = int(elapsed // self.total_duration) if self.total_duration > 0 else 0
+        self.start_time = start_time + self.total_duration * cycles
+        self.is_high_delay = False
+        self.current_high_delay = self.high_delay
+        self.current_delay = self.normal_delay
+        self.last_switch_time = self.start_time
+        
+        # 주기 내 전환 시점을 순서대로 재생
+        while True:
+            duration = self.high_duration if self.is_high_delay else self.normal_duration
+            switch_time = self.last_switch_time + duration
+            if duration <= 0 or switch_time > current_time:
+                break
+            if self.is_high_delay:
+                self.is_high_delay = False
+                self.current_delay = self.normal_delay
+            else:
+                self.is_high_delay = True
+                self.current_delay = self.current_high_delay
+                self.current_high_delay += self.step_increment
+            self.last_switch_time = switch_time
+    
     def get_config(self):
         config = super().get_config()
         config['params'] = {
@@ -255,16 +390,18 @@ class NoResponseDelayStrategy(DelayStrategy):
     지정된 시간 동안 무응답 상태를 시뮬레이션
     """
     
-    def __init__(self, no_response_duration=10.0):
+    def __init__(self, no_response_duration=10.0, clock=None):
         """
         무응답 시뮬레이션 전략 초기화
         
         Args:
             no_response_duration (float, optional): 무응답 지속 시간(초)
+            clock (Clock, optional): 시간 원천 (기본값: 실제 시계)
         """
         self.no_response_duration = no_response_duration
+        self.clock = clock or RealClock()
         self.is_active = True
-        self.start_time = time.time()
+        self.start_time = self.clock.now()
     
     def get_delay(self):
         if self.is_active:
@@ -272,18 +409,22 @@ class NoResponseDelayStrategy(DelayStrategy):
         return 0.0
     
     def update(self):
-        current_time = time.time()
+        current_time = self.clock.now()
         elapsed = current_time - self.start_time
         
         if elapsed >= self.no_response_duration:
             self.is_active = False
     
+    def set_start_time(self, start_time):
+        self.start_time = start_time
+        self.is_active = self.clock.now() - start_time < self.no_response_duration
+    
     def get_config(self):
         config = super().get_config()
         config['params'] = {
             'no_response_duration': self.no_response_duration,
             'is_active': self.is_active,
-            'elapsed': time.time() - self.start_time
+            'elapsed': self.clock.now() - self.start_time
         }
         return config
 
@@ -295,7 +436,7 @@ class RandomDelayStrategy(DelayStrategy):
     지정된 범위 내에서 랜덤한 지연 시간을 반환
     """
     
-    def __init__(self, min_delay=0.5, max_delay=5.0, change_interval=5.0, total_duration=300.0):
+    def __init__(self, min_delay=0.5, max_delay=5.0, change_interval=5.0, total_duration=300.0, seed=None, clock=None):
         """
         랜덤 지연 전략 초기화
         
@@ -304,26 +445,52 @@ class RandomDelayStrategy(DelayStrategy):
             max_delay (float, optional): 최대 지연 시간(초)
             change_interval (float, optional): 지연 시간 변경 간격(초)
             total_duration (float, optional): 총 지속 시간(초)
+            seed (int, optional): 결정적 난수 시드 (지정 시 (주기, 변경 순번)마다 같은 지연 시간을 사용)
+            clock (Clock, optional): 시간 원천 (기본값: 실제 시계)
         """
         self.min_delay = min_delay
         self.max_delay = max_delay
         self.change_interval = change_interval
         self.total_duration = total_duration
+        self.seed = seed
+        self.clock = clock or RealClock()
+        self._rng = CounterRNG(seed) if seed is not None else None
         
-        self.current_delay = random.uniform(min_delay, max_delay)
-        self.start_time = time.time()
+        self.cycle = 0
+        self.change = 0
+        self.current_delay = self._draw()
+        self.start_time = self.clock.now()
+        self.origin = self.start_time
         self.last_change_time = self.start_time
     
+    def _draw(self):
+        """
+        현재 (주기, 변경 순번)의 지연 시간 추출
+        
+        Returns:
+            float: 지연 시간(초)
+        """
+        if self._rng is None:
+            return random.uniform(self.min_delay, self.max_delay)
+        return self._rng.uniform(self.min_delay, self.max_delay, 'random_delay', self.cycle, self.change)
+    
     def get_delay(self):
         return self.current_delay
     
     def update(self):
-        current_time = time.time()
+        if self._rng is not None:
+            # 결정적 모드: 기준 시각의 격자에 맞춰 (주기, 변경 순번)을 계산하여 프로세스 간 일치
+            self._align()
+            return
+        
+        current_time = self.clock.now()
         total_elapsed = current_time - self.start_time
         
         if total_elapsed > self.total_duration:
             # 총 지속 시간이 지나면 리셋
-            self.current_delay = random.uniform(self.min_delay, self.max_delay)
+            self.cycle += 1
+            self.change = 0
+            self.current_delay = self._draw()
             self.start_time = current_time
             self.last_change_time = current_time
             return
@@ -331,9 +498,31 @@ class RandomDelayStrategy(DelayStrategy):
         elapsed_since_change = current_time - self.last_change_time
         
         if elapsed_since_change >= self.change_interval:
-            self.current_delay = random.uniform(self.min_delay, self.max_delay)
+            self.change += 1
+            self.current_delay = self._draw()
             self.last_change_time = current_time
     
+    def set_start_time(self, start_time):
+        self.origin = start_time
+        self._align()
+    
+    def _align(self):
+        """
+        기준 시각부터의 경과 시간으로 현재 주기와 변경 순번 계산
+        
+        결정적 모드에서는 순번이 바뀌면 지연 시간을 다시 추출
+        """
+        elapsed = max(self.clock.now() - self.origin, 0.0)
+        cycles = int(elapsed // self.total_duration) if self.total_duration > 0 else 0
+        self.start_time = self.origin + self.total_duration * cycles
+        changes = int((elapsed - self.total_duration * cycles) // self.change_interval) if self.change_interval > 0 else 0
+        self.last_change_time = self.start_time + self.change_interval * changes
+        changed = (cycles, changes) != (self.cycle, self.change)
+        self.cycle = cycles
+        self.change = changes
+        if self._rng is not None and changed:
+            self.current_delay = self._draw()
+    
     def get_config(self):
         config = super().get_config()
         config['params'] = {
@@ -341,6 +530,996 @@ class RandomDelayStrategy(DelayStrategy):
             'max_delay': self.max_delay,
             'change_interval': self.change_interval,
             'total_duration': self.total_duration,
+            'seed': self.seed,
+            'current_delay': self.current_delay
+        }
+        return config
+
+
+class TraceReplayDelayStrategy(DelayStrategy):
+    """
+    트레이스 재생 지연 전략
+    
+    실제 네트워크에서 기록한 (경과 시간, 지연 시간) 시계열을 재생
+    트레이스는 numpy.memmap으로 열어 전체를 메모리에 올리지 않고,
+    경과 시간이 단조 증가하는 점을 이용해 커서를 앞으로 이동하며 조회
+    """
+    
+    def __init__(self, trace_path, loop=True, speed_factor=1.0, start_offset=0.0, clock=None):
+        """
+        트레이스 재생 지연 전략 초기화
+        
+        트레이스 파일 형식:
+            - .npy: (N, 2) float 배열
+            - 그 외: 리틀 엔디언 float64 (offset, delay) 쌍이 연속된 바이너리
+        각 행은 (트레이스 시작 후 경과 시간(초), 지연 시간(초))이며 경과 시간 오름차순이어야 함
+        
+        Args:
+            trace_path (str): 트레이스 파일 경로
+            loop (bool, optional): 트레이스 끝에 도달하면 처음부터 반복할지 여부
+            speed_factor (float, optional): 재생 속도 배율
+            start_offset (float, optional): 재생을 시작할 트레이스 내 경과 시간(초)
+            clock (Clock, optional): 시간 원천 (기본값: 실제 시계)
+        
+        Raises:
+            ValueError: 트레이스 형식이 올바르지 않은 경우
+        """
+        self.trace_path = trace_path
+        self.loop = loop
+        self.speed_factor = speed_factor
+        self.start_offset = start_offset
+        self.clock = clock or RealClock()
+        
+        if trace_path.endswith('.npy'):
+            trace = np.load(trace_path, mmap_mode='r')
+        else:
+            trace = np.memmap(trace_path, dtype='<f8', mode='r')
+            trace = trace[:trace.size - trace.size % 2].reshape(-1, 2)
+        
+        if trace.ndim != 2 or trace.shape[1] != 2 or trace.shape[0] == 0:
+            raise ValueError(f"트레이스는 (N, 2) 형식이어야 합니다: {trace_path}")
+        
+        self._trace = trace
+        self._offsets = trace[:, 0]
+        self._delays = trace[:, 1]
+        self._first_offset = float(self._offsets[0])
+        self._last_offset = float(self._offsets[-1])
+        
+        self._cursor = 0
+        self.trace_position = start_offset
+        self.current_delay = float(self._delays[0])
+        self.start_time = self.clock.now()
+    
+    def get_delay(self):
+        return self.current_delay
+    
+    def update(self):
+        elapsed = self.clock.now() - self.start_time
+        position = self.start_offset + elapsed * self.speed_factor
+        
+        # 반복 재생 시 트레이스 구간 안으로 위치 이동
+        span = self._last_offset - self._first_offset
+        if self.loop and span > 0 and position > self._last_offset:
+            position = self._first_offset + (position - self._first_offset) % span
+        
+        self.trace_position = position
+        self.current_delay = float(self._delays[self._lookup(position)])
+    
+    def _lookup(self, position):
+        """
+        위치에 해당하는 트레이스 행 번호 조회
+        
+        커서 근처는 순차 이동으로, 멀리 떨어진 경우 이진 탐색으로 찾음
+        
+        Args:
+            position (float): 트레이스 내 경과 시간(초)
+            
+        Returns:
+            int: 행 번호
+        """
+        offsets = self._offsets
+        count = len(offsets)
+        cursor = self._cursor
+        
+        if offsets[cursor] <= position:
+            # 대부분의 경우 다음 몇 행 이내에 위치
+            for _ in range(8):
+                if cursor + 1 >= count or offsets[cursor + 1] > position:
+                    self._cursor = cursor
+                    return cursor
+                cursor += 1
+            cursor = bisect.bisect_right(offsets, position, cursor, count) - 1
+        else:
+            # 반복 재생으로 처음으로 돌아간 경우
+            cursor = max(bisect.bisect_right(offsets, position, 0, cursor) - 1, 0)
+        
+        self._cursor = cursor
+        return cursor
+    
+    def set_start_time(self, start_time):
+        self.start_time = start_time
+    
+    def get_config(self):
+        config = super().get_config()
+        config['params'] = {
+            'trace_path': self.trace_path,
+            'loop': self.loop,
+            'speed_factor': self.speed_factor,
+            'start_offset': self.start_offset,
+            'samples': int(self._trace.shape[0]),
+            'trace_position': self.trace_position,
+            'current_delay': self.current_delay
+        }
+        return config
+
+
+def build_alias_table(weights):
+    """
+    Vose 별칭(alias) 테이블 생성
+    
+    가중치 분포에서 O(1)로 표본을 뽑기 위한 확률 테이블과 별칭 테이블을 만듦
+    
+    Args:
+        weights (array-like): 음수가 아닌 가중치 목록
+        
+    Returns:
+        tuple: (확률 배열(float64), 별칭 배열(int64))
+    
+    Raises:
+        ValueError: 가중치가 비어 있거나 합이 0 이하인 경우
+    """
+    weights = np.asarray(weights, dtype=np.float64)
+    if weights.ndim != 1 or weights.size == 0 or np.any(weights < 0) or weights.sum() <= 0:
+        raise ValueError("가중치는 합이 0보다 큰 음수가 아닌 1차원 배열이어야 합니다.")
+    
+    count = weights.size
+    scaled = weights * (count / weights.sum())
+    prob = np.ones(count, dtype=np.float64)
+    alias = np.arange(count, dtype=np.int64)
+    
+    small = [i for i in range(count) if scaled[i] < 1.0]
+    large = [i for i in range(count) if scaled[i] >= 1.0]
+    while small and large:
+        s_idx = small.pop()
+        l_idx = large.pop()
+        prob[s_idx] = scaled[s_idx]
+        alias[s_idx] = l_idx
+        scaled[l_idx] = (scaled[l_idx] + scaled[s_idx]) - 1.0
+        if scaled[l_idx] < 1.0:
+            small.append(l_idx)
+        else:
+            large.append(l_idx)
+    
+    return prob, alias
+
+
+class EmpiricalDelayStrategy(DelayStrategy):
+    """
+    경험적 분포 지연 전략
+    
+    측정된 지연 표본이나 히스토그램에서 요청마다 지연 시간을 뽑음
+    별칭 테이블은 한 번만 만들고, 표본은 NumPy 블록 단위로 미리 생성하여
+    요청 처리 경로에서는 미리 만든 값을 꺼내기만 함
+    """
+    
+    def __init__(self, samples=None, bin_edges=None, counts=None, block_size=4096, seed=None, clock=None):
+        """
+        경험적 분포 지연 전략 초기화
+        
+        samples 또는 (bin_edges, counts) 중 하나를 지정
+        
+        Args:
+            samples (array-like, optional): 지연 표본 목록(초)
+            bin_edges (array-like, optional): 히스토그램 구간 경계(초, 길이 K+1)
+            counts (array-like, optional): 히스토그램 구간별 개수 또는 가중치(길이 K)
+            block_size (int, optional): 한 번에 미리 생성할 표본 수
+            seed (int, optional): 난수 시드
+            clock (Clock, optional): 시간 원천 (기본값: 실제 시계)
+        
+        Raises:
+            ValueError: 분포가 지정되지 않았거나 형식이 올바르지 않은 경우
+        """
+        self.block_size = max(int(block_size), 1)
+        self.seed = seed
+        self.clock = clock or RealClock()
+        
+        if samples is not None:
+            values = np.asarray(samples, dtype=np.float64).ravel()
+            if values.size == 0:
+                raise ValueError("지연 표본이 비어 있습니다.")
+            self._values = values
+            self._bin_widths = None
+            weights = np.ones(values.size)
+        elif bin_edges is not None and counts is not None:
+            edges = np.asarray(bin_edges, dtype=np.float64)
+            weights = np.asarray(counts, dtype=np.float64)
+            if edges.ndim != 1 or edges.size != weights.size + 1 or np.any(np.diff(edges) < 0):
+                raise ValueError("bin_edges는 counts보다 하나 많은 오름차순 경계여야 합니다.")
+            self._values = edges[:-1]
+            self._bin_widths = np.diff(edges)
+        else:
+            raise ValueError("samples 또는 bin_edges와 counts를 지정해야 합니다.")
+        
+        self._prob, self._alias = build_alias_table(weights)
+        self._rng = np.random.default_rng(seed)
+        self._lock = threading.Lock()
+        self._block = []
+        self._position = 0
+        self.current_delay = 0.0
+        self.draws = 0
+    
+    @classmethod
+    def from_file(cls, path, **kwargs):
+        """
+        파일에서 지연 표본을 읽어 전략 생성
+        
+        .npy 배열, JSON 목록 또는 {'samples'|'bin_edges','counts'} 객체,
+        공백/쉼표로 구분된 텍스트 숫자 목록을 지원
+        
+        Args:
+            path (str): 표본 파일 경로
+            **kwargs: 전략 생성자에 전달할 추가 매개변수
+            
+        Returns:
+            EmpiricalDelayStrategy: 생성된 전략
+        """
+        if path.endswith('.npy'):
+            return cls(samples=np.load(path), **kwargs)
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+        
+        if path.endswith('.json'):
+            data = json.loads(text)
+            if isinstance(data, dict):
+                return cls(
+                    samples=data.get('samples'),
+                    bin_edges=data.get('bin_edges'),
+                    counts=data.get('counts'),
+                    **kwargs
+                )
+            return cls(samples=data, **kwargs)
+        
+        return cls(samples=np.array(text.replace(',', ' ').split(), dtype=np.float64), **kwargs)
+    
+    def _refill(self):
+        """
+        별칭 테이블로 표본 블록을 한 번에 생성
+        """
+        size = self.block_size
+        columns = self._rng.integers(0, self._prob.size, size=size)
+        accept = self._rng.random(size) < self._prob[columns]
+        indices = np.where(accept, columns, self._alias[columns])
+        
+        values = self._values[indices]
+        if self._bin_widths is not None:
+            # 히스토그램 구간 안에서 균등하게 위치 선택
+            values = values + self._rng.random(size) * self._bin_widths[indices]
+        
+        self._block = values.tolist()
+        self._position = 0
+    
+    def get_delay(self):
+        with self._lock:
+            if self._position >= len(self._block):
+                self._refill()
+            delay = self._block[self._position]
+            self._position += 1
+            self.draws += 1
+        self.current_delay = delay
+        return delay
+    
+    def peek_delay(self):
+        # 다음 요청이 받을 표본 (소비하지 않음)
+        with self._lock:
+            if self._position >= len(self._block):
+                self._refill()
+            return self._block[self._position]
+    
+    def update(self):
+        # 요청마다 새로 뽑으므로 시간에 따른 상태 변화 없음
+        pass
+    
+    def get_config(self):
+        config = super().get_config()
+        config['params'] = {
+            'distribution': 'histogram' if self._bin_widths is not None else 'samples',
+            'support_size': int(self._prob.size),
+            'block_size': self.block_size,
+            'seed': self.seed,
+            'draws': self.draws,
+            'current_delay': self.current_delay
+        }
+        return config
+
+
+class BandwidthDelayStrategy(DelayStrategy):
+    """
+    대역폭 제한 지연 전략
+    
+    기본 지연과 공유 토큰 버킷으로 제한된 업링크를 모델링
+    요청 크기만큼 토큰을 소비하고, 부족한 토큰이 채워질 때까지 대기 시간이 늘어남
+    토큰 부채를 모든 요청이 공유하므로 동시에 진행 중인 요청이 많을수록 지연이 커짐
+    """
+    
+    def __init__(self, bandwidth_mbps=10.0, base_latency=0.02, bucket_size_bytes=65536, clock=None):
+        """
+        대역폭 제한 지연 전략 초기화
+        
+        Args:
+            bandwidth_mbps (float, optional): 링크 대역폭(Mbps)
+            base_latency (float, optional): 크기와 무관한 기본 지연 시간(초)
+            bucket_size_bytes (int, optional): 토큰 버킷 용량(허용 버스트, 바이트)
+            clock (Clock, optional): 시간 원천 (기본값: 실제 시계)
+        
+        Raises:
+            ValueError: 대역폭이 0 이하인 경우
+        """
+        if bandwidth_mbps <= 0:
+            raise ValueError(f"대역폭은 0보다 커야 합니다: {bandwidth_mbps}")
+        
+        self.bandwidth_mbps = bandwidth_mbps
+        self.base_latency = base_latency
+        self.bucket_size_bytes = bucket_size_bytes
+        self.clock = clock or RealClock()
+        
+        self._rate = bandwidth_mbps * 1_000_000 / 8  # 바이트/초
+        self._lock = threading.Lock()
+        self.tokens = float(bucket_size_bytes)
+        self.last_refill_time = self.clock.now()
+        self.current_delay = base_latency
+        self.total_bytes = 0
+        self.requests = 0
+    
+    def get_delay(self):
+        return self.current_delay
+    
+    def get_request_delay(self, request_info=None):
+        payload_bytes = (request_info or {}).get('payload_bytes', 0)
+        
+        with self._lock:
+            self._refill()
+            # 토큰이 음수(부채)이면 앞선 요청들의 전송이 끝날 때까지 대기
+            self.tokens -= payload_bytes
+            wait = -self.tokens / self._rate if self.tokens < 0 else 0.0
+            self.total_bytes += payload_bytes
+            self.requests += 1
+        
+        self.current_delay = self.base_latency + wait
+        return self.current_delay
+    
+    def _refill(self):
+        """
+        경과 시간만큼 토큰 충전 (버킷 용량 초과분은 버림)
+        """
+        current_time = self.clock.now()
+        elapsed = current_time - self.last_refill_time
+        if elapsed > 0:
+            self.tokens = min(self.tokens + elapsed * self._rate, float(self.bucket_size_bytes))
+            self.last_refill_time = current_time
+    
+    def update(self):
+        with self._lock:
+            self._refill()
+    
+    def get_config(self):
+        config = super().get_config()
+        config['params'] = {
+            'bandwidth_mbps': self.bandwidth_mbps,
+            'base_latency': self.base_latency,
+            'bucket_size_bytes': self.bucket_size_bytes,
+            'backlog_bytes': max(-self.tokens, 0.0),
+            'total_bytes': self.total_bytes,
+            'requests': self.requests,
+            'current_delay': self.current_delay
+        }
+        return config
+
+
+class QueueingDelayStrategy(DelayStrategy):
+    """
+    대기열 모델 혼잡 지연 전략
+    
+    서버를 N개의 가상 처리 슬롯으로 보고, 도착한 프레임이 빈 슬롯을 기다린 뒤
+    서비스 시간 분포에 따라 처리된다고 가정하여 지연을 계산
+    지연은 미리 정한 곡선이 아니라 부하(도착률 x 서비스 시간)에서 만들어짐
+    
+    슬롯별 종료 시각을 최소 힙으로 관리하므로 요청당 O(log N)
+    우선순위 모드에서는 우선순위 단계별로 자신과 더 높은 단계의 부하만 보는 힙을 두어
+    높은 우선순위 프레임이 낮은 우선순위 대기열의 영향을 받지 않게 함 (요청당 O(K log N))
+    """
+    
+    SERVICE_DISTRIBUTIONS = ('fixed', 'exponential', 'lognormal', 'uniform')
+    DISCIPLINES = ('fifo', 'priority')
+    
+    def __init__(self, servers=4, mean_service_time=0.1, service_distribution='exponential',
+                 service_time_sigma=0.5, discipline='fifo', priority_field='cameraId',
+                 priority_levels=2, history_interval=1.0, history_size=600, seed=None, clock=None):
+        """
+        대기열 모델 혼잡 지연 전략 초기화
+        
+        Args:
+            servers (int, optional): 가상 처리 슬롯 수
+            mean_service_time (float, optional): 평균 서비스 시간(초)
+            service_distribution (str, optional): 서비스 시간 분포 ('fixed', 'exponential', 'lognormal', 'uniform')
+            service_time_sigma (float, optional): lognormal 분포의 로그 표준편차
+            discipline (str, optional): 대기열 규칙 ('fifo', 'priority')
+            priority_field (str, optional): 우선순위로 사용할 ID 블록 필드 (0이 가장 높음)
+            priority_levels (int, optional): 우선순위 단계 수
+            history_interval (float, optional): 대기열 길이 기록 간격(초)
+            history_size (int, optional): 보관할 대기열 길이 기록 수
+            seed (int, optional): 난수 시드
+            clock (Clock, optional): 시간 원천 (기본값: 실제 시계)
+        
+        Raises:
+            ValueError: 유효하지 않은 매개변수
+        """
+        if servers < 1:
+            raise ValueError(f"슬롯 수는 1 이상이어야 합니다: {servers}")
+        if mean_service_time <= 0:
+            raise ValueError(f"평균 서비스 시간은 0보다 커야 합니다: {mean_service_time}")
+        if service_time_sigma < 0:
+            raise ValueError(f"로그 표준편차는 0 이상이어야 합니다: {service_time_sigma}")
+        if service_distribution not in self.SERVICE_DISTRIBUTIONS:
+            raise ValueError(f"유효하지 않은 서비스 시간 분포: {service_distribution}")
+        if discipline not in self.DISCIPLINES:
+            raise ValueError(f"유효하지 않은 대기열 규칙: {discipline}")
+        
+        self.servers = int(servers)
+        self.mean_service_time = mean_service_time
+        self.service_distribution = service_distribution
+        self.service_time_sigma = service_time_sigma
+        self.discipline = discipline
+        self.priority_field = priority_field
+        self.priority_levels = max(int(priority_levels), 1) if discipline == 'priority' else 1
+        self.history_interval = history_interval
+        self.seed = seed
+        self.clock = clock or RealClock()
+        
+        self._rng = np.random.default_rng(seed)
+        self._lock = threading.Lock()
+        self.start_time = self.clock.now()
+        
+        # 우선순위 단계별 슬롯 종료 시각 힙 (단계 k는 k 이하 단계의 부하를 반영)
+        self._slot_heaps = [[self.start_time] * self.servers for _ in range(self.priority_levels)]
+        # 아직 서비스를 시작하지 않은 프레임의 시작 시각 힙
+        self._waiting_starts = []
+        
+        self.arrivals = 0
+        self.busy_time = 0.0
+        self.current_delay = 0.0
+        self.queue_history = deque(maxlen=history_size)
+        self._history_bucket = 0
+        self._history_max = 0
+    
+    def _draw_service_time(self):
+        """
+        서비스 시간 분포에서 표본 하나 추출
+        
+        Returns:
+            float: 서비스 시간(초)
+        """
+        mean = self.mean_service_time
+        if self.service_distribution == 'fixed':
+            return mean
+        if self.service_distribution == 'exponential':
+            return float(self._rng.exponential(mean))
+        if self.service_distribution == 'lognormal':
+            sigma = self.service_time_sigma
+            return float(self._rng.lognormal(math.log(mean) - sigma * sigma / 2, sigma))
+        return float(self._rng.uniform(0.0, 2.0 * mean))
+    
+    def _priority_of(self, request_info):
+        """
+        요청의 우선순위 단계 반환
+        
+        Args:
+            request_info (dict): 요청 정보
+            
+        Returns:
+            int: 우선순위 단계 (0이 가장 높음)
+        """
+        if self.priority_levels == 1 or not request_info:
+            return 0
+        try:
+            level = int((request_info.get('ID') or {}).get(self.priority_field, 0))
+        except (TypeError, ValueError):
+            level = 0
+        return min(max(level, 0), self.priority_levels - 1)
+    
+    def get_delay(self):
+        return self.current_delay
+    
+    def get_request_delay(self, request_info=None):
+        level = self._priority_of(request_info)
+        service_time = self._draw_service_time()
+        
+        with self._lock:
+            now = self.clock.now()
+            
+            # 자신의 단계 힙에서 가장 먼저 비는 슬롯 배정
+            heap = self._slot_heaps[level]
+            start = max(now, heapq.heappop(heap))
+            finish = start + service_time
+            heapq.heappush(heap, finish)
+            
+            # 더 낮은 우선순위 단계는 이 프레임의 부하도 함께 봄
+            for lower in self._slot_heaps[level + 1:]:
+                heapq.heappush(lower, max(now, heapq.heappop(lower)) + service_time)
+            
+            if start > now:
+                heapq.heappush(self._waiting_starts, start)
+            self._record_queue_length(now)
+            
+            self.arrivals += 1
+            self.busy_time += service_time
+        
+        self.current_delay = finish - now
+        return self.current_delay
+    
+    def _record_queue_length(self, now):
+        """
+        서비스를 시작한 프레임을 대기열에서 제거하고 기록 구간별 최대 대기열 길이 저장
+        
+        Args:
+            now (float): 현재 시각(초)
+        """
+        waiting = self._waiting_starts
+        while waiting and waiting[0] <= now:
+            heapq.heappop(waiting)
+        
+        bucket = int((now - self.start_time) // self.history_interval) if self.history_interval > 0 else 0
+        if bucket != self._history_bucket:
+            self.queue_history.append([self._history_bucket * self.history_interval, self._history_max])
+            self._history_bucket = bucket
+            self._history_max = 0
+        self._history_max = max(self._history_max, len(waiting))
+    
+    def update(self):
+        with self._lock:
+            self._record_queue_length(self.clock.now())
+    
+    def set_start_time(self, start_time):
+        with self._lock:
+            self.start_time = start_time
+            self._slot_heaps = [[start_time] * self.servers for _ in range(self.priority_levels)]
+            self._waiting_starts = []
+    
+    def get_config(self):
+        with self._lock:
+            now = self.clock.now()
+            self._record_queue_length(now)
+            elapsed = max(now - self.start_time, 1e-9)
+            queue_length = len(self._waiting_starts)
+            history = list(self.queue_history)
+        
+        config = super().get_config()
+        config['params'] = {
+            'servers': self.servers,
+            'mean_service_time': self.mean_service_time,
+            'service_distribution': self.service_distribution,
+            'service_time_sigma': self.service_time_sigma,
+            'discipline': self.discipline,
+            'priority_field': self.priority_field,
+            'priority_levels': self.priority_levels,
+            'arrivals': self.arrivals,
+            'queue_length': queue_length,
+            'offered_load': self.arrivals * self.mean_service_time / (elapsed * self.servers),
+            'utilization': min(self.busy_time / (elapsed * self.servers), 1.0),
+            'queue_history': history,
+            'current_delay': self.current_delay
+        }
+        return config
+
+
+class GilbertElliottDelayStrategy(DelayStrategy):
+    """
+    Gilbert-Elliott 버스트 손실 전략
+    
+    양호(good)와 불량(bad) 두 상태를 갖는 마르코프 체인으로 연속 손실을 모델링
+    요청마다 상태 전이를 한 번 수행하고, 양호 상태에서는 정상 지연을,
+    불량 상태에서는 요청 손실(RequestDropped)을 발생시킴
+    
+    손실은 연결 리셋 대신 HTTP 응답으로 표현됨: 'abort'는 즉시 본문 없는 503 + 'Connection: close',
+    'hang'은 hang_seconds 동안 무응답 후 504 (RequestDropped 참고)
+    """
+    
+    DROP_MODES = ('abort', 'hang')
+    
+    def __init__(self, p_good_to_bad=0.05, p_bad_to_good=0.3, good_delay=0.05, good_jitter=0.0,
+                 bad_loss_probability=1.0, bad_delay=1.0, drop_mode='abort', hang_seconds=10.0,
+                 seed=None, clock=None):
+        """
+        Gilbert-Elliott 버스트 손실 전략 초기화
+        
+        Args:
+            p_good_to_bad (float, optional): 양호 → 불량 전이 확률(요청당)
+            p_bad_to_good (float, optional): 불량 → 양호 전이 확률(요청당)
+            good_delay (float, optional): 양호 상태 지연 시간(초)
+            good_jitter (float, optional): 양호 상태 지연에 더할 균등 분포 지터 최대값(초)
+            bad_loss_probability (float, optional): 불량 상태에서 요청을 손실할 확률
+            bad_delay (float, optional): 불량 상태에서 손실되지 않은 요청의 지연 시간(초)
+            drop_mode (str, optional): 손실 방식 ('abort': 즉시 끊음, 'hang': 응답 없이 대기 후 끊음)
+            hang_seconds (float, optional): 'hang' 방식에서 응답하지 않을 시간(초)
+            seed (int, optional): 난수 시드
+            clock (Clock, optional): 시간 원천 (기본값: 실제 시계)
+        
+        Raises:
+            ValueError: 유효하지 않은 손실 방식, [0, 1] 밖의 확률 또는 음수 지연/지터/대기 시간
+        """
+        if drop_mode not in self.DROP_MODES:
+            raise ValueError(f"유효하지 않은 손실 방식: {drop_mode}")
+        for name, value in (('p_good_to_bad', p_good_to_bad), ('p_bad_to_good', p_bad_to_good),
+                            ('bad_loss_probability', bad_loss_probability)):
+            if not 0.0 <= value <= 1.0:
+                raise ValueError(f"{name}은(는) 0과 1 사이여야 합니다: {value}")
+        for name, value in (('good_delay', good_delay), ('good_jitter', good_jitter),
+                            ('bad_delay', bad_delay), ('hang_seconds', hang_seconds)):
+            if value < 0:
+                raise ValueError(f"{name}은(는) 0 이상이어야 합니다: {value}")
+        
+        self.p_good_to_bad = p_good_to_bad
+        self.p_bad_to_good = p_bad_to_good
+        self.good_delay = good_delay
+        self.good_jitter = good_jitter
+        self.bad_loss_probability = bad_loss_probability
+        self.bad_delay = bad_delay
+        self.drop_mode = drop_mode
+        self.hang_seconds = hang_seconds
+        self.seed = seed
+        self.clock = clock or RealClock()
+        
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.state = 'good'
+        self.state_since = self.clock.now()
+        self.state_time = {'good': 0.0, 'bad': 0.0}
+        self.state_requests = {'good': 0, 'bad': 0}
+        self.drops = 0
+        self.current_delay = good_delay
+    
+    def _transition(self, now):
+        """
+        상태 전이 1회 수행 및 상태별 체류 시간 누적
+        
+        Args:
+            now (float): 현재 시각(초)
+        """
+        p = self.p_good_to_bad if self.state == 'good' else self.p_bad_to_good
+        if self._random.random() < p:
+            self.state_time[self.state] += now - self.state_since
+            self.state = 'bad' if self.state == 'good' else 'good'
+            self.state_since = now
+    
+    def get_delay(self):
+        return self.current_delay
+    
+    def get_request_delay(self, request_info=None):
+        with self._lock:
+            self._transition(self.clock.now())
+            state = self.state
+            self.state_requests[state] += 1
+            
+            if state == 'bad' and self._random.random() < self.bad_loss_probability:
+                self.drops += 1
+                raise RequestDropped(self.drop_mode, self.hang_seconds if self.drop_mode == 'hang' else 0.0)
+            
+            if state == 'good':
+                delay = self.good_delay + self._random.uniform(0.0, self.good_jitter)
+            else:
+                delay = self.bad_delay
+        
+        self.current_delay = delay
+        return delay
+    
+    def update(self):
+        # 상태 전이는 요청 단위로 get_request_delay()에서 수행
+        pass
+    
+    def get_config(self):
+        with self._lock:
+            now = self.clock.now()
+            state_time = dict(self.state_time)
+            state_time[self.state] += now - self.state_since
+            state_requests = dict(self.state_requests)
+        
+        total_time = sum(state_time.values())
+        total_requests = sum(state_requests.values())
+        
+        config = super().get_config()
+        config['params'] = {
+            'p_good_to_bad': self.p_good_to_bad,
+            'p_bad_to_good': self.p_bad_to_good,
+            'good_delay': self.good_delay,
+            'good_jitter': self.good_jitter,
+            'bad_loss_probability': self.bad_loss_probability,
+            'bad_delay': self.bad_delay,
+            'drop_mode': self.drop_mode,
+            'hang_seconds': self.hang_seconds,
+            'state': self.state,
+            'drops': self.drops,
+            'state_requests': state_requests,
+            'state_time': state_time,
+            'bad_time_ratio': state_time['bad'] / total_time if total_time > 0 else 0.0,
+            'bad_request_ratio': state_requests['bad'] / total_requests if total_requests else 0.0,
+            'current_delay': self.current_delay
+        }
+        return config
+
+
+class ReorderDelayStrategy(DelayStrategy):
+    """
+    응답 순서 뒤바뀜 전략
+    
+    같은 스트림(shipID, UserID, cameraId)의 응답 해제 시각을 스트림별로 스케줄링
+    기본적으로 요청 순서대로 해제하되, reorder_rate 확률로 응답을 hold_delay만큼 더 붙잡아
+    뒤이은 imageID의 응답이 앞선 응답을 추월하도록 함
+    """
+    
+    def __init__(self, base_delay=0.1, jitter=0.05, reorder_rate=0.1, hold_delay=0.2,
+                 stream_fields=('shipID', 'UserID', 'cameraId'), max_streams=256, seed=None, clock=None):
+        """
+        응답 순서 뒤바뀜 전략 초기화
+        
+        Args:
+            base_delay (float, optional): 기본 지연 시간(초)
+            jitter (float, optional): 요청별로 더할 균등 분포 지터 최대값(초)
+            reorder_rate (float, optional): 응답을 붙잡아 추월당하게 할 확률
+            hold_delay (float, optional): 붙잡은 응답에 더할 지연 시간(초)
+            stream_fields (tuple, optional): 스트림을 구분하는 ID 블록 필드
+            max_streams (int, optional): 상태를 보관할 최대 스트림 수 (초과 시 가장 오래된 스트림 제거)
+            seed (int, optional): 난수 시드
+            clock (Clock, optional): 시간 원천 (기본값: 실제 시계)
+        """
+        self.base_delay = base_delay
+        self.jitter = jitter
+        self.reorder_rate = reorder_rate
+        self.hold_delay = hold_delay
+        self.stream_fields = tuple(stream_fields)
+        self.max_streams = max_streams
+        self.seed = seed
+        self.clock = clock or RealClock()
+        
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._streams = OrderedDict()
+        self.requests = 0
+        self.held = 0
+        self.overtakes = 0
+        self.current_delay = base_delay
+    
+    def _stream_of(self, request_info):
+        """
+        요청이 속한 스트림 상태 반환 (없으면 생성)
+        
+        Args:
+            request_info (dict): 요청 정보
+            
+        Returns:
+            dict: 스트림 상태 ('last_release': 순서 유지 응답의 마지막 해제 시각, 'pending': 해제 대기 중인 시각 목록)
+        """
+        id_block = (request_info or {}).get('ID') or {}
+        key = tuple(id_block.get(field) for field in self.stream_fields)
+        
+        stream = self._streams.get(key)
+        if stream is None:
+            stream = {'last_release': 0.0, 'pending': []}
+            self._streams[key] = stream
+            if len(self._streams) > self.max_streams:
+                self._streams.popitem(last=False)
+        else:
+            self._streams.move_to_end(key)
+        return stream
+    
+    def get_delay(self):
+        return self.current_delay
+    
+    def get_request_delay(self, request_info=None):
+        with self._lock:
+            now = self.clock.now()
+            stream = self._stream_of(request_info)
+            release = now + self.base_delay + self._random.uniform(0.0, self.jitter)
+            
+            if self._random.random() < self.reorder_rate:
+                # 순서 유지 체인에서 빠져 뒤이은 응답에 추월당함
+                release += self.hold_delay
+                self.held += 1
+            else:
+                release = max(release, stream['last_release'])
+                stream['last_release'] = release
+            
+            # 아직 해제되지 않은 앞선 응답보다 먼저 해제되면 추월
+            pending = [t for t in stream['pending'] if t > now]
+            self.overtakes += sum(1 for t in pending if t > release)
+            pending.append(release)
+            stream['pending'] = pending
+            self.requests += 1
+        
+        self.current_delay = release - now
+        return self.current_delay
+    
+    def update(self):
+        # 해제 시각은 요청 단위로 get_request_delay()에서 계산
+        pass
+    
+    def get_config(self):
+        config = super().get_config()
+        config['params'] = {
+            'base_delay': self.base_delay,
+            'jitter': self.jitter,
+            'reorder_rate': self.reorder_rate,
+            'hold_delay': self.hold_delay,
+            'stream_fields': list(self.stream_fields),
+            'max_streams': self.max_streams,
+            'streams': len(self._streams),
+            'requests': self.requests,
+            'held': self.held,
+            'overtakes': self.overtakes,
+            'current_delay': self.current_delay
+        }
+        return config
+
+
+class TimelineDelayStrategy(DelayStrategy):
+    """
+    시나리오 타임라인 전략
+    
+    여러 전략을 순서대로 이어 붙인 구간(segments)과, 구간 위에 더해지는 중첩 전략(overlays)을
+    하나의 타임라인으로 실행
+    생성 시 모든 구간/중첩 경계를 정렬된 구간 표로 한 번 컴파일하고,
+    요청마다 커서로 현재 구간만 확인하므로 요청당 비용은 타임라인 복잡도와 무관
+    """
+    
+    def __init__(self, segments, factory, overlays=None, loop=False, clock=None):
+        """
+        시나리오 타임라인 전략 초기화
+        
+        Args:
+            segments (list): 구간 목록 ({'strategy': 전략 이름, 'params': 매개변수, 'duration': 지속 시간(초)})
+            factory (callable): (전략 이름, 매개변수)로 전략 객체를 만드는 함수
+            overlays (list, optional): 중첩 전략 목록 ({'strategy', 'params', 'start': 시작 시각(초), 'end': 종료 시각(초)})
+            loop (bool, optional): 타임라인 끝에서 처음으로 돌아갈지 여부 (False이면 마지막 구간 유지)
+            clock (Clock, optional): 시간 원천 (기본값: 실제 시계)
+        
+        Raises:
+            ValueError: 구간이 없거나 지속 시간/중첩 범위가 유효하지 않은 경우
+        """
+        if not segments:
+            raise ValueError("타임라인에는 최소 하나의 구간이 필요합니다.")
+        
+        self.segment_specs = [dict(spec) for spec in segments]
+        self.overlay_specs = [dict(spec) for spec in overlays or []]
+        self.loop = loop
+        self.clock = clock or RealClock()
+        
+        # 구간 전략 생성 및 시작 시각 계산
+        self._segments = []
+        self._segment_starts = []
+        elapsed = 0.0
+        for spec in self.segment_specs:
+            duration = float(spec.get('duration', 0))
+            if duration <= 0:
+                raise ValueError(f"구간 지속 시간은 0보다 커야 합니다: {spec}")
+            self._segment_starts.append(elapsed)
+            self._segments.append(factory(spec.get('strategy'), spec.get('params') or {}))
+            elapsed += duration
+        self.total_duration = elapsed
+        
+        # 중첩 전략 생성
+        self._overlays = []
+        self._overlay_ranges = []
+        for spec in self.overlay_specs:
+            start = float(spec.get('start', 0.0))
+            end = float(spec['end']) if spec.get('end') is not None else math.inf
+            if end <= start:
+                raise ValueError(f"중첩 종료 시각은 시작 시각보다 커야 합니다: {spec}")
+            self._overlay_ranges.append((start, end))
+            self._overlays.append(factory(spec.get('strategy'), spec.get('params') or {}))
+        
+        self._compile()
+        self.set_start_time(self.clock.now())
+    
+    def _compile(self):
+        """
+        구간/중첩 경계를 정렬된 구간 표로 컴파일
+        
+        표의 각 항목은 (시작 시각, 구간 인덱스, 활성 중첩 인덱스 튜플)이며
+        마지막 항목은 타임라인 끝까지(반복하지 않으면 무한히) 유지됨
+        """
+        horizon = self.total_duration if self.loop else math.inf
+        points = set(self._segment_starts)
+        for start, end in self._overlay_ranges:
+            for point in (start, end):
+                if point < horizon:
+                    points.add(point)
+        
+        self._interval_starts = sorted(points)
+        self._intervals = []
+        for point in self._interval_starts:
+            segment = min(bisect.bisect_right(self._segment_starts, point) - 1, len(self._segments) - 1)
+            active = tuple(i for i, (start, end) in enumerate(self._overlay_ranges) if start <= point < end)
+            self._intervals.append((segment, active))
+    
+    def set_start_time(self, start_time):
+        self.origin = start_time
+        self._cycle_origin = start_time
+        self._cursor = 0
+        self._active_segment = None
+        self._active_overlays = ()
+        self.current_delay = 0.0
+        self._advance(self.clock.now())
+    
+    def _advance(self, now):
+        """
+        현재 시각의 구간으로 커서 이동 및 새로 활성화된 전략의 시작 시각 설정
+        
+        Args:
+            now (float): 현재 시각(초)
+        """
+        elapsed = now - self._cycle_origin
+        if self.loop and elapsed >= self.total_duration:
+            cycles = int(elapsed // self.total_duration)
+            self._cycle_origin += cycles * self.total_duration
+            elapsed -= cycles * self.total_duration
+            self._cursor = 0
+            self._active_segment = None
+            self._active_overlays = ()
+        
+        # 대부분의 요청은 같은 구간에 머물거나 다음 구간으로 한 칸 이동
+        starts = self._interval_starts
+        cursor = self._cursor
+        if elapsed < starts[cursor]:
+            cursor = max(bisect.bisect_right(starts, elapsed) - 1, 0)
+        else:
+            while cursor + 1 < len(starts) and starts[cursor + 1] <= elapsed:
+                cursor += 1
+        self._cursor = cursor
+        
+        segment, overlays = self._intervals[cursor]
+        if segment != self._active_segment:
+            self._segments[segment].set_start_time(self._cycle_origin + self._segment_starts[segment])
+            self._active_segment = segment
+        if overlays != self._active_overlays:
+            for index in overlays:
+                if index not in self._active_overlays:
+                    self._overlays[index].set_start_time(self._cycle_origin + self._overlay_ranges[index][0])
+            self._active_overlays = overlays
+    
+    def get_delay(self):
+        delay = self._segments[self._active_segment].get_delay()
+        for index in self._active_overlays:
+            delay += self._overlays[index].get_delay()
+        return delay
+    
+    def peek_delay(self):
+        delay = self._segments[self._active_segment].peek_delay()
+        for index in self._active_overlays:
+            delay += self._overlays[index].peek_delay()
+        return delay
+    
+    def get_request_delay(self, request_info=None):
+        delay = self._segments[self._active_segment].get_request_delay(request_info)
+        for index in self._active_overlays:
+            delay += self._overlays[index].get_request_delay(request_info)
+        self.current_delay = delay
+        return delay
+    
+    def update(self):
+        self._advance(self.clock.now())
+        self._segments[self._active_segment].update()
+        for index in self._active_overlays:
+            self._overlays[index].update()
+    
+    def get_config(self):
+        config = super().get_config()
+        config['params'] = {
+            'segments': self.segment_specs,
+            'overlays': self.overlay_specs,
+            'loop': self.loop,
+            'total_duration': self.total_duration,
+            'elapsed': self.clock.now() - self.origin,
+            'active_segment': self._active_segment,
+            'active_overlays': list(self._active_overlays),
             'current_delay': self.current_delay
         }
         return config
@@ -0,0 +1,165 @@
+"""
+지연 타이밍 유틸리티
+
+단조 시계(time.monotonic_ns) 기반의 대기 함수와 지연 오차 분포 집계를 제공
+"""
+
+import time
+import threading
+from collections import deque
+
+import numpy as np
+
+from app.services.delay_metrics import LatencyHistogram
+
+# 정밀 대기 시 스핀으로 전환하는 남은 시간 기준 (나노초)
+DEFAULT_SPIN_THRESHOLD_NS = 2_000_000
+
+# 오차 분포 계산에 보관하는 최근 샘플 수
+MAX_ERROR_SAMPLES = 10000
+
+
+def sleep_until(deadline_ns, precise=False, spin_threshold_ns=DEFAULT_SPIN_THRESHOLD_NS, event=None):
+    """
+    단조 시계 기준 마감 시각까지 대기
+
+    정밀 모드에서는 마감 직전까지 거친 대기를 한 뒤,
+    남은 구간은 스핀(time.sleep(0)으로 GIL 양보)으로 대기하여 초과 지연을 줄임
+    event가 주어지면 대기 중 event가 설정될 때 즉시 깨어남
+
+    Args:
+        deadline_ns (int): time.monotonic_ns() 기준 마감 시각(나노초)
+        precise (bool, optional): 정밀 대기 모드 사용 여부
+        spin_threshold_ns (int, optional): 스핀 대기로 전환하는 남은 시간(나노초)
+        event (threading.Event, optional): 대기를 중단시키는 이벤트
+
+    Returns:
+        bool: event로 인해 마감 전에 깨어난 경우 True
+    """
+    remaining_ns = deadline_ns - time.monotonic_ns()
+    if remaining_ns <= 0:
+        return False
+
+    # 거친 대기: 정밀 모드에서는 스핀 구간 직전까지만 대기
+    coarse_ns = remaining_ns - spin_threshold_ns if precise else remaining_ns
+    if coarse_ns > 0:
+        if event is None:
+            time.sleep(coarse_ns / 1_000_000_000)
+        elif event.wait(coarse_ns / 1_000_000_000):
+            return True
+
+    if not precise:
+        return False
+
+    # 정밀 대기: 마감 시각까지 스핀
+    while time.monotonic_ns() < deadline_ns:
+        if event is not None and event.is_set():
+            return True
+        time.sleep(0)
+    return False
+
+
+class DelayErrorStats:
+    """
+    지연 오차 통계
+
+    요청된 지연 시간과 실제 대기 시간의 부호 있는 차이(실제 - 요청)를 기록하는 단일 집계기
+    최근 샘플로 전체 분포를 계산하고, 전략별로 초과(overshoot)와 미달(undershoot) 히스토그램을 따로 유지
+    """
+
+    def __init__(self, max_samples=MAX_ERROR_SAMPLES, bucket_bounds_ms=None):
+        """
+        지연 오차 통계 초기화
+
+        Args:
+            max_samples (int, optional): 분포 계산에 보관할 최근 샘플 수
+            bucket_bounds_ms (list, optional): 전략별 히스토그램 버킷 상한 목록(밀리초)
+        """
+        self.bucket_bounds_ms = bucket_bounds_ms
+        self._lock = threading.Lock()
+        self._samples = deque(maxlen=max_samples)
+        self._by_strategy = {}
+        self.count = 0
+
+    def record(self, requested_ns, actual_ns, strategy_name=None):
+        """
+        지연 오차 기록
+
+        Args:
+            requested_ns (int): 요청된 지연 시간(나노초)
+            actual_ns (int): 실제 대기 시간(나노초)
+            strategy_name (str, optional): 지연을 선택한 전략 이름 (지정하면 전략별 히스토그램에도 기록)
+        """
+        error_ns = actual_ns - requested_ns
+        with self._lock:
+            self._samples.append(error_ns)
+            self.count += 1
+            if strategy_name is None:
+                return
+            histograms = self._by_strategy.get(strategy_name)
+            if histograms is None:
+                histograms = {
+                    'overshoot': LatencyHistogram(self.bucket_bounds_ms),
+                    'undershoot': LatencyHistogram(self.bucket_bounds_ms)
+                }
+                self._by_strategy[strategy_name] = histograms
+            if error_ns >= 0:
+                histograms['overshoot'].add(error_ns / 1_000_000)
+            else:
+                histograms['undershoot'].add(-error_ns / 1_000_000)
+
+    def reset(self):
+        """
+        기록된 오차 초기화
+        """
+        with self._lock:
+            self._samples.clear()
+            self._by_strategy = {}
+            self.count = 0
+
+    def histograms(self, strategy_name):
+        """
+        전략별 초과/미달 히스토그램 반환
+
+        Args:
+            strategy_name (str): 전략 이름
+
+        Returns:
+            dict: {'overshoot': 히스토그램, 'undershoot': 히스토그램} (미달은 절대값, 기록이 없으면 빈 히스토그램)
+        """
+        with self._lock:
+            histograms = self._by_strategy.get(strategy_name)
+            if histograms is None:
+                histograms = {
+                    'overshoot': LatencyHistogram(self.bucket_bounds_ms),
+                    'undershoot': LatencyHistogram(self.bucket_bounds_ms)
+                }
+            return {key: hist.to_dict() for key, hist in histograms.items()}
+
+    def summary(self):
+        """
+        오차 분포 요약 반환
+
+        Returns:
+            dict: 샘플 수와 부호 있는 오차 분포(밀리초, 음수는 요청보다 일찍 끝난 대기)
+        """
+        with self._lock:
+            samples = np.array(self._samples, dtype=np.int64)
+            count = self.count
+
+        if samples.size == 0:
+            return {'count': count, 'window': 0}
+
+        errors_ms = samples / 1_000_000
+        p50, p90, p99 = np.percentile(errors_ms, [50, 90, 99])
+        return {
+            'count': count,
+            'window': int(samples.size),
+            'mean_ms': float(errors_ms.mean()),
+            'min_ms': float(errors_ms.min()),
+            'p50_ms': float(p50),
+            'p90_ms': float(p90),
+            'p99_ms': float(p99),
+            'max_ms': float(errors_ms.max()),
+            'undershoot_count': int(np.count_nonzero(samples < 0))
+        }
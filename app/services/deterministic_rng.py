@@ -0,0 +1,180 @@
+"""
+카운터 기반 결정적 난수
+
+(시드, 키) 조합을 splitmix64로 해시하여 난수를 만들므로 내부 상태가 없음
+같은 시드와 같은 프레임 식별 정보는 어느 프로세스, 어느 순서로 호출하더라도 같은 값을 만듦
+"""
+
+import struct
+import hashlib
+
+import numpy as np
+
+_MASK64 = (1 << 64) - 1
+_GOLDEN = 0x9E3779B97F4A7C15
+_MIX1 = 0xBF58476D1CE4E5B9
+_MIX2 = 0x94D049BB133111EB
+_INV_2_53 = 1.0 / (1 << 53)
+
+
+def splitmix64(x):
+    """
+    splitmix64 혼합 함수 (64비트 정수 → 64비트 정수)
+
+    Args:
+        x (int): 입력 값
+
+    Returns:
+        int: 혼합된 64비트 값
+    """
+    x = (x + _GOLDEN) & _MASK64
+    x = ((x ^ (x >> 30)) * _MIX1) & _MASK64
+    x = ((x ^ (x >> 27)) * _MIX2) & _MASK64
+    return x ^ (x >> 31)
+
+
+def _splitmix64_array(x):
+    """
+    splitmix64 혼합 함수 (uint64 배열, 오버플로는 2^64로 감싸짐)
+
+    Args:
+        x (numpy.ndarray): uint64 배열
+
+    Returns:
+        numpy.ndarray: 혼합된 uint64 배열
+    """
+    x = x + np.uint64(_GOLDEN)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(_MIX1)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(_MIX2)
+    return x ^ (x >> np.uint64(31))
+
+
+def _key_part(part):
+    """
+    키 구성 요소를 64비트 정수로 변환 (프로세스 간 동일한 값 보장)
+
+    Args:
+        part (int, float, str, bytes, None): 키 구성 요소
+
+    Returns:
+        int: 64비트 정수
+    """
+    if isinstance(part, bool) or part is None:
+        return int(bool(part))
+    if isinstance(part, int):
+        return part & _MASK64
+    if isinstance(part, float):
+        return struct.unpack('<Q', struct.pack('<d', part))[0]
+    if isinstance(part, str):
+        part = part.encode('utf-8')
+    return int.from_bytes(hashlib.blake2b(bytes(part), digest_size=8).digest(), 'little')
+
+
+def key_hash(seed, *key):
+    """
+    시드와 키를 하나의 64비트 해시로 결합
+
+    Args:
+        seed (int): 시드
+        *key: 키 구성 요소 (예: 'pose', shipID, UserID, cameraId, imageID)
+
+    Returns:
+        int: 64비트 해시
+    """
+    h = splitmix64(_key_part(seed))
+    for part in key:
+        h = splitmix64(h ^ _key_part(part))
+    return h
+
+
+class CounterRNG:
+    """
+    카운터 기반 난수 생성기
+
+    키마다 독립된 난수열을 가지며, 키 뒤의 카운터(0, 1, 2, ...)로 값을 구분
+    """
+
+    def __init__(self, seed=0):
+        """
+        카운터 기반 난수 생성기 초기화
+
+        Args:
+            seed (int, optional): 시드
+        """
+        self.seed = seed
+
+    def random(self, *key, counter=0):
+        """
+        [0, 1) 범위의 난수 반환
+
+        Args:
+            *key: 키 구성 요소
+            counter (int, optional): 키 내 카운터
+
+        Returns:
+            float: 난수
+        """
+        return (splitmix64(key_hash(self.seed, *key) ^ counter) >> 11) * _INV_2_53
+
+    def uniform(self, low, high, *key, counter=0):
+        """
+        [low, high) 범위의 균등 난수 반환
+
+        Args:
+            low (float): 하한
+            high (float): 상한
+            *key: 키 구성 요소
+            counter (int, optional): 키 내 카운터
+
+        Returns:
+            float: 난수
+        """
+        return low + (high - low) * self.random(*key, counter=counter)
+
+    def random_array(self, count, *key):
+        """
+        카운터 0..count-1에 대한 [0, 1) 난수 배열 반환 (random()과 같은 값)
+
+        Args:
+            count (int): 난수 개수
+            *key: 키 구성 요소
+
+        Returns:
+            numpy.ndarray: float64 난수 배열
+        """
+        counters = np.arange(count, dtype=np.uint64)
+        bits = _splitmix64_array(np.uint64(key_hash(self.seed, *key)) ^ counters)
+        return (bits >> np.uint64(11)).astype(np.float64) * _INV_2_53
+
+    def uniform_array(self, count, low, high, *key):
+        """
+        카운터 0..count-1에 대한 [low, high) 균등 난수 배열 반환
+
+        Args:
+            count (int): 난수 개수
+            low (float 또는 numpy.ndarray): 하한
+            high (float 또는 numpy.ndarray): 상한
+            *key: 키 구성 요소
+
+        Returns:
+            numpy.ndarray: float64 난수 배열
+        """
+        return low + (high - low) * self.random_array(count, *key)
+
+    def random_rows(self, keys, count):
+        """
+        키 목록의 각 키마다 카운터 0..count-1 난수를 한 행으로 만든 (N, count) 배열 반환
+
+        행 i는 random_array(count, *keys[i])와 같은 값
+
+        Args:
+            keys (list): 키 튜플 목록
+            count (int): 행당 난수 개수
+
+        Returns:
+            numpy.ndarray: (N, count) float64 난수 배열
+        """
+        hashes = np.fromiter((key_hash(self.seed, *key) for key in keys), dtype=np.uint64, count=len(keys))
+        counters = np.arange(count, dtype=np.uint64)
+        bits = _splitmix64_array(hashes[:, None] ^ counters[None, :])
+        return (bits >> np.uint64(11)).astype(np.float64) * _INV_2_53
@@ -0,0 +1,191 @@
+"""
+카메라별 최신 프레임 우선 처리
+
+(shipID, UserID, cameraId) 스트림마다 한 번에 한 프레임만 처리하고, 처리 중에 도착한 프레임은
+가장 최신 프레임 하나만 대기시킴
+대기 중인 프레임보다 새로운 timestamp_ns가 도착하면 대기 중이던 프레임은 처리하지 않고 즉시 '대체됨'으로 응답하므로
+지연이나 느린 파이프라인으로 프레임이 밀릴 때 오래된 프레임에 CPU를 쓰지 않음
+"""
+
+import threading
+from collections import OrderedDict
+
+
+class _StreamSlot:
+    """
+    스트림 하나의 처리 상태
+    """
+
+    __slots__ = ('busy', 'latest_ns', 'pending')
+
+    def __init__(self):
+        self.busy = False
+        self.latest_ns = None
+        self.pending = None
+
+
+class _Waiter:
+    """
+    처리 차례를 기다리는 프레임
+    """
+
+    __slots__ = ('event', 'superseded')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.superseded = False
+
+
+class FrameCoalescer:
+    """
+    카메라별 최신 프레임 우선 처리기
+    """
+
+    def __init__(self, enabled=False, restart_gap=10.0, max_streams=10000):
+        """
+        카메라별 최신 프레임 우선 처리기 초기화
+
+        Args:
+            enabled (bool, optional): 사용 여부
+            restart_gap (float, optional): 최신 프레임보다 이 시간(초) 이상 오래된 프레임은 클라이언트 재시작으로 간주하여 처리
+            max_streams (int, optional): 상태를 보관할 최대 유휴 스트림 수
+        """
+        self._lock = threading.Lock()
+        self._streams = OrderedDict()
+        self.configure(enabled=enabled, restart_gap=restart_gap, max_streams=max_streams)
+        self.reset_stats()
+
+    def configure(self, **params):
+        """
+        설정 변경 (지정한 항목만 변경)
+
+        Args:
+            **params: enabled, restart_gap, max_streams
+
+        Raises:
+            ValueError: 알 수 없는 설정 또는 범위를 벗어난 값
+        """
+        allowed = ('enabled', 'restart_gap', 'max_streams')
+        for key in params:
+            if key not in allowed:
+                raise ValueError(f"알 수 없는 프레임 병합 설정: {key}")
+        if 'restart_gap' in params and params['restart_gap'] <= 0:
+            raise ValueError(f"restart_gap은 0보다 커야 합니다: {params['restart_gap']}")
+        if 'max_streams' in params and params['max_streams'] < 1:
+            raise ValueError(f"max_streams는 1 이상이어야 합니다: {params['max_streams']}")
+        with self._lock:
+            for key, value in params.items():
+                setattr(self, key, bool(value) if key == 'enabled' else value)
+
+    def reset_stats(self):
+        """
+        통계 초기화
+        """
+        with self._lock:
+            self.admitted = 0
+            self.superseded = 0
+            self.stale = 0
+
+    @staticmethod
+    def stream_key(image_data):
+        """
+        요청 데이터에서 스트림 키 추출
+
+        Args:
+            image_data (dict): 요청 JSON 데이터
+
+        Returns:
+            tuple: (shipID, UserID, cameraId)
+        """
+        id_data = image_data.get('ID') or {}
+        return (id_data.get('shipID', 0), id_data.get('UserID', 0), id_data.get('cameraId', 0))
+
+    def acquire(self, key, timestamp_ns):
+        """
+        스트림의 처리 차례를 얻음 (다른 프레임이 처리 중이면 끝날 때까지 대기)
+
+        True를 반환한 경우 처리 후 반드시 release()를 호출해야 함
+
+        Args:
+            key (tuple): 스트림 키
+            timestamp_ns (int): 프레임 타임스탬프(나노초)
+
+        Returns:
+            bool: 처리 여부 (더 새로운 프레임에 대체되었으면 False)
+        """
+        with self._lock:
+            slot = self._streams.get(key)
+            if slot is None:
+                slot = self._streams[key] = _StreamSlot()
+            self._streams.move_to_end(key)
+
+            if slot.latest_ns is not None and timestamp_ns < slot.latest_ns:
+                if slot.latest_ns - timestamp_ns < self.restart_gap * 1_000_000_000:
+                    # 이미 더 새로운 프레임을 받은 스트림의 오래된 프레임
+                    self.stale += 1
+                    return False
+            slot.latest_ns = timestamp_ns
+
+            if not slot.busy:
+                slot.busy = True
+                self.admitted += 1
+                return True
+
+            # 대기 중이던 이전 프레임은 이 프레임으로 대체
+            if slot.pending is not None:
+                slot.pending.superseded = True
+                slot.pending.event.set()
+                self.superseded += 1
+            waiter = slot.pending = _Waiter()
+
+        waiter.event.wait()
+        if not waiter.superseded:
+            with self._lock:
+                self.admitted += 1
+        return not waiter.superseded
+
+    def release(self, key):
+        """
+        처리가 끝난 스트림의 차례를 대기 중인 최신 프레임에 넘김
+
+        Args:
+            key (tuple): 스트림 키
+        """
+        with self._lock:
+            slot = self._streams.get(key)
+            if slot is None:
+                return
+            if slot.pending is not None:
+                waiter, slot.pending = slot.pending, None
+                waiter.event.set()
+                return
+            slot.busy = False
+            self._evict_idle()
+
+    def _evict_idle(self):
+        """
+        유휴 스트림이 max_streams를 넘으면 오래 사용되지 않은 유휴 스트림부터 제거 (잠금을 잡은 상태에서 호출)
+        """
+        excess = len(self._streams) - self.max_streams
+        if excess <= 0:
+            return
+        for key in [key for key, slot in self._streams.items() if not slot.busy][:excess]:
+            del self._streams[key]
+
+    def get_config(self):
+        """
+        설정과 통계 반환
+
+        Returns:
+            dict: 설정, 처리/대체/오래된 프레임 수, 스트림 수
+        """
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'restart_gap': self.restart_gap,
+                'max_streams': self.max_streams,
+                'streams': len(self._streams),
+                'admitted': self.admitted,
+                'superseded': self.superseded,
+                'stale': self.stale
+            }
@@ -0,0 +1,274 @@
+"""
+다중 카메라 프레임 그룹화
+
+한 사용자(shipID, UserID)가 여러 카메라로 거의 같은 시각에 보낸 FramePacket을 시간 창 안에서 모아
+포즈 파이프라인을 한 번의 배치 실행(PosePipeline.run_batch())으로 수행하고, 카메라별 결과와 함께 융합 포즈를 반환
+카메라별 결과는 그룹화하지 않은 요청과 같은 단계(추적, 영역, 좌표계 변환 등)를 거친 같은 형식이며,
+측위처럼 배치 구현이 있는 단계는 그룹의 모든 프레임을 한 번에 처리함
+처음 도착한 프레임의 요청 스레드가 그룹을 대표하여 창이 닫힐 때까지 기다린 뒤 처리하므로
+추가 지연은 최대 window_ms이며, 열린 그룹 수와 그룹 크기가 제한되어 메모리 사용량도 제한됨
+"""
+
+import time
+import threading
+
+import numpy as np
+
+from app.models.frame_packet import PoseBlock
+from app.services.pose_math import quat_average
+from app.services.pose_pipeline import default_pipeline
+from app.services.zone_index import get_zone_index
+from app.services.transform_graph import default_graph
+
+# 융합 포즈 반환 방식
+GROUPING_MODES = ('alongside', 'replace')
+
+
+class _FrameGroup:
+    """
+    시간 창 안에서 모인 한 사용자의 프레임 묶음
+    """
+
+    __slots__ = ('frames', 'cameras', 'overrides', 'output_frame', 'subject', 'full', 'done', 'started',
+                 'results', 'fused', 'error')
+
+    def __init__(self, overrides=None, output_frame=None, subject=None):
+        self.frames = []
+        self.cameras = set()
+        self.overrides = overrides
+        self.output_frame = output_frame
+        self.subject = subject
+        self.full = threading.Event()
+        self.done = threading.Event()
+        self.started = None
+        self.results = None
+        self.fused = None
+        self.error = None
+
+
+def fuse_poses(results):
+    """
+    카메라별 PosePacket 결과를 하나의 포즈로 융합
+
+    위치는 평균, 자세는 쿼터니언 평균을 사용하며, 결과의 좌표계가 서로 다르면(예: 'deck' 출력의 데크 경계)
+    첫 결과의 좌표계로 변환한 뒤 융합함
+    융합 포즈가 측위 좌표계이고 선박 배치 색인이 있으면 융합 위치로 영역을 다시 결정
+
+    Args:
+        results (list): PosePacket 데이터 dict 목록
+
+    Returns:
+        dict: {'cameras': 카메라 ID 목록, 'timestamp_ns': 평균 타임스탬프, 'pose': PoseBlock dict}
+    """
+    positions = np.array([result['pose']['position_m'] for result in results], dtype=np.float64)
+    quaternions = np.array([result['pose']['quaternion'] for result in results], dtype=np.float64)
+    frames = [result['pose'].get('frame', default_graph.localization_frame) for result in results]
+    if len(set(frames)) > 1:
+        positions, quaternions = default_graph.transform_poses(positions, quaternions, frames, frames[0])
+    position = positions.mean(axis=0).tolist()
+
+    zone_index = get_zone_index()
+    zone = None
+    if zone_index is not None and frames[0] == default_graph.localization_frame:
+        zone = zone_index.resolve(position)
+    pose = PoseBlock(position_m=position, quaternion=quat_average(quaternions).tolist(), frame=frames[0])
+    pose_dict = pose.to_dict()
+    pose_dict['zone'] = zone.to_dict() if zone is not None else dict(results[0]['pose']['zone'])
+    return {
+        'cameras': [result['ID']['cameraId'] for result in results],
+        'timestamp_ns': int(sum(result['timestamp_ns'] for result in results) // len(results)),
+        'pose': pose_dict
+    }
+
+
+class FrameGrouper:
+    """
+    다중 카메라 프레임 그룹화기
+    """
+
+    def __init__(self, enabled=False, window_ms=20.0, max_group_size=4, max_groups=1024, mode='alongside',
+                 pipeline=None):
+        """
+        다중 카메라 프레임 그룹화기 초기화
+
+        Args:
+            enabled (bool, optional): 그룹화 사용 여부
+            window_ms (float, optional): 첫 프레임 도착 후 같은 사용자의 프레임을 기다리는 시간(밀리초)
+            max_group_size (int, optional): 그룹당 최대 프레임 수 (도달하면 즉시 처리)
+            max_groups (int, optional): 동시에 열려 있을 수 있는 최대 그룹 수 (초과 시 프레임을 단독 처리)
+            mode (str, optional): 'alongside'(카메라별 결과에 융합 포즈 추가) 또는 'replace'(카메라별 포즈를 융합 포즈로 대체)
+            pipeline (PosePipeline, optional): 프레임을 처리할 포즈 파이프라인 (기본값: 기본 파이프라인)
+        """
+        self._lock = threading.Lock()
+        self._open = {}
+        self.pipeline = pipeline or default_pipeline
+        self.configure(enabled=enabled, window_ms=window_ms, max_group_size=max_group_size,
+                       max_groups=max_groups, mode=mode)
+        self.reset_stats()
+
+    def configure(self, **params):
+        """
+        그룹화 설정 변경 (지정한 항목만 변경)
+
+        Args:
+            **params: enabled, window_ms, max_group_size, max_groups, mode
+
+        Raises:
+            ValueError: 알 수 없는 설정 또는 범위를 벗어난 값
+        """
+        allowed = ('enabled', 'window_ms', 'max_group_size', 'max_groups', 'mode')
+        for key in params:
+            if key not in allowed:
+                raise ValueError(f"알 수 없는 그룹화 설정: {key}")
+        if 'mode' in params and params['mode'] not in GROUPING_MODES:
+            raise ValueError(f"유효하지 않은 그룹화 방식: {params['mode']}")
+        if 'window_ms' in params and params['window_ms'] < 0:
+            raise ValueError(f"window_ms는 0 이상이어야 합니다: {params['window_ms']}")
+        for key in ('max_group_size', 'max_groups'):
+            if key in params and params[key] < 1:
+                raise ValueError(f"{key}는 1 이상이어야 합니다: {params[key]}")
+        with self._lock:
+            for key, value in params.items():
+                setattr(self, key, bool(value) if key == 'enabled' else value)
+
+    def reset_stats(self):
+        """
+        그룹화 통계 초기화
+        """
+        with self._lock:
+            self.groups = 0
+            self.grouped_frames = 0
+            self.bypassed = 0
+            self.wait_total_ms = 0.0
+            self.wait_max_ms = 0.0
+
+    def process(self, image_data, overrides=None, output_frame=None, subject=None):
+        """
+        프레임을 그룹에 넣고 그룹 처리 결과 반환
+
+        같은 사용자의 열린 그룹에 같은 카메라 프레임이 이미 있으면 그 그룹을 즉시 닫고 새 그룹을 시작함
+        단계 구현 선택이나 결과 좌표계/대상이 다른 프레임은 같은 그룹에 넣지 않음
+
+        Args:
+            image_data (dict): 요청 JSON 데이터 (FramePacket 형식)
+            overrides (dict, optional): 이번 요청에만 적용할 {단계 종류: 구현 이름}
+            output_frame (str, optional): 결과 포즈의 좌표계 (None이면 측위 좌표계, 'deck'이면 포즈의 데크 좌표계)
+            subject (str, optional): 결과 포즈의 대상 ('camera' 또는 'body', 기본값: 'camera')
+
+        Returns:
+            tuple: (PosePacket 데이터 dict, {단계 종류: 소요 시간(나노초)}, 융합 포즈 dict 또는 None)
+                (소요 시간의 'group'은 그룹 처리가 시작될 때까지 기다린 시간)
+        """
+        arrival = time.perf_counter_ns()
+        id_data = image_data.get('ID') or {}
+        key = (id_data.get('shipID', 0), id_data.get('UserID', 0),
+               tuple(sorted((overrides or {}).items())), output_frame, subject)
+        camera = id_data.get('cameraId', 0)
+
+        with self._lock:
+            group = self._open.get(key)
+            if group is not None and camera in group.cameras:
+                self._close(key, group)
+                group = None
+
+            leader = group is None
+            if leader:
+                if len(self._open) >= self.max_groups:
+                    group = None
+                else:
+                    group = _FrameGroup(overrides, output_frame, subject)
+                    self._open[key] = group
+
+            if group is None:
+                self.bypassed += 1
+            else:
+                index = len(group.frames)
+                group.frames.append(image_data)
+                group.cameras.add(camera)
+                if len(group.frames) >= self.max_group_size:
+                    self._close(key, group)
+            window = self.window_ms / 1000
+            mode = self.mode
+
+        if group is None:
+            result, timings_ns = self.pipeline.run(image_data, overrides, output_frame, subject)
+            return result, timings_ns, None
+
+        if leader:
+            group.full.wait(window)
+            with self._lock:
+                self._close(key, group)
+            self._run_group(group)
+        else:
+            group.done.wait()
+
+        if group.error is not None:
+            raise group.error
+
+        waited_ns = group.started - arrival
+        with self._lock:
+            self.wait_total_ms += waited_ns / 1_000_000
+            self.wait_max_ms = max(self.wait_max_ms, waited_ns / 1_000_000)
+
+        result, timings_ns = group.results[index]
+        timings_ns = dict(timings_ns, group=waited_ns)
+        if mode == 'replace':
+            result = dict(result, pose=group.fused['pose'])
+            return result, timings_ns, None
+        return result, timings_ns, group.fused
+
+    def _close(self, key, group):
+        """
+        그룹을 닫아 더 이상 프레임을 받지 않도록 함 (잠금을 잡은 상태에서 호출)
+
+        Args:
+            key (tuple): (shipID, UserID)
+            group (_FrameGroup): 닫을 그룹
+        """
+        if self._open.get(key) is group:
+            del self._open[key]
+        group.full.set()
+
+    def _run_group(self, group):
+        """
+        닫힌 그룹의 프레임을 파이프라인으로 한 번에 처리하고 융합 포즈 계산
+
+        Args:
+            group (_FrameGroup): 처리할 그룹
+        """
+        group.started = time.perf_counter_ns()
+        try:
+            group.results = self.pipeline.run_batch(
+                group.frames, group.overrides, group.output_frame, group.subject
+            )
+            group.fused = fuse_poses([result for result, _ in group.results])
+            with self._lock:
+                self.groups += 1
+                self.grouped_frames += len(group.frames)
+        except Exception as e:
+            group.error = e
+        finally:
+            group.done.set()
+
+    def get_config(self):
+        """
+        그룹화 설정과 통계 반환
+
+        Returns:
+            dict: 설정, 처리한 그룹 수, 평균 그룹 크기, 단독 처리 수, 대기 시간(밀리초)
+        """
+        with self._lock:
+            waited = self.grouped_frames
+            return {
+                'enabled': self.enabled,
+                'window_ms': self.window_ms,
+                'max_group_size': self.max_group_size,
+                'max_groups': self.max_groups,
+                'mode': self.mode,
+                'open_groups': len(self._open),
+                'groups': self.groups,
+                'mean_group_size': self.grouped_frames / self.groups if self.groups else 0.0,
+                'bypassed': self.bypassed,
+                'mean_wait_ms': self.wait_total_ms / waited if waited else 0.0,
+                'max_wait_ms': self.wait_max_ms
+            }
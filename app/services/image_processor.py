@@ -5,49 +5,179 @@ import numpy as np
 # import cv2
 from app.models.frame_packet import FramePacket, IdBlock, CameraBlock, PoseBlock, ZoneBlock
 from app.models.pose_packet import PosePacket
+from app.services.deterministic_rng import CounterRNG
+from app.services.pose_math import perturb_quaternions
+from app.services.zone_index import get_zone_index
+from app.services.transform_graph import default_graph, resolve_target_frames
 
-def process_image(image_data):
+# 포즈 변형용 결정적 난수 생성기 (None이면 random 모듈 사용)
+_pose_noise_rng = None
+
+# 시드가 없을 때 배치 변형에 사용하는 난수 생성기
+_batch_noise_generator = np.random.default_rng()
+
+def set_pose_noise_seed(seed):
+    """
+    포즈 변형 난수 시드 설정
+    
+    시드를 지정하면 변형 값이 (시드, shipID, UserID, cameraId, imageID)로 결정되어
+    같은 프레임은 어느 프로세스에서 처리하더라도 같은 포즈를 받음
+    
+    Args:
+        seed (int): 난수 시드 (None이면 비결정적 변형으로 복귀)
+    """
+    global _pose_noise_rng
+    _pose_noise_rng = CounterRNG(seed) if seed is not None else None
+
+def get_pose_noise_seed():
+    """
+    현재 포즈 변형 난수 시드 반환
+    
+    Returns:
+        int: 난수 시드 (비결정적 변형이면 None)
+    """
+    rng = _pose_noise_rng
+    return rng.seed if rng is not None else None
+
+def process_image(image_data, stages=None):
     """
     이미지 데이터를 처리하고 PosePacket 객체를 생성
     
+    처리는 기본 포즈 파이프라인(decode → validate → localize → postprocess → zone → transform → packetize)으로 수행
+    
     Args:
         image_data (dict): 이미지 데이터를 포함한 딕셔너리
+        stages (dict, optional): 이번 처리에만 사용할 {단계 종류: 구현 이름}
         
     Returns:
         dict: PosePacket 데이터를 포함한 딕셔너리
     """
+    from app.services.pose_pipeline import default_pipeline
+    result, _ = default_pipeline.run(image_data, stages)
+    return result
+
+def process_images_batch(image_data_list, output_frame=None, subject=None):
+    """
+    여러 이미지 데이터를 한 번에 처리하여 PosePacket 목록 생성
+    
+    위치를 (N, 3), 쿼터니언을 (N, 4) 배열로 쌓아 변형과 정규화, 좌표계 변환을 배열 연산으로 처리하므로
+    재생/배치 작업에서 process_image()를 반복 호출하는 것보다 프레임당 비용이 작음
+    
+    Args:
+        image_data_list (list): 이미지 데이터 딕셔너리 목록
+        output_frame (str, optional): 결과 포즈의 좌표계 (None이면 측위 좌표계, 'deck'이면 포즈의 데크 좌표계)
+        subject (str, optional): 결과 포즈의 대상 ('camera' 또는 'body', 기본값: 'camera')
+        
+    Returns:
+        list: PosePacket 데이터 딕셔너리 목록 (입력 순서 유지)
+    """
+    frames = [_parse_frame(image_data) for image_data in image_data_list]
+    count = len(frames)
+    if count == 0:
+        return []
+    
+    positions, quaternions, zones = _extract_pose_batch(
+        [(image_bytes, id_block, input_pose) for image_bytes, id_block, _, input_pose in frames]
+    )
+    
+    # 선박 배치 색인이 있으면 위치가 속한 영역을 한 번에 조회 (구획 밖이면 기존 영역 유지)
+    zone_index = get_zone_index()
+    if zone_index is not None:
+        for i, compartment in enumerate(zone_index.lookup(positions).tolist()):
+            if compartment >= 0:
+                zones[i] = zone_index.zone_block(compartment)
+    
+    # 요청한 좌표계/대상으로 한 번에 변환
+    frames_out = [default_graph.localization_frame] * count
+    if output_frame is not None or subject == 'body':
+        frames_out = resolve_target_frames(output_frame or default_graph.localization_frame, zones)
+        cameras = [frame[1].cameraId for frame in frames] if subject == 'body' else None
+        positions, quaternions = default_graph.transform_poses(
+            positions, quaternions, default_graph.localization_frame, frames_out, cameras
+        )
+    
+    results = []
+    position_rows = positions.tolist()
+    quaternion_rows = quaternions.tolist()
+    for i, (image_bytes, id_block, timestamp_ns, input_pose) in enumerate(frames):
+        pose_packet = PosePacket(
+            ID=id_block,
+            timestamp_ns=timestamp_ns,
+            pose=PoseBlock(position_m=position_rows[i], quaternion=quaternion_rows[i], zone=zones[i], frame=frames_out[i])
+        )
+        pose_packet.set_arrival_time()
+        results.append(pose_packet.to_dict())
+    return results
+
+def _extract_pose_batch(frames):
+    """
+    여러 프레임의 포즈 데이터 추출 및 랜덤 변형을 배열 연산으로 한 번에 적용 (_extract_pose_data()의 배치 버전)
+    
+    Args:
+        frames (list): (이미지 바이트, IdBlock, 입력 PoseBlock 또는 None) 목록
+        
+    Returns:
+        tuple: ((N, 3) 위치, (N, 4) 쿼터니언, ZoneBlock 목록)
+    """
+    count = len(frames)
+    positions = np.zeros((count, 3))
+    quaternions = np.tile([0.0, 0.0, 0.0, 1.0], (count, 1))
+    has_image = np.zeros(count, dtype=bool)
+    zones = []
+    for i, (image_bytes, id_block, input_pose) in enumerate(frames):
+        zones.append(input_pose.zone if input_pose and hasattr(input_pose, 'zone') else _default_zone())
+        has_image[i] = bool(image_bytes)
+        if input_pose:
+            if getattr(input_pose, 'position_m', None):
+                positions[i] = input_pose.position_m
+            if getattr(input_pose, 'quaternion', None):
+                quaternions[i] = input_pose.quaternion
+    
+    # 이미지가 있는 프레임에만 변형 적용 (없는 프레임은 기본 포즈)
+    positions[~has_image] = 0.0
+    quaternions[~has_image] = [0.0, 0.0, 0.0, 1.0]
+    noise = _pose_noise_batch([frame[1] for frame in frames])
+    positions[has_image] += 2.0 * noise[has_image, :3] - 1.0
+    
+    # 회전에 각도가 제한된 임의 회전을 합성 (결과는 단위 쿼터니언)
+    quaternions[has_image] = perturb_quaternions(quaternions[has_image], noise[has_image, 3:])
+    
+    return positions, quaternions, zones
+
+def _parse_frame(image_data):
+    """
+    요청 데이터에서 이미지 바이트, 식별 정보, 타임스탬프, 입력 포즈 추출
+    
+    Args:
+        image_data (dict): 이미지 데이터 (FramePacket 형식 또는 기존 형식)
+        
+    Returns:
+        tuple: (이미지 바이트, IdBlock, 타임스탬프(나노초), 입력 PoseBlock 또는 None)
+    """
     # 이미지 객체 생성 (기존 형식 또는 새 형식 모두 지원)
     if 'image' in image_data:
         # 새 형식 (FramePacket)
         frame_packet = FramePacket.from_dict(image_data)
-        image_bytes = frame_packet.get_image_bytes()
-        id_block = frame_packet.ID
-        timestamp_ns = frame_packet.timestamp_ns
-        input_pose = frame_packet.pose  # 입력 포즈 데이터
-    else:
-        # 기존 형식 (이전 버전과의 호환성 유지)
-        image_bytes = _get_image_bytes_from_legacy_format(image_data)
-        id_block = _create_id_block_from_legacy_format(image_data)
-        timestamp_ns = int(time.time() * 1_000_000_000)  # 현재 시간을 나노초로 변환
-        input_pose = None
-    
-    # 이미지 처리 (실제 구현에서는 더 복잡한 처리가 필요할 수 있음)
-    pose_block = _extract_pose_data(image_bytes, input_pose)
-    
-    # PosePacket 객체 생성
-    pose_packet = PosePacket(
-        ID=id_block,
-        timestamp_ns=timestamp_ns,
-        pose=pose_block
-    )
-    
-    # 도착 시간 설정 (서버에서 요청을 받은 시간)
-    pose_packet.set_arrival_time()
+        return frame_packet.get_image_bytes(), frame_packet.ID, frame_packet.timestamp_ns, frame_packet.pose
     
-    # 지연 시뮬레이션 후 출발 시간 설정은 API 라우트에서 처리
+    # 기존 형식 (이전 버전과의 호환성 유지)
+    image_bytes = _get_image_bytes_from_legacy_format(image_data)
+    id_block = _create_id_block_from_legacy_format(image_data)
+    timestamp_ns = int(time.time() * 1_000_000_000)  # 현재 시간을 나노초로 변환
+    return image_bytes, id_block, timestamp_ns, None
+
+def _default_zone():
+    """
+    기본 영역 정보 반환
     
-    # 딕셔너리로 변환하여 반환
-    return pose_packet.to_dict()
+    Returns:
+        ZoneBlock: 기본 영역 정보
+    """
+    return ZoneBlock(
+        deck=1,
+        compartment="Main",
+        zone_id=1
+    )
 
 def _get_image_bytes_from_legacy_format(image_data):
     """
@@ -96,23 +226,55 @@ def _create_id_block_from_legacy_format(image_data):
         cameraId=metadata.get('cameraId', 0)
     )
 
-def _extract_pose_data(image_bytes, input_pose=None):
+def _pose_noise(id_block=None):
+    """
+    포즈 변형용 난수 6개 반환 (위치 x, y, z 오프셋 3개, 임의 회전의 축 z, 축 방위각, 회전각 3개 순서, [0, 1) 범위)
+    
+    Args:
+        id_block (IdBlock, optional): 프레임 식별 정보
+        
+    Returns:
+        list: [0, 1) 범위 난수
+    """
+    rng = _pose_noise_rng
+    if rng is None or id_block is None:
+        import random
+        return [random.random() for _ in range(6)]
+    return rng.random_array(
+        6, 'pose', id_block.shipID, id_block.UserID, id_block.cameraId, id_block.imageID
+    ).tolist()
+
+def _pose_noise_batch(id_blocks):
+    """
+    프레임별 포즈 변형용 난수 행렬 반환 (열 순서는 _pose_noise()와 동일)
+    
+    Args:
+        id_blocks (list): 프레임 식별 정보 목록
+        
+    Returns:
+        numpy.ndarray: (N, 6) [0, 1) 범위 난수
+    """
+    rng = _pose_noise_rng
+    if rng is None:
+        return _batch_noise_generator.random((len(id_blocks), 6))
+    return rng.random_rows(
+        [('pose', b.shipID, b.UserID, b.cameraId, b.imageID) for b in id_blocks], 6
+    )
+
+def _extract_pose_data(image_bytes, input_pose=None, id_block=None):
     """
     이미지에서 포즈 데이터 추출 및 랜덤 변형 적용
     
     Args:
         image_bytes (bytes): 처리할 이미지 바이트 배열
         input_pose (PoseBlock, optional): 입력 포즈 데이터
+        id_block (IdBlock, optional): 프레임 식별 정보 (결정적 변형의 키)
         
     Returns:
         PoseBlock: 추출된 포즈 데이터
     """
     # 기본 영역 정보 생성
-    zone = ZoneBlock(
-        deck=1,
-        compartment="Main",
-        zone_id=1
-    )
+    zone = _default_zone()
     
     # 입력 포즈 데이터가 있는 경우 해당 영역 정보 사용
     if input_pose and hasattr(input_pose, 'zone'):
@@ -144,22 +306,16 @@ def _extract_pose_data(image_bytes, input_pose=None):
                 quaternion = input_pose.quaternion.copy()
         
         # 랜덤 변형 적용 (1미터 내부에서 위치 변경)
-        import random
+        noise = _pose_noise(id_block)
         
         # 위치에 랜덤 오프셋 적용 (최대 1미터)
-        position_m[0] += random.uniform(-1.0, 1.0)
-        position_m[1] += random.uniform(-1.0, 1.0)
-        position_m[2] += random.uniform(-1.0, 1.0)
+        position_m[0] += 2.0 * noise[0] - 1.0
+        position_m[1] += 2.0 * noise[1] - 1.0
+        position_m[2] += 2.0 * noise[2] - 1.0
         
         # 회전에 랜덤 변형 적용
-        # 쿼터니언 값에 작은 랜덤 변화 적용 (단순화된 방식)
-        for i in range(3):  # x, y, z 성분에 랜덤 변화 적용
-            quaternion[i] += random.uniform(-0.1, 0.1)
-        
-        # 쿼터니언 정규화 (단위 쿼터니언 유지)
-        magnitude = sum(q*q for q in quaternion) ** 0.5
-        if magnitude > 0:
-            quaternion = [q/magnitude for q in quaternion]
+        # 입력 자세와 무관한 분포가 되도록 각도가 제한된 임의 회전을 합성
+        quaternion = perturb_quaternions(quaternion, noise[3:]).tolist()
         
         return PoseBlock(
             position_m=position_m,
@@ -0,0 +1,253 @@
+"""
+포즈 수학 유틸리티
+
+NumPy 배열 기반 배치 쿼터니언 연산
+쿼터니언은 Unity와 같은 [x, y, z, w] 순서이며, 모든 함수는 (..., 4) 모양의 배열을 받아
+마지막 축을 제외한 차원에 대해 브로드캐스트됨
+"""
+
+import numpy as np
+
+# 포즈 변형 시 합성하는 임의 회전의 최대 각도(라디안, 약 11.5도)
+POSE_NOISE_MAX_ANGLE_RAD = 0.2
+
+
+def quat_normalize(q):
+    """
+    쿼터니언 정규화 (크기가 0인 쿼터니언은 단위 쿼터니언 [0, 0, 0, 1]로 대체)
+
+    Args:
+        q (array_like): (..., 4) 쿼터니언
+
+    Returns:
+        numpy.ndarray: (..., 4) 단위 쿼터니언
+    """
+    q = np.asarray(q, dtype=np.float64)
+    norm = np.linalg.norm(q, axis=-1, keepdims=True)
+    identity = np.broadcast_to([0.0, 0.0, 0.0, 1.0], q.shape)
+    return np.where(norm > 0, q / np.where(norm > 0, norm, 1.0), identity)
+
+
+def quat_multiply(a, b):
+    """
+    쿼터니언 곱 a ⊗ b (b 회전을 먼저 적용한 뒤 a 회전을 적용)
+
+    Args:
+        a (array_like): (..., 4) 쿼터니언
+        b (array_like): (..., 4) 쿼터니언
+
+    Returns:
+        numpy.ndarray: (..., 4) 쿼터니언
+    """
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    ax, ay, az, aw = np.moveaxis(a, -1, 0)
+    bx, by, bz, bw = np.moveaxis(b, -1, 0)
+    return np.stack([
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by - ax * bz + ay * bw + az * bx,
+        aw * bz + ax * by - ay * bx + az * bw,
+        aw * bw - ax * bx - ay * by - az * bz
+    ], axis=-1)
+
+
+def axis_angle_to_quat(axis, angle):
+    """
+    회전축과 회전각을 쿼터니언으로 변환
+
+    Args:
+        axis (array_like): (..., 3) 회전축 (정규화되지 않아도 됨)
+        angle (array_like): (...) 회전각(라디안)
+
+    Returns:
+        numpy.ndarray: (..., 4) 단위 쿼터니언
+    """
+    axis = np.asarray(axis, dtype=np.float64)
+    angle = np.asarray(angle, dtype=np.float64)
+    norm = np.linalg.norm(axis, axis=-1, keepdims=True)
+    unit = axis / np.where(norm > 0, norm, 1.0)
+    half = angle[..., None] / 2.0
+    return np.concatenate([unit * np.sin(half), np.cos(half)], axis=-1)
+
+
+def quat_slerp(a, b, t):
+    """
+    구면 선형 보간
+
+    최단 경로로 보간하며, 두 쿼터니언이 거의 같으면 선형 보간 후 정규화
+
+    Args:
+        a (array_like): (..., 4) 시작 단위 쿼터니언
+        b (array_like): (..., 4) 끝 단위 쿼터니언
+        t (array_like): (...) 보간 비율 (0이면 a, 1이면 b)
+
+    Returns:
+        numpy.ndarray: (..., 4) 단위 쿼터니언
+    """
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    t = np.asarray(t, dtype=np.float64)[..., None]
+
+    dot = np.sum(a * b, axis=-1, keepdims=True)
+    b = np.where(dot < 0, -b, b)
+    dot = np.abs(dot)
+
+    theta = np.arccos(np.clip(dot, -1.0, 1.0))
+    sin_theta = np.sin(theta)
+    close = sin_theta < 1e-6
+    safe_sin = np.where(close, 1.0, sin_theta)
+    wa = np.where(close, 1.0 - t, np.sin((1.0 - t) * theta) / safe_sin)
+    wb = np.where(close, t, np.sin(t * theta) / safe_sin)
+    return quat_normalize(wa * a + wb * b)
+
+
+def quat_angle(a, b):
+    """
+    두 쿼터니언 사이의 회전각
+
+    Args:
+        a (array_like): (..., 4) 단위 쿼터니언
+        b (array_like): (..., 4) 단위 쿼터니언
+
+    Returns:
+        numpy.ndarray: (...) 회전각(라디안, 0~π)
+    """
+    dot = np.abs(np.sum(np.asarray(a) * np.asarray(b), axis=-1))
+    return 2.0 * np.arccos(np.clip(dot, -1.0, 1.0))
+
+
+def random_small_rotation(u, max_angle=POSE_NOISE_MAX_ANGLE_RAD):
+    """
+    [0, 1) 난수로 각도가 max_angle 이하인 임의 회전 생성
+
+    회전축은 단위 구면에서 균등하게, 회전각은 [0, max_angle)에서 균등하게 선택되므로
+    분포가 입력 자세와 무관함
+
+    Args:
+        u (array_like): (..., 3) [0, 1) 난수 (축 z, 축 방위각, 회전각 순서)
+        max_angle (float, optional): 최대 회전각(라디안)
+
+    Returns:
+        numpy.ndarray: (..., 4) 단위 쿼터니언
+    """
+    u = np.asarray(u, dtype=np.float64)
+    z = 2.0 * u[..., 0] - 1.0
+    phi = 2.0 * np.pi * u[..., 1]
+    r = np.sqrt(np.maximum(1.0 - z * z, 0.0))
+    axis = np.stack([r * np.cos(phi), r * np.sin(phi), z], axis=-1)
+    return axis_angle_to_quat(axis, max_angle * u[..., 2])
+
+
+def perturb_quaternions(q, u, max_angle=POSE_NOISE_MAX_ANGLE_RAD):
+    """
+    쿼터니언에 각도가 max_angle 이하인 임의 회전을 합성
+
+    Args:
+        q (array_like): (..., 4) 쿼터니언
+        u (array_like): (..., 3) [0, 1) 난수
+        max_angle (float, optional): 최대 회전각(라디안)
+
+    Returns:
+        numpy.ndarray: (..., 4) 단위 쿼터니언
+    """
+    return quat_normalize(quat_multiply(quat_normalize(q), random_small_rotation(u, max_angle)))
+
+
+def quat_average(q, weights=None):
+    """
+    쿼터니언 평균 (부호를 첫 쿼터니언 쪽으로 맞춘 가중 평균 후 정규화)
+
+    서로 가까운 자세(예: 한 사용자가 착용한 여러 카메라)를 합칠 때 사용하며,
+    자세 차이가 크면 고윳값 기반 평균보다 오차가 커짐
+
+    Args:
+        q (array_like): (..., N, 4) 쿼터니언
+        weights (array_like, optional): (..., N) 가중치 (기본값: 균등)
+
+    Returns:
+        numpy.ndarray: (..., 4) 단위 쿼터니언
+    """
+    q = quat_normalize(q)
+    dot = np.sum(q * q[..., :1, :], axis=-1, keepdims=True)
+    q = np.where(dot < 0, -q, q)
+    if weights is None:
+        return quat_normalize(q.mean(axis=-2))
+    weights = np.asarray(weights, dtype=np.float64)[..., None]
+    return quat_normalize(np.sum(q * weights, axis=-2))
+
+
+def quat_conjugate(q):
+    """
+    쿼터니언 켤레 (단위 쿼터니언의 역회전)
+
+    Args:
+        q (array_like): (..., 4) 쿼터니언
+
+    Returns:
+        numpy.ndarray: (..., 4) 쿼터니언
+    """
+    q = np.asarray(q, dtype=np.float64)
+    return q * np.array([-1.0, -1.0, -1.0, 1.0])
+
+
+def quat_to_matrix(q):
+    """
+    단위 쿼터니언을 회전 행렬로 변환
+
+    Args:
+        q (array_like): (..., 4) 단위 쿼터니언
+
+    Returns:
+        numpy.ndarray: (..., 3, 3) 회전 행렬
+    """
+    x, y, z, w = np.moveaxis(np.asarray(q, dtype=np.float64), -1, 0)
+    return np.stack([
+        np.stack([1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)], axis=-1),
+        np.stack([2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)], axis=-1),
+        np.stack([2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)], axis=-1)
+    ], axis=-2)
+
+
+def quat_rotate(q, v):
+    """
+    벡터를 쿼터니언으로 회전
+
+    Args:
+        q (array_like): (..., 4) 단위 쿼터니언
+        v (array_like): (..., 3) 벡터
+
+    Returns:
+        numpy.ndarray: (..., 3) 회전된 벡터
+    """
+    return np.einsum('...ij,...j->...i', quat_to_matrix(q), np.asarray(v, dtype=np.float64))
+
+
+def pose_compose(t_a, q_a, t_b, q_b):
+    """
+    강체 변환 합성 a ∘ b (b를 먼저 적용한 뒤 a를 적용)
+
+    Args:
+        t_a (array_like): (..., 3) a의 이동
+        q_a (array_like): (..., 4) a의 회전
+        t_b (array_like): (..., 3) b의 이동
+        q_b (array_like): (..., 4) b의 회전
+
+    Returns:
+        tuple: ((..., 3) 이동, (..., 4) 회전)
+    """
+    return np.asarray(t_a, dtype=np.float64) + quat_rotate(q_a, t_b), quat_normalize(quat_multiply(q_a, q_b))
+
+
+def pose_inverse(t, q):
+    """
+    강체 변환의 역변환
+
+    Args:
+        t (array_like): (..., 3) 이동
+        q (array_like): (..., 4) 회전
+
+    Returns:
+        tuple: ((..., 3) 이동, (..., 4) 회전)
+    """
+    q_inv = quat_conjugate(quat_normalize(q))
+    return -quat_rotate(q_inv, t), q_inv
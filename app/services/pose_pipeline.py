@@ -0,0 +1,580 @@
+"""
+포즈 처리 파이프라인
+
+이미지 처리를 decode → validate → localize → postprocess → zone → transform → packetize 단계로 나누고,
+단계별 구현을 이름으로 등록하여 설정 또는 요청마다 교체할 수 있도록 함
+각 단계는 time.perf_counter_ns()로 계측
+배치 구현이 등록된 단계는 여러 프레임을 한 번에 처리할 수 있음 (run_batch())
+"""
+
+import time
+import threading
+
+from app.models.frame_packet import PoseBlock
+from app.models.pose_packet import PosePacket
+from app.services.pose_math import quat_normalize
+from app.services.pose_tracking import default_tracker
+from app.services.zone_index import get_zone_index
+from app.services.transform_graph import default_graph, resolve_target_frames, SUBJECTS
+from app.services.image_processor import _parse_frame, _extract_pose_data, _extract_pose_batch
+
+# 실행 순서대로 나열한 단계 종류
+STAGE_KINDS = ('decode', 'validate', 'localize', 'postprocess', 'zone', 'transform', 'packetize')
+
+# 기본 단계 구현
+DEFAULT_STAGES = {
+    'decode': 'auto',
+    'validate': 'basic',
+    'localize': 'random_offset',
+    'postprocess': 'normalize',
+    'zone': 'layout',
+    'transform': 'graph',
+    'packetize': 'pose_packet'
+}
+
+# 단계 종류별 등록된 구현 {종류: {이름: 함수}}
+_STAGE_REGISTRY = {kind: {} for kind in STAGE_KINDS}
+
+# 프로세스 상태를 사용하여 실행기로 보내지 않는 구현 {(종류, 이름)}
+_IN_PROCESS_STAGES = set()
+
+# 실행기로 보내지 않는 단계 종류
+# (워커는 공유 메모리의 이미지 바이트만 읽으므로, 원본 요청에서 이미지 바이트를 만드는 디코딩은 현재 프로세스에서 실행)
+_IN_PROCESS_KINDS = ('decode',)
+
+# 여러 프레임을 한 번에 처리하는 배치 구현 {(종류, 이름): 함수}
+_BATCH_STAGES = {}
+
+
+def register_stage(kind, name, offloadable=True):
+    """
+    단계 구현 등록 데코레이터
+
+    등록된 함수는 PipelineContext 하나를 받아 필요한 속성을 채움
+
+    Args:
+        kind (str): 단계 종류 (STAGE_KINDS 중 하나)
+        name (str): 구현 이름
+        offloadable (bool, optional): 프로세스 풀 실행기로 보낼 수 있는지 여부
+            (스트림별 추적 상태처럼 프런트엔드 프로세스의 상태를 갱신하는 구현은 False)
+
+    Returns:
+        callable: 데코레이터
+
+    Raises:
+        ValueError: 유효하지 않은 단계 종류
+    """
+    if kind not in _STAGE_REGISTRY:
+        raise ValueError(f"유효하지 않은 단계 종류: {kind}")
+
+    def decorator(func):
+        _STAGE_REGISTRY[kind][name] = func
+        if offloadable:
+            _IN_PROCESS_STAGES.discard((kind, name))
+        else:
+            _IN_PROCESS_STAGES.add((kind, name))
+        return func
+    return decorator
+
+
+def register_batch_stage(kind, name):
+    """
+    단계 구현의 배치 버전 등록 데코레이터
+
+    등록된 함수는 PipelineContext 목록을 받아 각 컨텍스트를 register_stage()로 등록한 구현과 같은 결과로 채움
+
+    Args:
+        kind (str): 단계 종류 (STAGE_KINDS 중 하나)
+        name (str): 구현 이름
+
+    Returns:
+        callable: 데코레이터
+
+    Raises:
+        ValueError: 유효하지 않은 단계 종류
+    """
+    if kind not in _STAGE_REGISTRY:
+        raise ValueError(f"유효하지 않은 단계 종류: {kind}")
+
+    def decorator(func):
+        _BATCH_STAGES[(kind, name)] = func
+        return func
+    return decorator
+
+
+def get_stage(kind, name):
+    """
+    등록된 단계 구현 조회
+
+    Args:
+        kind (str): 단계 종류
+        name (str): 구현 이름
+
+    Returns:
+        callable: 단계 함수
+
+    Raises:
+        ValueError: 등록되지 않은 단계
+    """
+    stage = _STAGE_REGISTRY.get(kind, {}).get(name)
+    if stage is None:
+        raise ValueError(f"등록되지 않은 {kind} 단계: {name}")
+    return stage
+
+
+def is_offloadable(kind, name):
+    """
+    단계 구현을 프로세스 풀 실행기로 보낼 수 있는지 여부
+
+    Args:
+        kind (str): 단계 종류
+        name (str): 구현 이름
+
+    Returns:
+        bool: 실행기로 보낼 수 있으면 True
+    """
+    return kind not in _IN_PROCESS_KINDS and (kind, name) not in _IN_PROCESS_STAGES
+
+
+def available_stages():
+    """
+    단계 종류별 등록된 구현 이름 목록
+
+    Returns:
+        dict: {단계 종류: [구현 이름, ...]}
+    """
+    return {kind: sorted(stages) for kind, stages in _STAGE_REGISTRY.items()}
+
+
+class PipelineContext:
+    """
+    파이프라인 실행 상태
+
+    단계 사이에 전달되는 요청 데이터와 중간 결과를 보관
+    """
+
+    def __init__(self, image_data, output_frame=None, subject='camera'):
+        """
+        파이프라인 실행 상태 초기화
+
+        Args:
+            image_data (dict): 요청 JSON 데이터
+            output_frame (str, optional): 결과 포즈의 좌표계 (None이면 측위 좌표계, 'deck'이면 포즈의 데크 좌표계)
+            subject (str, optional): 결과 포즈의 대상 ('camera' 또는 'body')
+        """
+        self.image_data = image_data
+        self.output_frame = output_frame
+        self.subject = subject
+        self.image_bytes = b''
+        self.id_block = None
+        self.timestamp_ns = 0
+        self.input_pose = None
+        self.pose_block = None
+        self.result = None
+        self.timings_ns = {}
+
+
+class PipelineStats:
+    """
+    단계별 소요 시간 통계
+    """
+
+    def __init__(self):
+        """
+        단계별 소요 시간 통계 초기화
+        """
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def record(self, timings_ns):
+        """
+        한 번의 실행에서 측정한 단계별 소요 시간 기록
+
+        Args:
+            timings_ns (dict): {단계 종류: 소요 시간(나노초)}
+        """
+        with self._lock:
+            for kind, elapsed_ns in timings_ns.items():
+                stats = self._stats.setdefault(kind, {'count': 0, 'total_ns': 0, 'max_ns': 0, 'last_ns': 0})
+                stats['count'] += 1
+                stats['total_ns'] += elapsed_ns
+                stats['max_ns'] = max(stats['max_ns'], elapsed_ns)
+                stats['last_ns'] = elapsed_ns
+
+    def reset(self):
+        """
+        기록된 통계 초기화
+        """
+        with self._lock:
+            self._stats.clear()
+
+    def summary(self):
+        """
+        단계별 소요 시간 요약 반환
+
+        Returns:
+            dict: {단계 종류: {'count', 'mean_us', 'max_us', 'last_us'}}
+        """
+        with self._lock:
+            return {
+                kind: {
+                    'count': stats['count'],
+                    'mean_us': stats['total_ns'] / stats['count'] / 1000,
+                    'max_us': stats['max_ns'] / 1000,
+                    'last_us': stats['last_ns'] / 1000
+                }
+                for kind, stats in self._stats.items()
+            }
+
+
+class PosePipeline:
+    """
+    포즈 처리 파이프라인
+
+    단계 종류별로 선택된 구현을 순서대로 실행
+    """
+
+    def __init__(self, stages=None):
+        """
+        포즈 처리 파이프라인 초기화
+
+        Args:
+            stages (dict, optional): {단계 종류: 구현 이름} (지정하지 않은 단계는 기본 구현)
+        """
+        self.stages = dict(DEFAULT_STAGES)
+        self.stats = PipelineStats()
+        self.executor = None
+        self.offload = frozenset()
+        if stages:
+            self.set_stages(stages)
+
+    def _resolve(self, overrides=None):
+        """
+        실행할 단계 함수 목록 계산
+
+        Args:
+            overrides (dict, optional): 이번 실행에만 적용할 {단계 종류: 구현 이름}
+
+        Returns:
+            list: [(단계 종류, 구현 이름, 단계 함수), ...]
+        """
+        selected = dict(self.stages)
+        if overrides:
+            selected.update({kind: name for kind, name in overrides.items() if name})
+        return [(kind, selected[kind], get_stage(kind, selected[kind])) for kind in STAGE_KINDS]
+
+    def set_stages(self, stages):
+        """
+        단계 구현 변경
+
+        Args:
+            stages (dict): {단계 종류: 구현 이름}
+
+        Raises:
+            ValueError: 등록되지 않은 단계
+        """
+        for kind, name in stages.items():
+            get_stage(kind, name)
+        self.stages.update(stages)
+        self.stats.reset()
+
+    def set_executor(self, executor, offload=('localize',)):
+        """
+        프로세스 풀 실행기 연결
+        
+        offload에 포함된 종류라도 디코딩 단계와 프로세스 상태를 사용하는 구현(is_offloadable()이 False)은 현재 프로세스에서 실행
+        
+        Args:
+            executor (StageExecutor): 단계 실행기 (None이면 모든 단계를 현재 프로세스에서 실행)
+            offload (tuple, optional): 실행기로 보낼 단계 종류
+        
+        Raises:
+            ValueError: 유효하지 않은 단계 종류
+        """
+        for kind in offload:
+            if kind not in STAGE_KINDS:
+                raise ValueError(f"유효하지 않은 단계 종류: {kind}")
+        self.executor = executor
+        self.offload = frozenset(offload) if executor is not None else frozenset()
+    
+    def run(self, image_data, overrides=None, output_frame=None, subject=None):
+        """
+        파이프라인 실행
+
+        Args:
+            image_data (dict): 요청 JSON 데이터
+            overrides (dict, optional): 이번 실행에만 적용할 {단계 종류: 구현 이름}
+            output_frame (str, optional): 결과 포즈의 좌표계 (None이면 측위 좌표계, 'deck'이면 포즈의 데크 좌표계)
+            subject (str, optional): 결과 포즈의 대상 ('camera' 또는 'body', 기본값: 'camera')
+
+        Returns:
+            tuple: (PosePacket 데이터 dict, {단계 종류: 소요 시간(나노초)})
+
+        Raises:
+            ValueError: 유효하지 않은 대상
+        """
+        if subject is not None and subject not in SUBJECTS:
+            raise ValueError(f"유효하지 않은 포즈 대상: {subject}")
+        stages = self._resolve(overrides)
+        context = PipelineContext(image_data, output_frame, subject or 'camera')
+        for kind, name, stage in stages:
+            start_ns = time.perf_counter_ns()
+            self._run_stage(kind, name, stage, context)
+            context.timings_ns[kind] = time.perf_counter_ns() - start_ns
+        self.stats.record(context.timings_ns)
+        return context.result, context.timings_ns
+
+    def run_batch(self, image_data_list, overrides=None, output_frame=None, subject=None):
+        """
+        여러 프레임에 파이프라인을 한 번에 실행
+
+        배치 구현이 등록된 단계(예: 'random_offset' 측위)는 모든 프레임을 한 번의 호출로 처리하고,
+        나머지 단계는 프레임마다 실행하므로 결과는 프레임마다 run()을 호출한 것과 같은 형식
+        배치로 처리한 단계의 소요 시간은 각 프레임에 배치 전체 소요 시간으로 기록
+
+        Args:
+            image_data_list (list): 요청 JSON 데이터 목록
+            overrides (dict, optional): 이번 실행에만 적용할 {단계 종류: 구현 이름}
+            output_frame (str, optional): 결과 포즈의 좌표계 (None이면 측위 좌표계, 'deck'이면 포즈의 데크 좌표계)
+            subject (str, optional): 결과 포즈의 대상 ('camera' 또는 'body', 기본값: 'camera')
+
+        Returns:
+            list: [(PosePacket 데이터 dict, {단계 종류: 소요 시간(나노초)}), ...] (입력 순서 유지)
+
+        Raises:
+            ValueError: 유효하지 않은 대상
+        """
+        if subject is not None and subject not in SUBJECTS:
+            raise ValueError(f"유효하지 않은 포즈 대상: {subject}")
+        stages = self._resolve(overrides)
+        contexts = [PipelineContext(image_data, output_frame, subject or 'camera') for image_data in image_data_list]
+        for kind, name, stage in stages:
+            batch_stage = _BATCH_STAGES.get((kind, name))
+            if batch_stage is not None and not self._offloaded(kind, name):
+                start_ns = time.perf_counter_ns()
+                batch_stage(contexts)
+                elapsed_ns = time.perf_counter_ns() - start_ns
+                for context in contexts:
+                    context.timings_ns[kind] = elapsed_ns
+                continue
+            for context in contexts:
+                start_ns = time.perf_counter_ns()
+                self._run_stage(kind, name, stage, context)
+                context.timings_ns[kind] = time.perf_counter_ns() - start_ns
+        for context in contexts:
+            self.stats.record(context.timings_ns)
+        return [(context.result, context.timings_ns) for context in contexts]
+
+    def _offloaded(self, kind, name):
+        """
+        단계 구현을 프로세스 풀 실행기에서 실행하는지 여부
+
+        Args:
+            kind (str): 단계 종류
+            name (str): 구현 이름
+
+        Returns:
+            bool: 실행기에서 실행하면 True
+        """
+        return self.executor is not None and kind in self.offload and is_offloadable(kind, name)
+
+    def _run_stage(self, kind, name, stage, context):
+        """
+        단계 하나를 현재 프로세스 또는 실행기에서 실행
+
+        Args:
+            kind (str): 단계 종류
+            name (str): 구현 이름
+            stage (callable): 단계 함수
+            context (PipelineContext): 파이프라인 실행 상태
+        """
+        executor = self.executor
+        if executor is not None and kind in self.offload and is_offloadable(kind, name):
+            executor.run_stage(kind, name, context)
+        else:
+            stage(context)
+
+    def get_config(self):
+        """
+        파이프라인 설정과 단계별 소요 시간 반환
+
+        Returns:
+            dict: 선택된 단계, 등록된 단계 목록, 단계별 소요 시간 요약
+        """
+        return {
+            'stages': dict(self.stages),
+            'available': available_stages(),
+            'offload': sorted(self.offload),
+            'executor': self.executor.get_config() if self.executor is not None else None,
+            'timings': self.stats.summary()
+        }
+
+
+# 기본 단계 구현
+
+@register_stage('decode', 'auto')
+def _decode_auto(context):
+    """
+    요청 형식(FramePacket 또는 기존 형식)을 판별하여 이미지 바이트, 식별 정보, 입력 포즈 추출
+    """
+    context.image_bytes, context.id_block, context.timestamp_ns, context.input_pose = _parse_frame(context.image_data)
+
+
+@register_stage('validate', 'none')
+def _validate_none(context):
+    """
+    검증 생략
+    """
+
+
+@register_stage('validate', 'basic')
+def _validate_basic(context):
+    """
+    입력 포즈의 위치/쿼터니언 차원 검증
+    """
+    pose = context.input_pose
+    if pose is None:
+        return
+    if len(pose.position_m) != 3:
+        raise ValueError(f"position_m은 3개 값이어야 합니다: {pose.position_m}")
+    if len(pose.quaternion) != 4:
+        raise ValueError(f"quaternion은 4개 값이어야 합니다: {pose.quaternion}")
+
+
+@register_stage('localize', 'random_offset')
+def _localize_random_offset(context):
+    """
+    입력 포즈에 임의 위치 오프셋과 작은 회전을 적용 (실제 측위기 대체용)
+    """
+    context.pose_block = _extract_pose_data(context.image_bytes, context.input_pose, context.id_block)
+    context.pose_block.frame = default_graph.localization_frame
+
+
+@register_batch_stage('localize', 'random_offset')
+def _localize_random_offset_batch(contexts):
+    """
+    여러 프레임의 임의 위치 오프셋과 회전을 배열 연산으로 한 번에 적용
+    """
+    if not contexts:
+        return
+    positions, quaternions, zones = _extract_pose_batch(
+        [(context.image_bytes, context.id_block, context.input_pose) for context in contexts]
+    )
+    for context, position, quaternion, zone in zip(contexts, positions.tolist(), quaternions.tolist(), zones):
+        context.pose_block = PoseBlock(
+            position_m=position,
+            quaternion=quaternion,
+            zone=zone,
+            frame=default_graph.localization_frame
+        )
+
+
+@register_stage('localize', 'passthrough')
+def _localize_passthrough(context):
+    """
+    입력 포즈를 그대로 사용
+    """
+    pose = context.input_pose
+    context.pose_block = PoseBlock(
+        position_m=list(pose.position_m),
+        quaternion=list(pose.quaternion),
+        zone=pose.zone,
+        frame=pose.frame
+    ) if pose else PoseBlock(frame=default_graph.localization_frame)
+
+
+@register_stage('postprocess', 'none')
+def _postprocess_none(context):
+    """
+    후처리 생략
+    """
+
+
+@register_stage('postprocess', 'normalize')
+def _postprocess_normalize(context):
+    """
+    쿼터니언 정규화
+    """
+    context.pose_block.quaternion = quat_normalize(context.pose_block.quaternion).tolist()
+
+
+@register_stage('postprocess', 'track', offloadable=False)
+def _postprocess_track(context):
+    """
+    스트림별 추적 필터로 위치/자세 평활화 (자세는 정규화됨)
+    """
+    pose = context.pose_block
+    id_block = context.id_block
+    pose.position_m, pose.quaternion = default_tracker.update(
+        (id_block.shipID, id_block.UserID, id_block.cameraId),
+        context.timestamp_ns,
+        pose.position_m,
+        quat_normalize(pose.quaternion).tolist()
+    )
+
+
+@register_stage('zone', 'client')
+def _zone_client(context):
+    """
+    측위 결과의 영역 정보를 그대로 사용
+    """
+
+
+@register_stage('zone', 'layout')
+def _zone_layout(context):
+    """
+    선박 배치 색인으로 위치가 속한 영역 결정 (색인이 없거나 어느 구획에도 속하지 않으면 기존 영역 유지)
+    """
+    zone_index = get_zone_index()
+    if zone_index is None:
+        return
+    zone = zone_index.resolve(context.pose_block.position_m)
+    if zone is not None:
+        context.pose_block.zone = zone
+
+
+@register_stage('transform', 'none')
+def _transform_none(context):
+    """
+    좌표계 변환 생략
+    """
+
+
+@register_stage('transform', 'graph')
+def _transform_graph(context):
+    """
+    변환 그래프로 결과 포즈를 요청한 좌표계/대상으로 변환 (요청이 없으면 측위 좌표계 유지)
+    """
+    if context.output_frame is None and context.subject != 'body':
+        return
+    pose = context.pose_block
+    targets = resolve_target_frames(context.output_frame or pose.frame, [pose.zone])
+    cameras = [context.id_block.cameraId] if context.subject == 'body' else None
+    positions, quaternions = default_graph.transform_poses(
+        [pose.position_m], [pose.quaternion], pose.frame, targets, cameras
+    )
+    pose.position_m = positions[0].tolist()
+    pose.quaternion = quaternions[0].tolist()
+    pose.frame = targets[0]
+
+
+@register_stage('packetize', 'pose_packet')
+def _packetize_pose_packet(context):
+    """
+    PosePacket 생성 및 도착 시간 설정
+    """
+    pose_packet = PosePacket(
+        ID=context.id_block,
+        timestamp_ns=context.timestamp_ns,
+        pose=context.pose_block
+    )
+
+    # 도착 시간 설정 (서버에서 요청을 받은 시간)
+    pose_packet.set_arrival_time()
+
+    # 지연 시뮬레이션 후 출발 시간 설정은 API 라우트에서 처리
+    context.result = pose_packet.to_dict()
+
+
+# 기본 파이프라인 인스턴스 (process_image()와 API에서 공유)
+default_pipeline = PosePipeline()
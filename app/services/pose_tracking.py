@@ -0,0 +1,164 @@
+"""
+스트림별 포즈 추적 필터
+
+(shipID, UserID, cameraId) 스트림마다 등속 모델의 알파-베타 필터로 위치를,
+구면 선형 보간(slerp)으로 자세를 평활화
+스트림 상태는 프레임당 상수 시간으로 갱신되며, 오래 갱신되지 않은 스트림은 LRU 순서로 제거
+"""
+
+import time
+import threading
+from collections import OrderedDict
+
+from app.services.pose_math import quat_slerp
+
+
+class _TrackState:
+    """
+    스트림 하나의 추적 상태
+    """
+
+    __slots__ = ('timestamp_ns', 'position', 'velocity', 'quaternion', 'last_seen', 'updates')
+
+    def __init__(self, timestamp_ns, position, quaternion, last_seen):
+        self.timestamp_ns = timestamp_ns
+        self.position = list(position)
+        self.velocity = [0.0, 0.0, 0.0]
+        self.quaternion = list(quaternion)
+        self.last_seen = last_seen
+        self.updates = 1
+
+
+class PoseTracker:
+    """
+    스트림별 포즈 추적 필터
+    """
+
+    def __init__(self, alpha=0.5, beta=0.1, rotation_alpha=0.5, reset_gap=2.0, idle_timeout=30.0, max_streams=10000):
+        """
+        스트림별 포즈 추적 필터 초기화
+
+        Args:
+            alpha (float, optional): 위치 보정 계수 (1이면 측정값 그대로)
+            beta (float, optional): 속도 보정 계수
+            rotation_alpha (float, optional): 자세 보간 비율 (1이면 측정값 그대로)
+            reset_gap (float, optional): 프레임 간격이 이보다 크면(초) 상태를 새로 시작
+            idle_timeout (float, optional): 이 시간(초) 동안 프레임이 없는 스트림 제거
+            max_streams (int, optional): 상태를 보관할 최대 스트림 수
+        """
+        self._lock = threading.Lock()
+        self._streams = OrderedDict()
+        self.evicted = 0
+        self.configure(alpha=alpha, beta=beta, rotation_alpha=rotation_alpha, reset_gap=reset_gap,
+                       idle_timeout=idle_timeout, max_streams=max_streams)
+
+    def configure(self, **params):
+        """
+        필터 매개변수 변경 (지정한 항목만 변경)
+
+        Args:
+            **params: alpha, beta, rotation_alpha, reset_gap, idle_timeout, max_streams
+
+        Raises:
+            ValueError: 알 수 없는 매개변수 또는 범위를 벗어난 계수
+        """
+        allowed = ('alpha', 'beta', 'rotation_alpha', 'reset_gap', 'idle_timeout', 'max_streams')
+        for key, value in params.items():
+            if key not in allowed:
+                raise ValueError(f"알 수 없는 추적 필터 매개변수: {key}")
+            if key in ('alpha', 'beta', 'rotation_alpha') and not 0.0 < value <= 1.0:
+                raise ValueError(f"{key}는 0보다 크고 1 이하여야 합니다: {value}")
+            setattr(self, key, value)
+
+    def update(self, key, timestamp_ns, position, quaternion):
+        """
+        스트림에 새 측정 포즈를 반영하고 필터링된 포즈 반환
+
+        Args:
+            key (tuple): 스트림 키 (shipID, UserID, cameraId)
+            timestamp_ns (int): 프레임 타임스탬프(나노초)
+            position (list): 측정 위치 [x, y, z]
+            quaternion (list): 측정 자세 [x, y, z, w]
+
+        Returns:
+            tuple: (필터링된 위치 list, 필터링된 자세 list)
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._evict(now)
+            state = self._streams.get(key)
+            dt = (timestamp_ns - state.timestamp_ns) / 1_000_000_000 if state is not None else 0.0
+
+            if state is not None and dt <= 0:
+                # 순서가 뒤바뀌었거나 중복된 프레임은 상태를 되돌리지 않고 현재 추정값 반환
+                state.last_seen = now
+                self._streams.move_to_end(key)
+                return list(state.position), list(state.quaternion)
+
+            if state is None or dt > self.reset_gap:
+                # 첫 프레임이나 긴 공백 후에는 측정값으로 다시 시작
+                state = _TrackState(timestamp_ns, position, quaternion, now)
+                self._streams[key] = state
+                self._streams.move_to_end(key)
+                if len(self._streams) > self.max_streams:
+                    self._streams.popitem(last=False)
+                    self.evicted += 1
+                return list(state.position), list(state.quaternion)
+
+            alpha, beta = self.alpha, self.beta
+            for i in range(3):
+                predicted = state.position[i] + state.velocity[i] * dt
+                residual = position[i] - predicted
+                state.position[i] = predicted + alpha * residual
+                state.velocity[i] += beta * residual / dt
+            state.quaternion = quat_slerp(state.quaternion, quaternion, self.rotation_alpha).tolist()
+            state.timestamp_ns = timestamp_ns
+            state.last_seen = now
+            state.updates += 1
+            self._streams.move_to_end(key)
+            return list(state.position), list(state.quaternion)
+
+    def _evict(self, now):
+        """
+        idle_timeout 동안 갱신되지 않은 스트림 제거 (가장 오래된 스트림부터 확인)
+
+        Args:
+            now (float): 현재 단조 시각(초)
+        """
+        while self._streams:
+            key, state = next(iter(self._streams.items()))
+            if now - state.last_seen < self.idle_timeout:
+                return
+            del self._streams[key]
+            self.evicted += 1
+
+    def reset(self):
+        """
+        모든 스트림 상태 제거
+        """
+        with self._lock:
+            self._streams.clear()
+            self.evicted = 0
+
+    def get_config(self):
+        """
+        필터 설정과 스트림 통계 반환
+
+        Returns:
+            dict: 필터 매개변수, 추적 중인 스트림 수, 제거된 스트림 수
+        """
+        with self._lock:
+            return {
+                'alpha': self.alpha,
+                'beta': self.beta,
+                'rotation_alpha': self.rotation_alpha,
+                'reset_gap': self.reset_gap,
+                'idle_timeout': self.idle_timeout,
+                'max_streams': self.max_streams,
+                'streams': len(self._streams),
+                'evicted': self.evicted
+            }
+
+
+# 기본 추적 필터 인스턴스 (파이프라인의 'track' 후처리 단계에서 사용)
+default_tracker = PoseTracker()
@@ -0,0 +1,277 @@
+"""
+시나리오 자동 실행기
+
+(시나리오, 매개변수, 지속 시간) 단계 목록을 받아 단조 시계 기준의 정확한 시각에
+지연 전략을 직접 전환하고, 요청마다 활성 단계를 태깅하여 단계별 요약을 만듦
+"""
+
+import bisect
+import threading
+from collections import deque
+
+import numpy as np
+
+from app.services.delay_simulator import STRATEGY_DEFAULTS
+
+# 시나리오 번호별 전략 이름 (/api/delay/scenario/N 엔드포인트와 동일, 기본 매개변수는 STRATEGY_DEFAULTS)
+SCENARIOS = {
+    1: 'FixedDelayStrategy',
+    2: 'ProgressiveIncreaseDelayStrategy',
+    3: 'ProgressiveDecreaseDelayStrategy',
+    4: 'StepDelayStrategy',
+    5: 'NoResponseDelayStrategy',
+    6: 'RandomDelayStrategy'
+}
+
+# 단계별로 보관하는 최근 요청 샘플 수
+MAX_PHASE_SAMPLES = 10000
+
+
+def _distribution(values_ms):
+    """
+    밀리초 값 목록의 분포 요약
+
+    Args:
+        values_ms (iterable): 밀리초 값
+
+    Returns:
+        dict: 평균, p50, p99, 최대값 (값이 없으면 빈 dict)
+    """
+    values = np.array(values_ms, dtype=np.float64)
+    if values.size == 0:
+        return {}
+    p50, p99 = np.percentile(values, [50, 99])
+    return {
+        'mean_ms': float(values.mean()),
+        'p50_ms': float(p50),
+        'p99_ms': float(p99),
+        'max_ms': float(values.max())
+    }
+
+
+class ScenarioRunner:
+    """
+    시나리오 자동 실행기
+
+    백그라운드 스레드가 단계 시작 시각마다 지연 시뮬레이터의 전략을 전환
+    단계 판별은 실행 기준 시각으로부터의 경과 시간으로 계산하므로 스레드 스케줄링과 무관
+    """
+
+    def __init__(self, simulator):
+        """
+        시나리오 자동 실행기 초기화
+
+        Args:
+            simulator (DelaySimulator): 전략을 전환할 지연 시뮬레이터
+        """
+        self.simulator = simulator
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self.phases = []
+        self._phase_starts_ns = []
+        self.total_ns = 0
+        self.origin_ns = None
+        self.restore = True
+
+    @staticmethod
+    def _normalize_phase(entry):
+        """
+        단계 정의를 (전략 이름, 매개변수, 지속 시간)으로 정규화
+
+        Args:
+            entry (dict): {'scenario': 1~6 또는 전략 이름, 'params': 매개변수, 'duration': 지속 시간(초)}
+
+        Returns:
+            dict: 정규화된 단계 정의
+
+        Raises:
+            ValueError: 알 수 없는 시나리오 또는 유효하지 않은 지속 시간
+        """
+        scenario = entry.get('scenario')
+        duration = float(entry.get('duration', 0))
+        if duration <= 0:
+            raise ValueError(f"단계 지속 시간은 0보다 커야 합니다: {entry}")
+
+        if isinstance(scenario, str) and scenario.isdigit():
+            scenario = int(scenario)
+        if isinstance(scenario, int):
+            if scenario not in SCENARIOS:
+                raise ValueError(f"유효하지 않은 시나리오 번호: {scenario}")
+            strategy_name = SCENARIOS[scenario]
+        elif isinstance(scenario, str) and scenario:
+            strategy_name = scenario
+        else:
+            raise ValueError(f"시나리오가 지정되지 않았습니다: {entry}")
+
+        # 요약에 실제 적용된 값이 보이도록 기본 매개변수를 채움
+        params = dict(STRATEGY_DEFAULTS.get(strategy_name, {}))
+        params.update(entry.get('params') or {})
+        return {
+            'scenario': scenario,
+            'strategy': strategy_name,
+            'params': params,
+            'duration': duration
+        }
+
+    def start(self, phases, restore=True):
+        """
+        시나리오 실행 시작
+
+        Args:
+            phases (list): 단계 정의 목록
+            restore (bool, optional): 실행이 끝나면 실행 전 전략으로 되돌릴지 여부
+
+        Raises:
+            ValueError: 이미 실행 중이거나 단계 정의가 유효하지 않은 경우
+        """
+        if self.is_running():
+            raise ValueError("시나리오가 이미 실행 중입니다.")
+        if not phases:
+            raise ValueError("최소 하나의 단계가 필요합니다.")
+
+        normalized = [self._normalize_phase(entry) for entry in phases]
+        # 모든 단계 전략을 미리 만들어 보아 실행 중 설정 오류를 방지
+        for phase in normalized:
+            self.simulator._create_strategy(phase['strategy'], phase['params'])
+
+        starts_ns = []
+        elapsed_ns = 0
+        for phase in normalized:
+            starts_ns.append(elapsed_ns)
+            elapsed_ns += int(phase['duration'] * 1_000_000_000)
+            phase.update({
+                'switched_ns': None,
+                'requests': 0,
+                'dropped': 0,
+                'requested_ms': deque(maxlen=MAX_PHASE_SAMPLES),
+                'actual_ms': deque(maxlen=MAX_PHASE_SAMPLES)
+            })
+
+        with self._lock:
+            self.phases = normalized
+            self._phase_starts_ns = starts_ns
+            self.total_ns = elapsed_ns
+            self.restore = restore
+            self._previous_spec = self.simulator._get_strategy_spec()
+            self._stop.clear()
+            self.origin_ns = self.simulator.clock.now_ns()
+
+        self._thread = threading.Thread(target=self._run, name='scenario-runner', daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        """
+        단계 시작 시각마다 전략 전환 (실행 스레드)
+        """
+        clock = self.simulator.clock
+        for index, phase in enumerate(self.phases):
+            deadline_ns = self.origin_ns + self._phase_starts_ns[index]
+            if clock.sleep_until(deadline_ns, precise=True, event=self._stop):
+                break
+            self.simulator.set_strategy(phase['strategy'], phase['params'])
+            with self._lock:
+                phase['switched_ns'] = clock.now_ns() - deadline_ns
+        else:
+            clock.sleep_until(self.origin_ns + self.total_ns, precise=True, event=self._stop)
+
+        if self.restore:
+            strategy_name, params = self._previous_spec
+            self.simulator.set_strategy(strategy_name, params)
+
+    def stop(self):
+        """
+        실행 중인 시나리오 중단 (실행 전 전략 복원 여부는 start()의 restore를 따름)
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def join(self, timeout=None):
+        """
+        시나리오 실행 종료까지 대기
+
+        Args:
+            timeout (float, optional): 최대 대기 시간(초)
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def is_running(self):
+        """
+        실행 중 여부 반환
+
+        Returns:
+            bool: 실행 스레드가 살아 있으면 True
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def current_phase(self):
+        """
+        현재 시각의 활성 단계 인덱스 반환
+
+        Returns:
+            int: 단계 인덱스 (실행 중이 아니면 None)
+        """
+        if not self.is_running() or self._stop.is_set():
+            return None
+        elapsed_ns = self.simulator.clock.now_ns() - self.origin_ns
+        if elapsed_ns < 0 or elapsed_ns >= self.total_ns:
+            return None
+        return bisect.bisect_right(self._phase_starts_ns, elapsed_ns) - 1
+
+    def observe(self, phase_index, record):
+        """
+        요청 결과를 단계 통계에 기록
+
+        Args:
+            phase_index (int): 요청 도착 시 활성 단계 인덱스 (None이면 무시)
+            record (dict): DelaySimulator.apply_delay()의 계측 결과
+        """
+        if phase_index is None or record is None:
+            return
+        with self._lock:
+            if phase_index >= len(self.phases):
+                return
+            phase = self.phases[phase_index]
+            phase['requests'] += 1
+            if record.get('dropped'):
+                phase['dropped'] += 1
+            phase['requested_ms'].append(record['requested_ms'])
+            phase['actual_ms'].append(record['actual_ms'])
+
+    def get_status(self):
+        """
+        실행 상태와 단계별 요약 반환
+
+        Returns:
+            dict: 실행 여부, 현재 단계, 경과 시간, 단계별 요청 수/손실 수/지연 분포
+        """
+        with self._lock:
+            phases = []
+            for index, phase in enumerate(self.phases):
+                switched_ns = phase['switched_ns']
+                phases.append({
+                    'index': index,
+                    'scenario': phase['scenario'],
+                    'strategy': phase['strategy'],
+                    'params': phase['params'],
+                    'duration': phase['duration'],
+                    'start_offset': self._phase_starts_ns[index] / 1_000_000_000,
+                    'switch_error_ms': switched_ns / 1_000_000 if switched_ns is not None else None,
+                    'requests': phase['requests'],
+                    'dropped': phase['dropped'],
+                    'requested': _distribution(phase['requested_ms']),
+                    'actual': _distribution(phase['actual_ms'])
+                })
+
+        elapsed = None
+        if self.origin_ns is not None:
+            elapsed = (self.simulator.clock.now_ns() - self.origin_ns) / 1_000_000_000
+        return {
+            'running': self.is_running(),
+            'phase': self.current_phase(),
+            'elapsed': elapsed,
+            'total_duration': self.total_ns / 1_000_000_000,
+            'phases': phases
+        }
@@ -0,0 +1,134 @@
+"""
+프로세스 간 지연 전략 공유 상태
+
+여러 워커 프로세스가 같은 지연 일정을 따르도록 현재 전략 설정과 타임라인 기준 시각을
+multiprocessing.shared_memory 블록에 저장
+
+블록 구조:
+    [0:8]   버전 카운터 (uint64, 쓰기 중에는 홀수)
+    [8:16]  타임라인 기준 시각 (int64, 나노초)
+    [16:20] 설정 JSON 길이 (uint32)
+    [20:]   설정 JSON (UTF-8)
+
+읽기 쪽은 버전 카운터만 비교하므로 요청 처리 경로에서 RPC나 잠금이 필요 없음
+"""
+
+import os
+import json
+import time
+import fcntl
+import struct
+import tempfile
+from multiprocessing import shared_memory, resource_tracker
+
+DEFAULT_SHARED_STATE_SIZE = 64 * 1024
+
+_HEADER = struct.Struct('<QqI')
+_VERSION = struct.Struct('<Q')
+
+
+class SharedDelayState:
+    """
+    공유 메모리 기반 지연 전략 상태
+
+    쓰기는 파일 잠금으로 프로세스 간 직렬화하고, 읽기는 버전 카운터를 이용한
+    시퀀스 잠금(seqlock) 방식으로 일관된 스냅샷을 얻음
+    """
+
+    def __init__(self, name='dtlt_delay_state', size=DEFAULT_SHARED_STATE_SIZE):
+        """
+        공유 상태 초기화 (블록이 없으면 생성, 있으면 연결)
+
+        Args:
+            name (str, optional): 공유 메모리 블록 이름
+            size (int, optional): 블록 크기(바이트)
+        """
+        self.name = name
+        try:
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            self._shm = shared_memory.SharedMemory(name=name)
+
+        # 워커 종료 시 resource_tracker가 블록을 해제하지 않도록 추적 해제
+        try:
+            resource_tracker.unregister(self._shm._name, 'shared_memory')
+        except Exception:
+            pass
+
+        self._buf = self._shm.buf
+        self._lock_path = os.path.join(tempfile.gettempdir(), f'{name}.lock')
+
+    def read_version(self):
+        """
+        현재 버전 카운터 반환
+
+        Returns:
+            int: 버전 카운터 (0이면 아직 설정이 기록되지 않음)
+        """
+        return _VERSION.unpack_from(self._buf, 0)[0]
+
+    def read(self):
+        """
+        일관된 상태 스냅샷 읽기
+
+        Returns:
+            tuple: (버전, 기준 시각(나노초), 전략 설정 dict 또는 None)
+        """
+        while True:
+            version, origin_ns, length = _HEADER.unpack_from(self._buf, 0)
+            if version % 2 == 1:
+                # 쓰기 진행 중
+                time.sleep(0)
+                continue
+
+            payload = bytes(self._buf[_HEADER.size:_HEADER.size + length])
+            if self.read_version() != version:
+                continue
+
+            config = json.loads(payload.decode('utf-8')) if length else None
+            return version, origin_ns, config
+
+    def write(self, config, origin_ns):
+        """
+        전략 설정과 기준 시각 기록
+
+        Args:
+            config (dict): {'strategy': 전략 이름, 'params': 매개변수}
+            origin_ns (int): 타임라인 기준 시각(나노초)
+
+        Returns:
+            int: 기록 후 버전 카운터
+
+        Raises:
+            ValueError: 설정이 블록 크기를 초과하는 경우
+        """
+        payload = json.dumps(config).encode('utf-8')
+        if _HEADER.size + len(payload) > self._shm.size:
+            raise ValueError(f"공유 지연 설정이 너무 큽니다: {len(payload)} bytes")
+
+        with open(self._lock_path, 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                version = self.read_version()
+                _VERSION.pack_into(self._buf, 0, version + 1)
+                self._buf[_HEADER.size:_HEADER.size + len(payload)] = payload
+                _HEADER.pack_into(self._buf, 0, version + 1, origin_ns, len(payload))
+                _VERSION.pack_into(self._buf, 0, version + 2)
+                return version + 2
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def close(self):
+        """
+        현재 프로세스에서 블록 연결 해제
+        """
+        self._buf = None
+        self._shm.close()
+
+    def unlink(self):
+        """
+        공유 메모리 블록 삭제 (모든 워커 종료 후 한 번 호출)
+        """
+        # SharedMemory.unlink()가 추적 해제를 다시 요청하므로 먼저 재등록
+        resource_tracker.register(self._shm._name, 'shared_memory')
+        self._shm.unlink()
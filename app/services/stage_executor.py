@@ -0,0 +1,235 @@
+"""
+파이프라인 단계 프로세스 풀 실행기
+
+CPU 사용량이 큰 포즈 파이프라인 단계(이미지 디코딩, 특징 매칭 등)를 ProcessPoolExecutor에서 실행
+이미지 바이트는 피클링하지 않고 multiprocessing.shared_memory 블록으로 전달하며,
+지연 시뮬레이션은 계속 프런트엔드 프로세스에서 수행됨
+단계가 사용하는 프런트엔드 전역 상태(포즈 변형 시드, 선박 배치, 변환 그래프)는 워커 초기화 시 전달하고,
+이후 바뀌면 단계 실행 요청과 함께 다시 전달함
+"""
+
+import importlib
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from app.services.image_processor import get_pose_noise_seed, set_pose_noise_seed
+from app.services.zone_index import get_zone_index, load_layout
+from app.services.transform_graph import default_graph
+
+# 워커로 보내지 않는 컨텍스트 속성 (이미지는 공유 메모리로, 원본 요청과 계측 정보는 프런트엔드에 유지)
+_LOCAL_ATTRIBUTES = ('image_bytes', 'image_data', 'timings_ns')
+
+
+class StageQueueFull(Exception):
+    """
+    단계 실행 대기열 초과 예외
+
+    대기 중이거나 실행 중인 단계 수가 max_pending에 도달한 경우 발생
+    """
+
+
+# 워커 프로세스에 적용된 전역 상태 버전 (0은 초기화 시 전달한 상태)
+_worker_state_version = 0
+
+
+def _global_state_key():
+    """
+    프런트엔드 전역 상태의 변경 여부를 판단하는 키
+
+    Returns:
+        tuple: (포즈 변형 시드, 선박 배치 색인 객체, 변환 그래프 버전)
+    """
+    return (get_pose_noise_seed(), get_zone_index(), default_graph.version)
+
+
+def _global_state():
+    """
+    워커에 전달할 프런트엔드 전역 상태
+
+    Returns:
+        dict: {'pose_noise_seed', 'zone_layout', 'transform_graph'}
+    """
+    zone_index = get_zone_index()
+    return {
+        'pose_noise_seed': get_pose_noise_seed(),
+        'zone_layout': zone_index.layout if zone_index is not None else None,
+        'transform_graph': default_graph.get_config()
+    }
+
+
+def _apply_global_state(global_state):
+    """
+    워커 프로세스에 프런트엔드 전역 상태 적용
+
+    Args:
+        global_state (dict): _global_state()의 반환값
+    """
+    set_pose_noise_seed(global_state['pose_noise_seed'])
+    load_layout(global_state['zone_layout'])
+    default_graph.load(global_state['transform_graph'])
+
+
+def _init_worker(stage_modules, global_state):
+    """
+    워커 프로세스 초기화 (추가 단계 구현 모듈 로드, 프런트엔드 전역 상태 적용)
+
+    Args:
+        stage_modules (tuple): register_stage()로 단계를 등록하는 모듈 이름 목록
+        global_state (dict): 실행기 생성 시점의 프런트엔드 전역 상태
+    """
+    importlib.import_module('app.services.pose_pipeline')
+    for module in stage_modules:
+        importlib.import_module(module)
+    _apply_global_state(global_state)
+
+
+def _run_stage_in_worker(kind, name, shm_name, length, state, global_state=None):
+    """
+    워커 프로세스에서 단계 하나 실행
+
+    Args:
+        kind (str): 단계 종류
+        name (str): 구현 이름
+        shm_name (str): 이미지 바이트가 담긴 공유 메모리 블록 이름 (없으면 None)
+        length (int): 이미지 바이트 길이
+        state (dict): 컨텍스트 속성
+        global_state (tuple, optional): 실행기 생성 후 바뀐 전역 상태 (버전, 상태)
+
+    Returns:
+        dict: 단계 실행 후 컨텍스트 속성 (이미지 바이트 제외)
+    """
+    from app.services.pose_pipeline import PipelineContext, get_stage
+    global _worker_state_version
+
+    if global_state is not None and global_state[0] != _worker_state_version:
+        _apply_global_state(global_state[1])
+        _worker_state_version = global_state[0]
+
+    context = PipelineContext(None)
+    context.__dict__.update(state)
+    if shm_name is not None:
+        shm = shared_memory.SharedMemory(name=shm_name)
+        try:
+            context.image_bytes = bytes(shm.buf[:length])
+        finally:
+            shm.close()
+
+    get_stage(kind, name)(context)
+    return {key: value for key, value in context.__dict__.items() if key not in _LOCAL_ATTRIBUTES}
+
+
+class StageExecutor:
+    """
+    파이프라인 단계 프로세스 풀 실행기
+    """
+
+    def __init__(self, max_workers=None, max_pending=None, submit_timeout=None, mp_context='spawn', stage_modules=()):
+        """
+        파이프라인 단계 프로세스 풀 실행기 초기화
+
+        Args:
+            max_workers (int, optional): 워커 프로세스 수 (기본값: CPU 수)
+            max_pending (int, optional): 동시에 대기/실행할 수 있는 최대 단계 수 (기본값: 워커 수의 2배)
+            submit_timeout (float, optional): 대기열 자리를 기다리는 최대 시간(초) (None이면 무한 대기)
+            mp_context (str, optional): 프로세스 시작 방식 ('spawn', 'forkserver', 'fork')
+            stage_modules (tuple, optional): 워커에서 미리 로드할 단계 구현 모듈 이름 목록
+        """
+        self.max_workers = max_workers or multiprocessing.cpu_count()
+        self.max_pending = max_pending or self.max_workers * 2
+        self.submit_timeout = submit_timeout
+        self.stage_modules = tuple(stage_modules)
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.rejected = 0
+        # 워커 초기화 후 전역 상태가 바뀌면 (버전, 상태)를 단계 실행 요청과 함께 전달
+        self._state_key = _global_state_key()
+        self._state_version = 0
+        self._global_state = None
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context(mp_context),
+            initializer=_init_worker,
+            initargs=(self.stage_modules, _global_state())
+        )
+
+    def _current_global_state(self):
+        """
+        워커에 전달할 바뀐 전역 상태
+
+        Returns:
+            tuple: (버전, 상태) (워커 초기화 후 바뀌지 않았으면 None)
+        """
+        key = _global_state_key()
+        with self._lock:
+            if key != self._state_key:
+                self._state_key = key
+                self._state_version += 1
+                self._global_state = (self._state_version, _global_state())
+            return self._global_state
+
+    def run_stage(self, kind, name, context):
+        """
+        워커 프로세스에서 단계를 실행하고 결과를 컨텍스트에 반영
+
+        Args:
+            kind (str): 단계 종류
+            name (str): 구현 이름
+            context (PipelineContext): 파이프라인 실행 상태
+
+        Raises:
+            StageQueueFull: 대기열 자리를 얻지 못한 경우
+        """
+        if not self._slots.acquire(timeout=self.submit_timeout):
+            with self._lock:
+                self.rejected += 1
+            raise StageQueueFull(f"{kind} 단계 대기열이 가득 찼습니다 (max_pending={self.max_pending})")
+
+        shm = None
+        try:
+            image_bytes = context.image_bytes or b''
+            if image_bytes:
+                shm = shared_memory.SharedMemory(create=True, size=len(image_bytes))
+                shm.buf[:len(image_bytes)] = image_bytes
+            state = {key: value for key, value in context.__dict__.items() if key not in _LOCAL_ATTRIBUTES}
+
+            with self._lock:
+                self.submitted += 1
+            future = self._pool.submit(
+                _run_stage_in_worker, kind, name,
+                shm.name if shm is not None else None, len(image_bytes), state,
+                self._current_global_state()
+            )
+            context.__dict__.update(future.result())
+        finally:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+            self._slots.release()
+
+    def get_config(self):
+        """
+        실행기 설정과 통계 반환
+
+        Returns:
+            dict: 워커 수, 대기열 한도, 제출/거부 수
+        """
+        with self._lock:
+            return {
+                'max_workers': self.max_workers,
+                'max_pending': self.max_pending,
+                'submit_timeout': self.submit_timeout,
+                'submitted': self.submitted,
+                'rejected': self.rejected
+            }
+
+    def shutdown(self, wait=True):
+        """
+        워커 프로세스 종료
+
+        Args:
+            wait (bool, optional): 실행 중인 단계가 끝날 때까지 기다릴지 여부
+        """
+        self._pool.shutdown(wait=wait)
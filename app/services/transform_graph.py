@@ -0,0 +1,266 @@
+"""
+좌표계 변환 그래프
+
+이름 붙은 좌표계(ship, deck:N, body, camera:K 등)와 부모-자식 강체 변환을 등록하고,
+포즈 배열을 한 좌표계에서 다른 좌표계로 배치 변환
+측위 결과는 카메라의 포즈이며, subject='body'를 지정하면 카메라 장착 변환(body → camera:K)을 적용하여 몸체 포즈로 바꿈
+"""
+
+import json
+import threading
+
+import numpy as np
+
+from app.services.pose_math import quat_normalize, quat_multiply, quat_rotate, pose_compose, pose_inverse
+
+# 측위 결과의 기본 좌표계
+DEFAULT_LOCALIZATION_FRAME = 'ship'
+
+# 포즈가 나타내는 대상
+SUBJECTS = ('camera', 'body')
+
+_IDENTITY_TRANSLATION = (0.0, 0.0, 0.0)
+_IDENTITY_QUATERNION = (0.0, 0.0, 0.0, 1.0)
+
+
+def deck_frame(deck):
+    """
+    데크 좌표계 이름
+
+    Args:
+        deck (int): 데크 번호
+
+    Returns:
+        str: 'deck:N'
+    """
+    return f"deck:{deck}"
+
+
+def camera_frame(camera_id):
+    """
+    카메라 좌표계 이름
+
+    Args:
+        camera_id (int): 카메라 ID
+
+    Returns:
+        str: 'camera:K'
+    """
+    return f"camera:{camera_id}"
+
+
+class TransformGraph:
+    """
+    좌표계 변환 그래프
+
+    각 좌표계는 부모를 하나만 가지는 숲(forest) 구조이며, 같은 트리에 속한 좌표계 사이에서만 변환 가능
+    """
+
+    def __init__(self, localization_frame=DEFAULT_LOCALIZATION_FRAME):
+        """
+        좌표계 변환 그래프 초기화
+
+        Args:
+            localization_frame (str, optional): 측위 결과 포즈의 좌표계
+        """
+        self._lock = threading.Lock()
+        self._parents = {}
+        self._cache = {}
+        self.localization_frame = localization_frame
+        # 변환이 바뀔 때마다 증가 (프로세스 풀 워커 동기화에 사용)
+        self.version = 0
+
+    def set_transform(self, parent, child, translation=_IDENTITY_TRANSLATION, quaternion=_IDENTITY_QUATERNION):
+        """
+        부모 좌표계에서 본 자식 좌표계의 포즈 등록 (기존 부모는 대체)
+
+        Args:
+            parent (str): 부모 좌표계
+            child (str): 자식 좌표계
+            translation (list, optional): 부모 좌표계에서 자식 원점의 위치 [x, y, z]
+            quaternion (list, optional): 부모 좌표계에서 자식 축의 회전 [x, y, z, w]
+
+        Raises:
+            ValueError: 순환이 생기거나 값의 차원이 잘못된 경우
+        """
+        translation = np.asarray(translation, dtype=np.float64)
+        quaternion = np.asarray(quaternion, dtype=np.float64)
+        if translation.shape != (3,) or quaternion.shape != (4,):
+            raise ValueError(f"{parent} → {child} 변환의 translation/quaternion 차원이 잘못되었습니다")
+        with self._lock:
+            frame = parent
+            while frame is not None:
+                if frame == child:
+                    raise ValueError(f"{parent} → {child} 변환이 순환을 만듭니다")
+                frame = self._parents.get(frame, (None,))[0]
+            self._parents[child] = (parent, translation, quat_normalize(quaternion))
+            self._cache.clear()
+            self.version += 1
+
+    def load(self, config):
+        """
+        설정에서 변환 목록 적재 (기존 변환은 모두 제거)
+
+        Args:
+            config (dict): {'localization_frame': str, 'transforms': [{'parent', 'child', 'translation', 'quaternion'}, ...]}
+        """
+        with self._lock:
+            self._parents.clear()
+            self._cache.clear()
+            self.localization_frame = config.get('localization_frame', DEFAULT_LOCALIZATION_FRAME)
+            self.version += 1
+        for transform in config.get('transforms') or []:
+            self.set_transform(
+                transform['parent'],
+                transform['child'],
+                transform.get('translation', _IDENTITY_TRANSLATION),
+                transform.get('quaternion', _IDENTITY_QUATERNION)
+            )
+
+    def load_file(self, path):
+        """
+        설정 파일(JSON)에서 변환 목록 적재
+
+        Args:
+            path (str): 설정 파일 경로
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            self.load(json.load(f))
+
+    def _to_root(self, frame):
+        """
+        좌표계에서 루트 좌표계로 가는 변환 (잠금을 잡은 상태에서 호출)
+
+        Args:
+            frame (str): 좌표계
+
+        Returns:
+            tuple: (루트 좌표계, 이동, 회전) - 루트 좌표계에서 본 frame의 포즈
+        """
+        translation = np.zeros(3)
+        quaternion = np.array(_IDENTITY_QUATERNION)
+        while frame in self._parents:
+            parent, t, q = self._parents[frame]
+            translation, quaternion = pose_compose(t, q, translation, quaternion)
+            frame = parent
+        return frame, translation, quaternion
+
+    def lookup(self, target, source):
+        """
+        source 좌표계의 포즈를 target 좌표계로 바꾸는 변환 (target에서 본 source의 포즈)
+
+        Args:
+            target (str): 대상 좌표계
+            source (str): 원래 좌표계
+
+        Returns:
+            tuple: (이동 numpy.ndarray (3,), 회전 numpy.ndarray (4,))
+
+        Raises:
+            ValueError: 두 좌표계가 연결되어 있지 않은 경우
+        """
+        with self._lock:
+            cached = self._cache.get((target, source))
+            if cached is not None:
+                return cached
+            if target == source:
+                result = (np.zeros(3), np.array(_IDENTITY_QUATERNION))
+            else:
+                source_root, t_source, q_source = self._to_root(source)
+                target_root, t_target, q_target = self._to_root(target)
+                if source_root != target_root:
+                    raise ValueError(f"좌표계 {source}에서 {target}(으)로 가는 변환이 없습니다")
+                result = pose_compose(*pose_inverse(t_target, q_target), t_source, q_source)
+            self._cache[(target, source)] = result
+            return result
+
+    def _gather(self, targets, sources):
+        """
+        행마다 (target, source) 변환을 모은 배열 생성 (같은 쌍은 한 번만 조회)
+
+        Args:
+            targets (list): 행별 대상 좌표계
+            sources (list): 행별 원래 좌표계
+
+        Returns:
+            tuple: ((N, 3) 이동, (N, 4) 회전)
+        """
+        pairs = {}
+        rows = np.fromiter((pairs.setdefault(pair, len(pairs)) for pair in zip(targets, sources)),
+                           dtype=np.intp, count=len(targets))
+        table = [self.lookup(target, source) for target, source in pairs]
+        translations = np.array([t for t, _ in table])
+        quaternions = np.array([q for _, q in table])
+        return translations[rows], quaternions[rows]
+
+    def transform_poses(self, positions, quaternions, sources, targets, cameras=None):
+        """
+        포즈 배열을 좌표계 사이에서 배치 변환
+
+        Args:
+            positions (array_like): (N, 3) 위치
+            quaternions (array_like): (N, 4) 회전
+            sources (str 또는 list): 원래 좌표계 (행별 목록 가능)
+            targets (str 또는 list): 대상 좌표계 (행별 목록 가능)
+            cameras (list, optional): 행별 카메라 ID (지정하면 카메라 포즈를 몸체 포즈로 변환)
+
+        Returns:
+            tuple: ((N, 3) 위치, (N, 4) 회전)
+        """
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        quaternions = quat_normalize(np.asarray(quaternions, dtype=np.float64).reshape(-1, 4))
+        count = len(positions)
+        if isinstance(sources, str):
+            sources = [sources] * count
+        if isinstance(targets, str):
+            targets = [targets] * count
+
+        if cameras is not None:
+            # 카메라 포즈 ∘ (카메라에서 본 몸체의 포즈) = 몸체 포즈
+            t_mount, q_mount = self._gather([camera_frame(camera) for camera in cameras], ['body'] * count)
+            positions = positions + quat_rotate(quaternions, t_mount)
+            quaternions = quat_normalize(quat_multiply(quaternions, q_mount))
+
+        t_frame, q_frame = self._gather(targets, sources)
+        return t_frame + quat_rotate(q_frame, positions), quat_normalize(quat_multiply(q_frame, quaternions))
+
+    def get_config(self):
+        """
+        등록된 변환 목록 반환
+
+        Returns:
+            dict: {'localization_frame': str, 'transforms': [{'parent', 'child', 'translation', 'quaternion'}, ...]}
+        """
+        with self._lock:
+            return {
+                'localization_frame': self.localization_frame,
+                'transforms': [
+                    {
+                        'parent': parent,
+                        'child': child,
+                        'translation': translation.tolist(),
+                        'quaternion': quaternion.tolist()
+                    }
+                    for child, (parent, translation, quaternion) in self._parents.items()
+                ]
+            }
+
+
+# 기본 변환 그래프 인스턴스 (파이프라인의 'transform' 단계와 배치 처리에서 사용)
+default_graph = TransformGraph()
+
+
+def resolve_target_frames(output_frame, zones):
+    """
+    요청한 출력 좌표계를 행별 좌표계 이름으로 변환 ('deck'은 각 포즈의 데크 좌표계)
+
+    Args:
+        output_frame (str): 출력 좌표계 이름 또는 'deck'
+        zones (list): 행별 ZoneBlock
+
+    Returns:
+        list: 행별 좌표계 이름
+    """
+    if output_frame == 'deck':
+        return [deck_frame(zone.deck) for zone in zones]
+    return [output_frame] * len(zones)
@@ -0,0 +1,289 @@
+"""
+선박 구역 공간 색인
+
+선박 배치 파일(데크 높이 범위, 데크별 구획 상자)을 균일 격자로 색인하여
+position_m이 속한 데크/구획/영역 ID(ZoneBlock)를 찾음
+조회는 격자 셀의 후보 구획만 검사하며, 여러 위치를 NumPy 배열 연산으로 한 번에 조회할 수 있음
+"""
+
+import json
+import math
+import bisect
+
+import numpy as np
+
+from app.models.frame_packet import ZoneBlock
+
+# 격자 셀 수 상한 (데크 수 × 셀 수, 너무 작은 cell_size로 인한 메모리 사용 방지)
+MAX_GRID_CELLS = 4_000_000
+
+
+class ZoneIndex:
+    """
+    선박 구역 공간 색인
+
+    배치 형식:
+        {
+            "vertical_axis": 1,
+            "cell_size": 2.0,
+            "decks": [
+                {"deck": 1, "height": [0.0, 3.0], "compartments": [
+                    {"compartment": "Engine", "zone_id": 101, "min": [0.0, 0.0], "max": [20.0, 12.0]}
+                ]}
+            ]
+        }
+
+    vertical_axis는 높이 축(Unity 기준 y축 = 1)이며, 구획 상자의 min/max는 나머지 두 축의 좌표(축 번호 순서)
+    구획 경계는 min 포함, max 제외이며, 구획이 겹치면 배치 파일에 먼저 나온 구획이 우선
+    """
+
+    def __init__(self, layout):
+        """
+        선박 구역 공간 색인 생성
+
+        Args:
+            layout (dict): 선박 배치
+
+        Raises:
+            ValueError: 잘못된 배치 (겹치는 데크 높이, 잘못된 상자, 너무 많은 격자 셀 등)
+        """
+        # 원본 배치 (프로세스 풀 워커에 같은 색인을 만들 때 사용)
+        self.layout = layout
+        self.vertical_axis = int(layout.get('vertical_axis', 1))
+        if self.vertical_axis not in (0, 1, 2):
+            raise ValueError(f"vertical_axis는 0, 1, 2 중 하나여야 합니다: {self.vertical_axis}")
+        self.horizontal_axes = [axis for axis in range(3) if axis != self.vertical_axis]
+        self.cell_size = float(layout.get('cell_size', 1.0))
+        if self.cell_size <= 0:
+            raise ValueError(f"cell_size는 0보다 커야 합니다: {self.cell_size}")
+
+        decks = sorted(layout.get('decks') or [], key=lambda deck: deck['height'][0])
+        if not decks:
+            raise ValueError("배치에 데크가 없습니다")
+
+        self.deck_numbers = []
+        deck_low, deck_high = [], []
+        self.compartments = []
+        box_min, box_max, box_deck = [], [], []
+        for deck_index, deck in enumerate(decks):
+            low, high = float(deck['height'][0]), float(deck['height'][1])
+            if high <= low:
+                raise ValueError(f"데크 {deck.get('deck')}의 높이 범위가 잘못되었습니다: {deck['height']}")
+            if deck_high and low < deck_high[-1]:
+                raise ValueError(f"데크 {deck.get('deck')}의 높이 범위가 다른 데크와 겹칩니다")
+            self.deck_numbers.append(deck.get('deck', deck_index + 1))
+            deck_low.append(low)
+            deck_high.append(high)
+
+            for compartment in deck.get('compartments') or []:
+                lower = [float(value) for value in compartment['min']]
+                upper = [float(value) for value in compartment['max']]
+                if len(lower) != 2 or len(upper) != 2 or lower[0] >= upper[0] or lower[1] >= upper[1]:
+                    raise ValueError(f"구획 {compartment.get('compartment')}의 상자가 잘못되었습니다")
+                self.compartments.append((
+                    self.deck_numbers[-1],
+                    compartment.get('compartment', ""),
+                    compartment.get('zone_id', 0)
+                ))
+                box_min.append(lower)
+                box_max.append(upper)
+                box_deck.append(deck_index)
+
+        if not self.compartments:
+            raise ValueError("배치에 구획이 없습니다")
+
+        self._deck_low_list = deck_low
+        self._deck_high_list = deck_high
+        self._deck_low = np.array(deck_low)
+        self._deck_high = np.array(deck_high)
+        self._box_min = np.array(box_min)
+        self._box_max = np.array(box_max)
+        self._boxes = [tuple(lower) + tuple(upper) for lower, upper in zip(box_min, box_max)]
+        self._build_grid(box_deck)
+
+    def _build_grid(self, box_deck):
+        """
+        데크별 균일 격자 생성 (각 셀에 겹치는 구획 번호를 배치 순서대로 저장, 빈 자리는 -1)
+
+        Args:
+            box_deck (list): 구획별 데크 인덱스
+        """
+        self._origin = self._box_min.min(axis=0).tolist()
+        extent = self._box_max.max(axis=0) - self._origin
+        self._shape = tuple(max(1, math.ceil(value / self.cell_size)) for value in extent)
+        total = len(self.deck_numbers) * self._shape[0] * self._shape[1]
+        if total > MAX_GRID_CELLS:
+            raise ValueError(f"격자 셀이 너무 많습니다 ({total}개), cell_size를 늘리세요")
+
+        cells = {}
+        first = np.floor((self._box_min - self._origin) / self.cell_size).astype(int)
+        last = np.ceil((self._box_max - self._origin) / self.cell_size).astype(int) - 1
+        for index, deck_index in enumerate(box_deck):
+            for i in range(first[index, 0], last[index, 0] + 1):
+                for j in range(first[index, 1], last[index, 1] + 1):
+                    cells.setdefault((deck_index, i, j), []).append(index)
+
+        self.max_candidates = max(len(candidates) for candidates in cells.values())
+        self._grid = np.full((len(self.deck_numbers),) + self._shape + (self.max_candidates,), -1, dtype=np.int32)
+        for (deck_index, i, j), candidates in cells.items():
+            self._grid[deck_index, i, j, :len(candidates)] = candidates
+        # 위치 하나를 조회할 때는 배열 연산 대신 셀 후보 목록을 직접 사용
+        self._cells = cells
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        배치 파일(JSON)에서 색인 생성
+
+        Args:
+            path (str): 배치 파일 경로
+
+        Returns:
+            ZoneIndex: 생성된 색인
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def lookup(self, positions):
+        """
+        위치 목록이 속한 구획 번호 조회
+
+        Args:
+            positions (array_like): (N, 3) 위치 [x, y, z]
+
+        Returns:
+            numpy.ndarray: (N,) 구획 번호 (어느 구획에도 속하지 않으면 -1)
+        """
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        count = len(positions)
+
+        height = positions[:, self.vertical_axis]
+        deck = np.searchsorted(self._deck_low, height, side='right') - 1
+        deck = np.clip(deck, 0, len(self.deck_numbers) - 1)
+        valid = (height >= self._deck_low[deck]) & (height < self._deck_high[deck])
+
+        plane = positions[:, self.horizontal_axes]
+        cell = np.floor((plane - self._origin) / self.cell_size).astype(np.int64)
+        valid &= np.all((cell >= 0) & (cell < self._shape), axis=1)
+        cell = np.clip(cell, 0, np.array(self._shape) - 1)
+
+        candidates = self._grid[deck, cell[:, 0], cell[:, 1]]
+        candidates[~valid] = -1
+        safe = np.maximum(candidates, 0)
+        inside = (candidates >= 0) & np.all(
+            (plane[:, None, :] >= self._box_min[safe]) & (plane[:, None, :] < self._box_max[safe]),
+            axis=2
+        )
+        first = np.argmax(inside, axis=1)
+        return np.where(inside.any(axis=1), candidates[np.arange(count), first], -1)
+
+    def zone_block(self, index):
+        """
+        구획 번호를 ZoneBlock으로 변환
+
+        Args:
+            index (int): 구획 번호
+
+        Returns:
+            ZoneBlock: 영역 정보 (index가 음수이면 None)
+        """
+        if index < 0:
+            return None
+        deck, compartment, zone_id = self.compartments[index]
+        return ZoneBlock(deck=deck, compartment=compartment, zone_id=zone_id)
+
+    def resolve(self, position):
+        """
+        위치 하나가 속한 영역 조회
+
+        Args:
+            position (list): 위치 [x, y, z]
+
+        Returns:
+            ZoneBlock: 영역 정보 (어느 구획에도 속하지 않으면 None)
+        """
+        height = position[self.vertical_axis]
+        deck_index = bisect.bisect_right(self._deck_low_list, height) - 1
+        if deck_index < 0 or height >= self._deck_high_list[deck_index]:
+            return None
+        u = position[self.horizontal_axes[0]]
+        v = position[self.horizontal_axes[1]]
+        i = math.floor((u - self._origin[0]) / self.cell_size)
+        j = math.floor((v - self._origin[1]) / self.cell_size)
+        for index in self._cells.get((deck_index, i, j), ()):
+            u_min, v_min, u_max, v_max = self._boxes[index]
+            if u_min <= u < u_max and v_min <= v < v_max:
+                return self.zone_block(index)
+        return None
+
+    def resolve_batch(self, positions):
+        """
+        여러 위치가 속한 영역 조회
+
+        Args:
+            positions (array_like): (N, 3) 위치
+
+        Returns:
+            list: ZoneBlock 또는 None 목록 (입력 순서 유지)
+        """
+        return [self.zone_block(index) for index in self.lookup(positions).tolist()]
+
+    def get_config(self):
+        """
+        색인 요약 반환
+
+        Returns:
+            dict: 데크/구획 수, 격자 크기, 셀당 최대 후보 수
+        """
+        return {
+            'vertical_axis': self.vertical_axis,
+            'cell_size': self.cell_size,
+            'decks': list(self.deck_numbers),
+            'compartments': len(self.compartments),
+            'grid_shape': list(self._shape),
+            'max_candidates': self.max_candidates
+        }
+
+
+# 현재 적재된 색인 (None이면 클라이언트가 보낸 영역 정보를 그대로 사용)
+_zone_index = None
+
+
+def load_layout(layout):
+    """
+    선박 배치를 적재하여 기본 색인으로 설정
+
+    Args:
+        layout (dict): 선박 배치 (None이면 색인 해제)
+
+    Returns:
+        ZoneIndex: 적재된 색인 (해제한 경우 None)
+    """
+    global _zone_index
+    _zone_index = ZoneIndex(layout) if layout is not None else None
+    return _zone_index
+
+
+def load_layout_file(path):
+    """
+    선박 배치 파일을 적재하여 기본 색인으로 설정
+
+    Args:
+        path (str): 배치 파일 경로 (JSON)
+
+    Returns:
+        ZoneIndex: 적재된 색인
+    """
+    global _zone_index
+    _zone_index = ZoneIndex.from_file(path)
+    return _zone_index
+
+
+def get_zone_index():
+    """
+    현재 적재된 색인 반환
+
+    Returns:
+        ZoneIndex: 색인 (적재되지 않았으면 None)
+    """
+    return _zone_index
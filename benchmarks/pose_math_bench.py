@@ -0,0 +1,64 @@
+"""
+포즈 수학 벤치마크
+
+쿼터니언 1개와 10,000개에 대해 배치 연산과 Python 반복 처리의 소요 시간을 비교
+
+실행:
+    python -m benchmarks.pose_math_bench
+"""
+
+import timeit
+
+import numpy as np
+
+from app.services.pose_math import (
+    quat_normalize,
+    quat_multiply,
+    axis_angle_to_quat,
+    quat_slerp,
+    perturb_quaternions
+)
+
+
+def _legacy_perturb(quaternion, noise):
+    """
+    기존 방식: x, y, z 성분에 균등 잡음을 더하고 정규화 (Python 반복)
+    """
+    quaternion = list(quaternion)
+    for i in range(3):
+        quaternion[i] += 0.2 * noise[i] - 0.1
+    magnitude = sum(q * q for q in quaternion) ** 0.5
+    return [q / magnitude for q in quaternion]
+
+
+def _bench(label, func, number):
+    """
+    호출당 평균 소요 시간 출력
+    """
+    seconds = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f"{label:<40} {seconds * 1e6:>12.2f} us")
+
+
+def main():
+    rng = np.random.default_rng(0)
+    for count in (1, 10_000):
+        q = quat_normalize(rng.normal(size=(count, 4)))
+        r = quat_normalize(rng.normal(size=(count, 4)))
+        u = rng.random((count, 3))
+        axes = rng.normal(size=(count, 3))
+        angles = rng.random(count)
+        number = 2000 if count == 1 else 50
+
+        print(f"\n쿼터니언 {count}개")
+        _bench("quat_normalize", lambda: quat_normalize(q), number)
+        _bench("quat_multiply", lambda: quat_multiply(q, r), number)
+        _bench("axis_angle_to_quat", lambda: axis_angle_to_quat(axes, angles), number)
+        _bench("quat_slerp", lambda: quat_slerp(q, r, 0.5), number)
+        _bench("perturb_quaternions", lambda: perturb_quaternions(q, u), number)
+
+        rows, noise = q.tolist(), u.tolist()
+        _bench("기존 방식 (Python 반복)", lambda: [_legacy_perturb(a, b) for a, b in zip(rows, noise)], number)
+
+
+if __name__ == '__main__':
+    main()
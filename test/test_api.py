@@ -2,6 +2,7 @@
 API 테스트
 """
 
+import os
 import json
 import base64
 import pytest
@@ -99,3 +100,47 @@ def test_set_delay_config(client):
     
     assert response_data['strategy'] == 'FixedDelayStrategy'
     assert response_data['params']['delay_seconds'] == 0.1
+
+def test_set_delay_config_invalid_queueing(client):
+    """
+    유효하지 않은 대기열 모델 설정 거부 테스트
+    """
+    for params in ({'mean_service_time': 0}, {'servers': 0},
+                   {'service_time_sigma': -1.0}, {'service_distribution': 'pareto'}):
+        response = client.post(
+            '/api/delay/config',
+            data=json.dumps({'strategy': 'QueueingDelayStrategy', 'params': params}),
+            content_type='application/json'
+        )
+        assert response.status_code == 400
+        assert 'error' in json.loads(response.data)
+
+def test_delay_metrics(client):
+    """
+    지연 계측 조회 API 테스트
+    """
+    # 이미지 업로드로 지연 계측 기록 생성
+    with open(os.path.join(os.path.dirname(__file__), '..', 'test_frame_packet.json')) as f:
+        frame_packet = json.load(f)
+    response = client.post(
+        '/api/image',
+        data=json.dumps(frame_packet),
+        content_type='application/json'
+    )
+    assert response.status_code == 200
+    
+    # API 요청
+    response = client.get('/api/delay/metrics')
+    assert response.status_code == 200
+    
+    # 전략별 히스토그램 확인
+    response_data = json.loads(response.data)
+    assert len(response_data) > 0
+    for histograms in response_data.values():
+        assert 'requested' in histograms
+        assert 'actual' in histograms
+        assert 'overshoot' in histograms
+    
+    # 모니터링 페이지 확인
+    response = client.get('/monitor')
+    assert response.status_code == 200
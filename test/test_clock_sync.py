@@ -0,0 +1,149 @@
+"""
+클라이언트/서버 시계 오프셋 추정 테스트
+"""
+
+import os
+import json
+import time
+import random
+import pytest
+from app import create_app
+from app.api import routes
+from app.models.frame_packet import FramePacket
+from app.services.clock_sync import ClockOffsetEstimator, ClockSync
+
+FRAME_PACKET_PATH = os.path.join(os.path.dirname(__file__), '..', 'test_frame_packet.json')
+MS = 1_000_000
+SECOND_NS = 1_000_000_000
+
+def _simulate(estimator, offset_ns, drift, count, seed=0, interval_ns=100 * MS):
+    """
+    오프셋과 드리프트가 있는 클라이언트의 왕복 표본 생성 (업링크/다운링크 지연은 5~50ms)
+    """
+    rng = random.Random(seed)
+    for i in range(count):
+        t1 = 1000 * SECOND_NS + i * interval_ns
+        client_offset = offset_ns + drift * (t1 - 1000 * SECOND_NS)
+        t0 = t1 - client_offset - rng.uniform(5, 50) * MS
+        t2 = t1 + 2 * MS
+        t3 = t2 - client_offset + rng.uniform(5, 50) * MS
+        estimator.add_round_trip(int(t0), t1, t2, int(t3))
+    return t1
+
+def test_round_trip_offset_is_min_filtered():
+    """
+    왕복 표본의 최소 필터 오프셋이 실제 오프셋에 가까움 (지연 비대칭 오차는 최소 지연의 절반 이하)
+    """
+    estimator = ClockOffsetEstimator(window=32)
+    last = _simulate(estimator, 250 * MS, 0.0, 200)
+    assert estimator.mode == 'round_trip'
+    assert estimator.offset_ns(last) == pytest.approx(250 * MS, abs=5 * MS)
+    assert estimator.summary(last)['min_round_trip_ms'] < 20
+    
+    # 음수 왕복 지연은 버림
+    assert estimator.add_round_trip(0, 10 * MS, 20 * MS, 5 * MS) is False
+
+def test_drift_tracking():
+    """
+    시간에 따라 변하는 오프셋의 드리프트 추적
+    """
+    # 1초 간격, 100ppm 드리프트 (16표본 구간 × 32개 = 약 8.5분 동안 51ms 변화)
+    estimator = ClockOffsetEstimator(window=16, max_points=32)
+    drift = 100e-6
+    last = _simulate(estimator, 0, drift, 512, seed=1, interval_ns=SECOND_NS)
+    assert estimator.drift() == pytest.approx(drift, rel=0.3)
+    expected = drift * (last - 1000 * SECOND_NS)
+    assert estimator.offset_ns(last) == pytest.approx(expected, abs=10 * MS)
+
+def test_observe_one_way_and_echo():
+    """
+    에코가 없으면 단방향 최소 필터, 에코가 오면 왕복 표본으로 전환하고 보정된 지연 집계
+    """
+    sync = ClockSync()
+    frame = {'ID': {'shipID': 1, 'UserID': 2, 'cameraId': 0}, 'timestamp_ns': 100 * SECOND_NS}
+    record = sync.observe(frame, 100 * SECOND_NS + 300 * MS)
+    assert record['mode'] == 'one_way'
+    assert record['uplink_ms'] == pytest.approx(0.0)
+    
+    # 클라이언트 시계가 서버보다 200ms 늦고 업링크/다운링크가 각각 10ms
+    echo = {'t0_ns': 100 * SECOND_NS, 't1_ns': 100 * SECOND_NS + 210 * MS,
+            't2_ns': 100 * SECOND_NS + 215 * MS, 't3_ns': 100 * SECOND_NS + 25 * MS}
+    frame = dict(frame, timestamp_ns=101 * SECOND_NS, clock_sync=echo)
+    record = sync.observe(frame, 101 * SECOND_NS + 230 * MS)
+    assert record['mode'] == 'round_trip'
+    assert record['offset_ms'] == pytest.approx(200.0)
+    assert record['uplink_ms'] == pytest.approx(30.0)
+    assert record['downlink_ms'] == pytest.approx(10.0)
+    
+    # 프레임당 표본 하나 (에코가 있는 프레임은 왕복 표본만 기록)
+    stats = sync.get_stats(102 * SECOND_NS)
+    assert stats['clients']['1:2']['samples'] == 2
+    assert stats['downlink']['count'] == 1
+    
+    assert sync.observe({'image_data': ''}, 0) is None
+
+def test_observe_counts_each_frame_once():
+    """
+    에코가 있는 프레임과 잘못된 에코(음수 왕복 지연)로 단방향 표본을 쓰는 프레임 모두 표본 하나로 집계
+    """
+    sync = ClockSync()
+    frame = {'ID': {'shipID': 1, 'UserID': 2, 'cameraId': 0}}
+    for i in range(5):
+        t0 = (100 + i) * SECOND_NS
+        echo = {'t0_ns': t0 - SECOND_NS, 't1_ns': t0 - SECOND_NS + 210 * MS,
+                't2_ns': t0 - SECOND_NS + 215 * MS, 't3_ns': t0 - SECOND_NS + 25 * MS}
+        sync.observe(dict(frame, timestamp_ns=t0, clock_sync=echo), t0 + 230 * MS)
+    assert sync.get_stats(106 * SECOND_NS)['clients']['1:2']['samples'] == 5
+    
+    bad_echo = {'t0_ns': 105 * SECOND_NS, 't1_ns': 105 * SECOND_NS + 210 * MS,
+                't2_ns': 105 * SECOND_NS + 215 * MS, 't3_ns': 105 * SECOND_NS}
+    record = sync.observe(dict(frame, timestamp_ns=106 * SECOND_NS, clock_sync=bad_echo), 106 * SECOND_NS + 230 * MS)
+    assert record['mode'] == 'round_trip'
+    assert sync.get_stats(107 * SECOND_NS)['clients']['1:2']['samples'] == 6
+
+def test_frame_packet_clock_sync_field():
+    """
+    FramePacket의 선택적 clock_sync 필드 변환 테스트
+    """
+    with open(FRAME_PACKET_PATH) as f:
+        data = json.load(f)
+    assert 'clock_sync' not in FramePacket.from_dict(data).to_dict()
+    
+    echo = {'t0_ns': 1, 't1_ns': 2, 't2_ns': 3, 't3_ns': 4}
+    packet = FramePacket.from_dict(dict(data, clock_sync=echo))
+    assert packet.clock_sync.t2_ns == 3
+    assert packet.to_dict()['clock_sync'] == echo
+
+def test_clock_sync_api():
+    """
+    이미지 업로드 시 오프셋 추정과 조회/초기화 API
+    """
+    with open(FRAME_PACKET_PATH) as f:
+        frame = json.load(f)
+    client = create_app().test_client()
+    routes.clock_sync.reset()
+    assert client.post('/api/image', json=frame).status_code == 200
+    stats = client.get('/api/clock-sync').get_json()
+    assert stats['uplink']['count'] == 1
+    assert len(stats['clients']) == 1
+    
+    assert client.post('/api/clock-sync/reset').status_code == 200
+    assert client.get('/api/clock-sync').get_json()['clients'] == {}
+
+def test_clock_sync_uses_request_arrival(monkeypatch):
+    """
+    오프셋 추정에 그룹화 대기와 파이프라인 처리 전의 서버 도착 시각을 사용
+    """
+    with open(FRAME_PACKET_PATH) as f:
+        frame = json.load(f)
+    observed = []
+    monkeypatch.setattr(routes.clock_sync, 'observe', lambda image_data, arrival_ns: observed.append(arrival_ns))
+    client = create_app().test_client()
+    routes.frame_grouper.configure(enabled=True, window_ms=200)
+    try:
+        sent_ns = time.time_ns()
+        assert client.post('/api/image', json=frame).status_code == 200
+        assert time.time_ns() - sent_ns >= 200 * MS
+        assert observed[0] - sent_ns < 100 * MS
+    finally:
+        routes.frame_grouper.configure(enabled=False, window_ms=20.0)
@@ -3,15 +3,18 @@
 """
 
 import time
+import threading
 import pytest
 from app.services.delay_simulator import DelaySimulator
+from app.services.clock import Clock, ManualClock, RealClock, ScaledClock
 
 def test_fixed_delay():
     """
     고정 지연 테스트
     """
-    # 지연 시뮬레이터 생성
-    simulator = DelaySimulator()
+    # 지연 시뮬레이터 생성 (수동 시계 사용)
+    clock = ManualClock()
+    simulator = DelaySimulator(clock=clock)
     
     # 고정 지연 설정 (0.1초)
     simulator.set_fixed_delay(0.1)
@@ -22,19 +25,20 @@ def test_fixed_delay():
     assert config['params']['delay_seconds'] == 0.1
     
     # 지연 적용 시간 측정
-    start_time = time.time()
+    start_time = clock.now()
     simulator.apply_delay()
-    elapsed_time = time.time() - start_time
+    elapsed_time = clock.now() - start_time
     
-    # 지연 시간 확인 (오차 허용)
-    assert 0.05 <= elapsed_time <= 0.15
+    # 지연 시간 확인
+    assert elapsed_time == pytest.approx(0.1)
 
 def test_progressive_increase_delay():
     """
     점진적 증가 지연 테스트
     """
-    # 지연 시뮬레이터 생성
-    simulator = DelaySimulator()
+    # 지연 시뮬레이터 생성 (수동 시계 사용)
+    clock = ManualClock()
+    simulator = DelaySimulator(clock=clock)
     
     # 점진적 증가 지연 설정
     simulator.set_progressive_increase_delay(
@@ -50,26 +54,27 @@ def test_progressive_increase_delay():
     assert config['params']['initial_delay'] == 0.1
     
     # 초기 지연 확인
-    start_time = time.time()
+    start_time = clock.now()
     simulator.apply_delay()
-    elapsed_time = time.time() - start_time
-    assert 0.05 <= elapsed_time <= 0.15
+    elapsed_time = clock.now() - start_time
+    assert elapsed_time == pytest.approx(0.1)
     
     # 잠시 대기하여 간격 경과
-    time.sleep(0.2)
+    clock.advance(0.2)
     
     # 두 번째 지연 확인 (증가된 지연)
-    start_time = time.time()
+    start_time = clock.now()
     simulator.apply_delay()
-    elapsed_time = time.time() - start_time
-    assert 0.15 <= elapsed_time <= 0.25
+    elapsed_time = clock.now() - start_time
+    assert elapsed_time == pytest.approx(0.2)
 
 def test_progressive_decrease_delay():
     """
     점진적 감소 지연 테스트
     """
-    # 지연 시뮬레이터 생성
-    simulator = DelaySimulator()
+    # 지연 시뮬레이터 생성 (수동 시계 사용)
+    clock = ManualClock()
+    simulator = DelaySimulator(clock=clock)
     
     # 점진적 감소 지연 설정
     simulator.set_progressive_decrease_delay(
@@ -85,26 +90,27 @@ def test_progressive_decrease_delay():
     assert config['params']['initial_delay'] == 0.3
     
     # 초기 지연 확인
-    start_time = time.time()
+    start_time = clock.now()
     simulator.apply_delay()
-    elapsed_time = time.time() - start_time
-    assert 0.25 <= elapsed_time <= 0.35
+    elapsed_time = clock.now() - start_time
+    assert elapsed_time == pytest.approx(0.3)
     
     # 잠시 대기하여 간격 경과
-    time.sleep(0.2)
+    clock.advance(0.2)
     
     # 두 번째 지연 확인 (감소된 지연)
-    start_time = time.time()
+    start_time = clock.now()
     simulator.apply_delay()
-    elapsed_time = time.time() - start_time
-    assert 0.15 <= elapsed_time <= 0.25
+    elapsed_time = clock.now() - start_time
+    assert elapsed_time == pytest.approx(0.2)
 
 def test_step_delay():
     """
     계단식 지연 테스트
     """
-    # 지연 시뮬레이터 생성
-    simulator = DelaySimulator()
+    # 지연 시뮬레이터 생성 (수동 시계 사용)
+    clock = ManualClock()
+    simulator = DelaySimulator(clock=clock)
     
     # 계단식 지연 설정
     simulator.set_step_delay(
@@ -121,26 +127,27 @@ def test_step_delay():
     assert config['strategy'] == 'StepDelayStrategy'
     
     # 초기 지연 확인 (정상 지연)
-    start_time = time.time()
+    start_time = clock.now()
     simulator.apply_delay()
-    elapsed_time = time.time() - start_time
-    assert 0.05 <= elapsed_time <= 0.15
+    elapsed_time = clock.now() - start_time
+    assert elapsed_time == pytest.approx(0.1)
     
     # 잠시 대기하여 간격 경과
-    time.sleep(0.2)
+    clock.advance(0.2)
     
     # 두 번째 지연 확인 (높은 지연)
-    start_time = time.time()
+    start_time = clock.now()
     simulator.apply_delay()
-    elapsed_time = time.time() - start_time
-    assert 0.25 <= elapsed_time <= 0.35
+    elapsed_time = clock.now() - start_time
+    assert elapsed_time == pytest.approx(0.3)
 
 def test_no_response_delay():
     """
     무응답 시뮬레이션 테스트
     """
-    # 지연 시뮬레이터 생성
-    simulator = DelaySimulator()
+    # 지연 시뮬레이터 생성 (수동 시계 사용)
+    clock = ManualClock()
+    simulator = DelaySimulator(clock=clock)
     
     # 무응답 시뮬레이션 설정 (짧은 시간으로 설정)
     simulator.set_no_response(0.2)
@@ -151,19 +158,20 @@ def test_no_response_delay():
     assert config['params']['no_response_duration'] == 0.2
     
     # 지연 적용 시간 측정
-    start_time = time.time()
+    start_time = clock.now()
     simulator.apply_delay()
-    elapsed_time = time.time() - start_time
+    elapsed_time = clock.now() - start_time
     
-    # 지연 시간 확인 (오차 허용)
-    assert 0.15 <= elapsed_time <= 0.25
+    # 지연 시간 확인
+    assert elapsed_time == pytest.approx(0.2)
 
 def test_random_delay():
     """
     랜덤 지연 테스트
     """
-    # 지연 시뮬레이터 생성
-    simulator = DelaySimulator()
+    # 지연 시뮬레이터 생성 (수동 시계 사용)
+    clock = ManualClock()
+    simulator = DelaySimulator(clock=clock)
     
     # 랜덤 지연 설정
     simulator.set_random_delay(
@@ -180,9 +188,181 @@ def test_random_delay():
     assert config['params']['max_delay'] == 0.3
     
     # 지연 적용 시간 측정
-    start_time = time.time()
+    start_time = clock.now()
     simulator.apply_delay()
-    elapsed_time = time.time() - start_time
+    elapsed_time = clock.now() - start_time
     
     # 지연 시간 확인 (범위 내에 있는지)
-    assert 0.05 <= elapsed_time <= 0.35
+    assert 0.1 <= elapsed_time <= 0.3
+
+def test_precise_delay_timing_stats():
+    """
+    정밀 대기 모드 및 오차 통계 테스트
+    """
+    # 정밀 대기 모드로 지연 시뮬레이터 생성
+    simulator = DelaySimulator(precise=True)
+    simulator.set_fixed_delay(0.005)
+    
+    for _ in range(5):
+        simulator.apply_delay()
+    
+    # 통계 확인
+    stats = simulator.get_timing_stats()
+    assert stats['precise'] is True
+    assert stats['overshoot']['count'] == 5
+    
+    # 정밀 대기는 요청 시간보다 일찍 끝나지 않아야 함
+    assert stats['overshoot']['min_ms'] >= 0
+    assert stats['overshoot']['p50_ms'] < 5
+    
+    # 전략별 히스토그램도 같은 기록
+    metrics = simulator.get_metrics()['FixedDelayStrategy']
+    assert metrics['overshoot']['count'] + metrics['undershoot']['count'] == 5
+
+def test_delay_error_stats_keeps_signed_error():
+    """
+    요청보다 일찍 끝난 대기는 0으로 잘리지 않고 미달 히스토그램과 음수 오차로 기록
+    """
+    from app.services.delay_timing import DelayErrorStats
+    
+    stats = DelayErrorStats()
+    stats.record(10_000_000, 12_000_000, 'FixedDelayStrategy')
+    stats.record(10_000_000, 7_000_000, 'FixedDelayStrategy')
+    
+    summary = stats.summary()
+    assert summary['min_ms'] == pytest.approx(-3.0)
+    assert summary['max_ms'] == pytest.approx(2.0)
+    assert summary['undershoot_count'] == 1
+    histograms = stats.histograms('FixedDelayStrategy')
+    assert histograms['overshoot']['count'] == 1
+    assert histograms['undershoot']['count'] == 1
+    assert histograms['undershoot']['max_ms'] == pytest.approx(3.0)
+    assert stats.histograms('RandomDelayStrategy')['overshoot']['count'] == 0
+
+def test_step_delay_full_timeline():
+    """
+    수동 시계로 계단식 지연 전체 주기(300초) 검증
+    """
+    clock = ManualClock()
+    simulator = DelaySimulator(clock=clock)
+    simulator.set_step_delay()
+    
+    # 1초 간격으로 300초 동안 지연 관찰 (실제 대기 없음)
+    delays = []
+    for _ in range(300):
+        simulator.strategy.update()
+        delays.append(simulator.strategy.get_delay())
+        clock.advance(1.0)
+    
+    # 5초 정상 → 5초 지연 → 5초 정상 → 10초 지연 순서 확인
+    assert delays[:5] == [0.0] * 5
+    assert delays[5:10] == [5.0] * 5
+    assert delays[10:15] == [0.0] * 5
+    assert delays[15:20] == [10.0] * 5
+
+def test_scaled_clock():
+    """
+    배속 시계 테스트
+    """
+    clock = ScaledClock(scale=100.0)
+    
+    # 시계 기준 1초 대기가 실제로는 약 0.01초
+    real_start = time.monotonic()
+    clock_start = clock.now()
+    clock.sleep(1.0)
+    real_elapsed = time.monotonic() - real_start
+    
+    assert clock.now() - clock_start >= 1.0
+    assert real_elapsed < 0.5
+
+def test_clock_is_abstract():
+    """
+    시계 추상 클래스는 now_ns()와 sleep_until()을 구현해야 생성 가능
+    """
+    with pytest.raises(TypeError):
+        Clock()
+    
+    class NowOnlyClock(Clock):
+        def now_ns(self):
+            return 0
+    
+    with pytest.raises(TypeError):
+        NowOnlyClock()
+    
+    for clock in (RealClock(), ManualClock(), ScaledClock()):
+        assert isinstance(clock.now_ns(), int)
+
+def test_in_flight_cancel_on_strategy_change():
+    """
+    전략 변경 시 진행 중인 지연 취소 테스트
+    """
+    simulator = DelaySimulator()
+    simulator.set_no_response(60.0)
+    
+    # 별도 스레드에서 60초 무응답 지연 시작
+    records = []
+    thread = threading.Thread(target=lambda: records.append(simulator.apply_delay()))
+    thread.start()
+    
+    # 대기가 시작될 때까지 기다린 후 취소 정책으로 전략 변경
+    deadline = time.monotonic() + 1.0
+    while simulator.get_in_flight_stats()['in_flight'] == 0 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    simulator.set_strategy('FixedDelayStrategy', {'delay_seconds': 0.0}, in_flight_policy='cancel')
+    
+    thread.join(timeout=1.0)
+    assert not thread.is_alive()
+    assert records[0]['cut_short'] is True
+    assert simulator.get_in_flight_stats()['cut_short_count'] == 1
+
+def test_in_flight_recompute_on_strategy_change():
+    """
+    전략 변경 시 진행 중인 지연 재계산 테스트
+    """
+    simulator = DelaySimulator()
+    simulator.set_in_flight_policy('recompute')
+    simulator.set_fixed_delay(60.0)
+    
+    records = []
+    thread = threading.Thread(target=lambda: records.append(simulator.apply_delay()))
+    thread.start()
+    
+    deadline = time.monotonic() + 1.0
+    while simulator.get_in_flight_stats()['in_flight'] == 0 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    
+    # 새 전략(0.05초) 기준으로 재계산되어 60초보다 훨씬 일찍 끝나야 함
+    simulator.set_fixed_delay(0.05)
+    thread.join(timeout=1.0)
+    assert not thread.is_alive()
+    assert records[0]['cut_short'] is True
+    assert records[0]['actual_ms'] < 1000
+
+def test_in_flight_recompute_with_stateful_strategy():
+    """
+    요청마다 상태가 바뀌는 전략으로 재계산해도 상태를 소비하거나 요청을 손실시키지 않음
+    """
+    simulator = DelaySimulator()
+    simulator.set_in_flight_policy('recompute')
+    simulator.set_fixed_delay(60.0)
+    
+    records = []
+    threads = [threading.Thread(target=lambda: records.append(simulator.apply_delay())) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    
+    deadline = time.monotonic() + 1.0
+    while simulator.get_in_flight_stats()['in_flight'] < 3 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    
+    # 첫 요청에서 불량 상태로 전이하여 손실되는 전략 (재계산 중에는 전이/손실 없음)
+    simulator.set_strategy('GilbertElliottDelayStrategy', {
+        'p_good_to_bad': 1.0, 'good_delay': 0.05, 'bad_loss_probability': 1.0, 'seed': 1
+    })
+    for thread in threads:
+        thread.join(timeout=1.0)
+        assert not thread.is_alive()
+    assert all(record['cut_short'] for record in records)
+    params = simulator.get_config()['params']
+    assert params['drops'] == 0
+    assert sum(params['state_requests'].values()) == 0
@@ -0,0 +1,555 @@
+"""
+지연 전략 테스트
+"""
+
+import numpy as np
+import pytest
+from app.services.clock import ManualClock
+from app.services.delay_simulator import DelaySimulator
+from app.services.delay_strategies import RequestDropped
+
+@pytest.fixture
+def trace_file(tmp_path):
+    """
+    테스트용 트레이스 파일 생성 (0~9초, 1초 간격, 지연 = 경과 시간 * 0.1)
+    """
+    offsets = np.arange(10, dtype=np.float64)
+    trace = np.column_stack([offsets, offsets * 0.1])
+    path = tmp_path / 'trace.npy'
+    np.save(path, trace)
+    return str(path)
+
+def test_trace_replay_delay(trace_file, tmp_path):
+    """
+    트레이스 재생 지연 테스트
+    """
+    clock = ManualClock()
+    simulator = DelaySimulator(clock=clock, data_dir=str(tmp_path))
+    simulator.set_strategy('TraceReplayDelayStrategy', {'trace_path': trace_file})
+    
+    strategy = simulator.strategy
+    strategy.update()
+    assert strategy.get_delay() == pytest.approx(0.0)
+    
+    clock.advance(3.5)
+    strategy.update()
+    assert strategy.get_delay() == pytest.approx(0.3)
+    
+    # 트레이스 끝(9초)을 넘으면 처음부터 반복
+    clock.advance(7.0)
+    strategy.update()
+    assert strategy.get_delay() == pytest.approx(0.1)
+
+def test_trace_replay_speed_and_offset(trace_file, tmp_path):
+    """
+    트레이스 재생 속도 배율, 시작 위치, 바이너리 형식 테스트
+    """
+    # 같은 트레이스를 float64 바이너리로 저장
+    binary_path = tmp_path / 'trace.bin'
+    np.load(trace_file).astype('<f8').tofile(binary_path)
+    
+    clock = ManualClock()
+    simulator = DelaySimulator(clock=clock, data_dir=str(tmp_path))
+    simulator.set_strategy('TraceReplayDelayStrategy', {
+        'trace_path': str(binary_path),
+        'loop': False,
+        'speed_factor': 2.0,
+        'start_offset': 1.0
+    })
+    
+    strategy = simulator.strategy
+    clock.advance(2.0)
+    strategy.update()
+    assert strategy.get_delay() == pytest.approx(0.5)
+    
+    # 반복하지 않으면 마지막 지연 유지
+    clock.advance(100.0)
+    strategy.update()
+    assert strategy.get_delay() == pytest.approx(0.9)
+    assert simulator.get_config()['params']['samples'] == 10
+
+def test_trace_path_restricted_to_data_dir(trace_file, tmp_path):
+    """
+    트레이스 경로는 데이터 디렉터리 안의 파일만 허용 (상대 경로는 데이터 디렉터리 기준)
+    """
+    data_dir = tmp_path / 'data'
+    data_dir.mkdir()
+    (data_dir / 'trace.npy').write_bytes((tmp_path / 'trace.npy').read_bytes())
+    (data_dir / 'escape.npy').symlink_to(trace_file)
+    simulator = DelaySimulator(clock=ManualClock(), data_dir=str(data_dir))
+    
+    simulator.set_strategy('TraceReplayDelayStrategy', {'trace_path': 'trace.npy'})
+    assert simulator.get_config()['params']['trace_path'] == str(data_dir / 'trace.npy')
+    for path in (trace_file, '../trace.npy', 'escape.npy', '/etc/passwd'):
+        with pytest.raises(ValueError):
+            simulator.set_strategy('TraceReplayDelayStrategy', {'trace_path': path})
+    assert simulator.get_config()['params']['trace_path'] == str(data_dir / 'trace.npy')
+    
+    from app import create_app
+    client = create_app().test_client()
+    response = client.post('/api/delay/config', json={
+        'strategy': 'TraceReplayDelayStrategy', 'params': {'trace_path': '/etc/passwd'}
+    })
+    assert response.status_code == 400
+
+def test_alias_table_distribution():
+    """
+    별칭 테이블 표본 분포 테스트
+    """
+    from app.services.delay_strategies import EmpiricalDelayStrategy
+    
+    strategy = EmpiricalDelayStrategy(
+        bin_edges=[0.0, 0.1, 0.2, 1.0],
+        counts=[70, 20, 10],
+        block_size=1000,
+        seed=1
+    )
+    draws = np.array([strategy.get_delay() for _ in range(20000)])
+    
+    # 구간별 비율이 가중치와 일치하는지 확인
+    assert np.mean(draws < 0.1) == pytest.approx(0.7, abs=0.02)
+    assert np.mean((draws >= 0.1) & (draws < 0.2)) == pytest.approx(0.2, abs=0.02)
+    assert draws.min() >= 0.0 and draws.max() <= 1.0
+
+def test_empirical_peek_does_not_consume():
+    """
+    경험적 분포 전략의 peek_delay()는 다음 표본을 소비하지 않음
+    """
+    from app.services.delay_strategies import EmpiricalDelayStrategy
+    
+    strategy = EmpiricalDelayStrategy(samples=[0.01, 0.02, 0.5], block_size=4, seed=2)
+    peeked = [strategy.peek_delay() for _ in range(3)]
+    assert peeked == [peeked[0]] * 3
+    assert strategy.get_delay() == peeked[0]
+    assert strategy.draws == 1
+    
+    # 블록 경계에서도 같은 난수열 유지
+    reference = EmpiricalDelayStrategy(samples=[0.01, 0.02, 0.5], block_size=4, seed=2)
+    expected = [reference.get_delay() for _ in range(10)]
+    values = [peeked[0]]
+    for _ in range(9):
+        strategy.peek_delay()
+        values.append(strategy.get_delay())
+    assert values == expected
+
+def test_empirical_delay_upload(tmp_path):
+    """
+    경험적 분포 지연 설정 API 테스트 (JSON 및 파일 업로드)
+    """
+    import io
+    import json
+    from app import create_app
+    
+    client = create_app().test_client()
+    
+    response = client.post(
+        '/api/delay/empirical',
+        data=json.dumps({'samples': [0.01, 0.02, 0.5], 'seed': 3}),
+        content_type='application/json'
+    )
+    assert response.status_code == 200
+    assert json.loads(response.data)['config']['strategy'] == 'EmpiricalDelayStrategy'
+    
+    response = client.post(
+        '/api/delay/empirical',
+        data={'file': (io.BytesIO(b'0.01, 0.02, 0.03'), 'samples.txt')},
+        content_type='multipart/form-data'
+    )
+    assert response.status_code == 200
+    assert json.loads(response.data)['config']['params']['support_size'] == 3
+    
+    # 업로드 파일은 데이터 디렉터리에 저장되고, 데이터 디렉터리 밖의 표본 파일은 거부
+    samples_file = tmp_path / 'samples.txt'
+    samples_file.write_text('0.01 0.02')
+    response = client.post('/api/delay/config', json={
+        'strategy': 'EmpiricalDelayStrategy', 'params': {'samples_path': str(samples_file)}
+    })
+    assert response.status_code == 400
+    
+    simulator = DelaySimulator(data_dir=str(tmp_path))
+    simulator.set_strategy('EmpiricalDelayStrategy', {'samples_path': 'samples.txt'})
+    assert simulator.get_config()['params']['support_size'] == 2
+    with pytest.raises(ValueError):
+        simulator.set_strategy('EmpiricalDelayStrategy', {'samples_path': '../samples.txt'})
+    
+    # 다른 테스트에 영향을 주지 않도록 지연 없음으로 복원
+    client.post('/api/delay/fixed/0.0')
+
+def test_empirical_upload_reuses_file(tmp_path, monkeypatch):
+    """
+    경험적 분포 파일 업로드를 반복해도 데이터 디렉터리에 파일이 쌓이지 않는지 테스트
+    """
+    import io
+    import os
+    import json
+    from app import create_app
+    from app.api import routes
+    
+    client = create_app().test_client()
+    monkeypatch.setattr(routes.delay_simulator, 'data_dir', str(tmp_path))
+    
+    for count in range(2, 5):
+        samples = ' '.join(str(0.01 * (i + 1)) for i in range(count))
+        response = client.post(
+            '/api/delay/empirical',
+            data={'file': (io.BytesIO(samples.encode()), 'samples.txt')},
+            content_type='multipart/form-data'
+        )
+        assert response.status_code == 200
+        assert json.loads(response.data)['config']['params']['support_size'] == count
+    assert os.listdir(tmp_path) == ['empirical_upload.txt']
+    
+    # 읽을 수 없는 파일은 기존 파일을 덮어쓰지 않고 거부
+    response = client.post(
+        '/api/delay/empirical',
+        data={'file': (io.BytesIO(b'not a number'), 'samples.txt')},
+        content_type='multipart/form-data'
+    )
+    assert response.status_code == 400
+    assert os.listdir(tmp_path) == ['empirical_upload.txt']
+    assert (tmp_path / 'empirical_upload.txt').read_text().split()[-1] == '0.04'
+    
+    # 다른 테스트에 영향을 주지 않도록 지연 없음으로 복원
+    client.post('/api/delay/fixed/0.0')
+
+def test_bandwidth_delay_depends_on_size():
+    """
+    대역폭 제한 지연 테스트 (요청 크기 및 공유 토큰 버킷)
+    """
+    clock = ManualClock()
+    simulator = DelaySimulator(clock=clock)
+    
+    # 8Mbps = 1,000,000 바이트/초, 버스트 100,000 바이트
+    simulator.set_strategy('BandwidthDelayStrategy', {
+        'bandwidth_mbps': 8.0,
+        'base_latency': 0.01,
+        'bucket_size_bytes': 100000
+    })
+    strategy = simulator.strategy
+    
+    # 버스트 이내의 작은 요청은 기본 지연만 적용
+    assert strategy.get_request_delay({'payload_bytes': 1000}) == pytest.approx(0.01)
+    
+    # 큰 요청은 부족한 토큰이 채워지는 시간만큼 지연
+    assert strategy.get_request_delay({'payload_bytes': 599000}) == pytest.approx(0.51)
+    
+    # 동시에 들어온 다음 요청은 앞선 요청의 부채까지 기다림
+    assert strategy.get_request_delay({'payload_bytes': 100000}) == pytest.approx(0.61)
+    
+    # 시간이 지나 토큰이 다시 채워지면 기본 지연으로 복귀
+    clock.advance(1.0)
+    assert strategy.get_request_delay({'payload_bytes': 1000}) == pytest.approx(0.01)
+
+def test_queueing_delay_fifo():
+    """
+    대기열 모델 지연 테스트 (FIFO, 고정 서비스 시간)
+    """
+    clock = ManualClock()
+    simulator = DelaySimulator(clock=clock)
+    simulator.set_strategy('QueueingDelayStrategy', {
+        'servers': 1,
+        'mean_service_time': 0.1,
+        'service_distribution': 'fixed'
+    })
+    strategy = simulator.strategy
+    
+    # 서비스 시간의 두 배 속도로 도착하면 대기 시간이 계속 늘어남
+    delays = []
+    for _ in range(4):
+        delays.append(strategy.get_request_delay({}))
+        clock.advance(0.05)
+    assert delays == pytest.approx([0.1, 0.15, 0.2, 0.25])
+    
+    # 0.2초 시점에는 0.3초에 시작할 마지막 프레임만 대기 중
+    params = simulator.get_config()['params']
+    assert params['queue_length'] == 1
+    assert params['offered_load'] == pytest.approx(2.0)
+
+def test_queueing_delay_priority():
+    """
+    대기열 모델 지연 테스트 (우선순위)
+    """
+    clock = ManualClock()
+    simulator = DelaySimulator(clock=clock)
+    simulator.set_strategy('QueueingDelayStrategy', {
+        'servers': 1,
+        'mean_service_time': 0.1,
+        'service_distribution': 'fixed',
+        'discipline': 'priority'
+    })
+    strategy = simulator.strategy
+    
+    # 낮은 우선순위(cameraId 1) 프레임이 쌓여 있어도 높은 우선순위(cameraId 0)는 기다리지 않음
+    for _ in range(5):
+        strategy.get_request_delay({'ID': {'cameraId': 1}})
+    assert strategy.get_request_delay({'ID': {'cameraId': 0}}) == pytest.approx(0.1)
+    
+    # 낮은 우선순위 프레임은 높은 우선순위 부하까지 기다림
+    assert strategy.get_request_delay({'ID': {'cameraId': 1}}) == pytest.approx(0.7)
+
+def test_queueing_delay_invalid_params():
+    """
+    대기열 모델 매개변수 검증 테스트
+    """
+    simulator = DelaySimulator(clock=ManualClock())
+    
+    # 평균 서비스 시간이 0 이하
+    with pytest.raises(ValueError):
+        simulator.set_strategy('QueueingDelayStrategy', {'mean_service_time': 0})
+    with pytest.raises(ValueError):
+        simulator.set_strategy('QueueingDelayStrategy', {'mean_service_time': -0.1})
+    
+    # 슬롯 수가 1 미만
+    with pytest.raises(ValueError):
+        simulator.set_strategy('QueueingDelayStrategy', {'servers': 0})
+    
+    # 로그 표준편차가 음수
+    with pytest.raises(ValueError):
+        simulator.set_strategy('QueueingDelayStrategy', {
+            'service_distribution': 'lognormal',
+            'service_time_sigma': -0.5
+        })
+    
+    # 알 수 없는 서비스 시간 분포
+    with pytest.raises(ValueError):
+        simulator.set_strategy('QueueingDelayStrategy', {'service_distribution': 'pareto'})
+    
+    # 거부된 설정은 기존 전략을 바꾸지 않음
+    assert simulator.get_config()['strategy'] != 'QueueingDelayStrategy'
+
+def test_gilbert_elliott_bursty_loss():
+    """
+    Gilbert-Elliott 버스트 손실 테스트
+    """
+    clock = ManualClock()
+    simulator = DelaySimulator(clock=clock)
+    simulator.set_strategy('GilbertElliottDelayStrategy', {
+        'p_good_to_bad': 0.1,
+        'p_bad_to_good': 0.5,
+        'good_delay': 0.05,
+        'seed': 7
+    })
+    strategy = simulator.strategy
+    
+    outcomes = []
+    for _ in range(2000):
+        try:
+            outcomes.append(strategy.get_request_delay({}))
+        except RequestDropped as dropped:
+            assert dropped.mode == 'abort'
+            outcomes.append(None)
+        clock.advance(0.01)
+    
+    # 정상 요청은 양호 상태 지연, 손실 비율은 정상 상태 확률 0.1 / (0.1 + 0.5) 근처
+    assert {delay for delay in outcomes if delay is not None} == {0.05}
+    params = simulator.get_config()['params']
+    assert params['drops'] == outcomes.count(None)
+    assert params['bad_request_ratio'] == pytest.approx(1 / 6, abs=0.03)
+    assert params['bad_time_ratio'] == pytest.approx(1 / 6, abs=0.03)
+    
+    # 손실이 연속 구간(버스트)으로 발생
+    bursts = sum(1 for i in range(1, len(outcomes)) if outcomes[i] is None and outcomes[i - 1] is not None)
+    assert bursts < outcomes.count(None)
+
+def test_gilbert_elliott_invalid_params():
+    """
+    Gilbert-Elliott 매개변수 검증 테스트
+    """
+    simulator = DelaySimulator(clock=ManualClock())
+    
+    # [0, 1] 밖의 확률
+    for name in ('p_good_to_bad', 'p_bad_to_good', 'bad_loss_probability'):
+        for value in (-0.1, 1.5):
+            with pytest.raises(ValueError):
+                simulator.set_strategy('GilbertElliottDelayStrategy', {name: value})
+    
+    # 음수 지연, 지터, 대기 시간
+    for name in ('good_delay', 'good_jitter', 'bad_delay', 'hang_seconds'):
+        with pytest.raises(ValueError):
+            simulator.set_strategy('GilbertElliottDelayStrategy', {name: -1.0})
+    
+    # 경계값은 허용
+    simulator.set_strategy('GilbertElliottDelayStrategy', {
+        'p_good_to_bad': 0.0,
+        'p_bad_to_good': 1.0,
+        'bad_loss_probability': 0.0,
+        'good_jitter': 0.0
+    })
+    assert simulator.get_config()['strategy'] == 'GilbertElliottDelayStrategy'
+
+def test_gilbert_elliott_hang_cap():
+    """
+    손실 요청 대기(hang) 스레드 상한 테스트
+    """
+    clock = ManualClock()
+    simulator = DelaySimulator(clock=clock, max_hung_requests=1)
+    simulator.set_strategy('GilbertElliottDelayStrategy', {
+        'p_good_to_bad': 1.0,
+        'p_bad_to_good': 0.0,
+        'drop_mode': 'hang',
+        'hang_seconds': 30.0
+    })
+    
+    # 상한 이내에서는 hang_seconds 동안 응답하지 않음
+    with pytest.raises(RequestDropped) as excinfo:
+        simulator.apply_delay()
+    assert excinfo.value.record['actual_ms'] == pytest.approx(30000.0)
+    assert clock.now() == pytest.approx(30.0)
+    
+    # 상한에 도달하면 대기 없이 즉시 끊음
+    assert simulator._hang_slots.acquire(blocking=False)
+    with pytest.raises(RequestDropped) as excinfo:
+        simulator.apply_delay()
+    simulator._hang_slots.release()
+    assert excinfo.value.record['hang_capped']
+    assert clock.now() == pytest.approx(30.0)
+    
+    stats = simulator.get_in_flight_stats()
+    assert stats['dropped_count'] == 2
+    assert stats['hang_capped_count'] == 1
+    assert stats['hung'] == 0
+
+def test_reorder_delay_per_stream():
+    """
+    스트림별 응답 순서 뒤바뀜 테스트
+    """
+    clock = ManualClock()
+    simulator = DelaySimulator(clock=clock)
+    
+    def release_times(reorder_rate):
+        simulator.set_strategy('ReorderDelayStrategy', {
+            'base_delay': 0.1,
+            'jitter': 0.05,
+            'reorder_rate': reorder_rate,
+            'hold_delay': 0.2,
+            'seed': 3
+        })
+        strategy = simulator.strategy
+        releases = []
+        for image_id in range(200):
+            request_info = {'ID': {'imageID': image_id, 'shipID': 1, 'UserID': 1, 'cameraId': 0}}
+            releases.append(clock.now() + strategy.get_request_delay(request_info))
+            clock.advance(0.02)
+        return releases, strategy
+    
+    # 재정렬 확률이 0이면 지터가 있어도 요청 순서대로 해제
+    releases, strategy = release_times(0.0)
+    assert releases == sorted(releases)
+    assert strategy.get_config()['params']['overtakes'] == 0
+    
+    # 재정렬 확률만큼 응답이 붙잡혀 뒤이은 imageID에 추월당함
+    releases, strategy = release_times(0.2)
+    params = strategy.get_config()['params']
+    assert params['held'] == pytest.approx(40, abs=15)
+    assert params['overtakes'] > params['held']
+    assert releases != sorted(releases)
+    
+    # 다른 카메라 스트림은 순서 제약을 공유하지 않음
+    simulator.set_strategy('ReorderDelayStrategy', {'base_delay': 0.1, 'jitter': 0.0, 'reorder_rate': 0.0})
+    strategy = simulator.strategy
+    strategy.get_request_delay({'ID': {'cameraId': 0}})
+    assert strategy.get_request_delay({'ID': {'cameraId': 1}}) == pytest.approx(0.1)
+    assert strategy.get_config()['params']['streams'] == 2
+
+def test_timeline_delay():
+    """
+    시나리오 타임라인 테스트
+    """
+    clock = ManualClock()
+    simulator = DelaySimulator(clock=clock)
+    simulator.set_strategy('TimelineDelayStrategy', {
+        'segments': [
+            {'strategy': 'FixedDelayStrategy', 'params': {'delay_seconds': 0.2}, 'duration': 60},
+            {'strategy': 'ProgressiveIncreaseDelayStrategy',
+             'params': {'initial_delay': 0.5, 'increment': 0.5, 'interval': 10}, 'duration': 30},
+            {'strategy': 'NoResponseDelayStrategy', 'params': {'no_response_duration': 10}, 'duration': 10}
+        ],
+        'overlays': [
+            {'strategy': 'FixedDelayStrategy', 'params': {'delay_seconds': 0.01}, 'start': 30, 'end': 70}
+        ]
+    })
+    strategy = simulator.strategy
+    
+    def delay_at(seconds):
+        clock.advance(seconds - clock.now())
+        strategy.update()
+        return strategy.get_request_delay({})
+    
+    expected = [
+        (0, 0.2), (29, 0.2), (30, 0.21), (59, 0.21),
+        (60, 0.51), (69, 0.51), (70, 1.0), (85, 1.5),
+        (90, 10.0), (99, 10.0), (120, 0.0)
+    ]
+    for seconds, delay in expected:
+        assert delay_at(seconds) == pytest.approx(delay), seconds
+    
+    # 반복 타임라인은 총 길이마다 처음 구간으로 돌아감
+    simulator.set_strategy('TimelineDelayStrategy', {
+        'segments': [
+            {'strategy': 'FixedDelayStrategy', 'params': {'delay_seconds': 0.1}, 'duration': 5},
+            {'strategy': 'FixedDelayStrategy', 'params': {'delay_seconds': 0.3}, 'duration': 5}
+        ],
+        'overlays': [
+            {'strategy': 'RandomDelayStrategy', 'params': {'min_delay': 0.0, 'max_delay': 0.05, 'change_interval': 1}}
+        ],
+        'loop': True
+    })
+    strategy = simulator.strategy
+    start = clock.now()
+    assert 0.1 <= delay_at(start + 22) <= 0.15
+    assert 0.3 <= delay_at(start + 27) <= 0.35
+    assert strategy.get_config()['params']['active_segment'] == 1
+    
+    with pytest.raises(ValueError):
+        simulator.set_strategy('TimelineDelayStrategy', {'segments': []})
+
+def test_heavy_tailed_jitter():
+    """
+    꼬리가 긴 지터 중첩 테스트
+    """
+    clock = ManualClock()
+    simulator = DelaySimulator(clock=clock)
+    
+    def jitter_samples(jitter, count=10000):
+        simulator.set_strategy('FixedDelayStrategy', {'delay_seconds': 0.1, 'tail_jitter': jitter})
+        strategy = simulator.strategy
+        return np.array([strategy.get_request_delay({}) for _ in range(count)]) - 0.1
+    
+    # 같은 시드는 블록 경계를 넘어도 같은 지터 순서를 만듦
+    spec = {'distribution': 'lognormal', 'scale': 0.01, 'sigma': 0.5, 'block_size': 1000, 'seed': 5}
+    first = jitter_samples(spec)
+    assert np.array_equal(first, jitter_samples(spec))
+    assert np.median(first) == pytest.approx(0.01, rel=0.05)
+    
+    # 파레토 지터는 상한으로 잘림
+    pareto = jitter_samples({'distribution': 'pareto', 'scale': 0.01, 'shape': 1.5, 'max_jitter': 0.2, 'seed': 1})
+    assert pareto.min() >= 0.0
+    assert pareto.max() == pytest.approx(0.2)
+    
+    gamma = jitter_samples({'distribution': 'gamma', 'scale': 0.01, 'shape': 2.0, 'seed': 1})
+    assert gamma.mean() == pytest.approx(0.02, rel=0.05)
+    
+    # 설정 조회는 기반 전략 설정에 지터 설정을 더해 반환
+    config = simulator.get_config()
+    assert config['strategy'] == 'FixedDelayStrategy'
+    assert config['params']['tail_jitter']['distribution'] == 'gamma'
+    
+    with pytest.raises(ValueError):
+        simulator.set_strategy('FixedDelayStrategy', {'tail_jitter': {'distribution': 'cauchy'}})
+
+def test_jittered_metrics_use_config_name():
+    """
+    지터를 중첩한 전략의 계측 버킷 이름이 설정 조회 결과의 전략 이름과 같은지 테스트
+    """
+    simulator = DelaySimulator(clock=ManualClock())
+    simulator.set_strategy('FixedDelayStrategy', {
+        'delay_seconds': 0.05,
+        'tail_jitter': {'distribution': 'gamma', 'scale': 0.01, 'shape': 2.0, 'seed': 1}
+    })
+    for _ in range(3):
+        simulator.apply_delay()
+    
+    name = simulator.get_config()['strategy']
+    metrics = simulator.get_metrics()
+    assert list(metrics) == [name] == ['FixedDelayStrategy']
+    assert metrics[name]['actual']['count'] == 3
@@ -0,0 +1,92 @@
+"""
+카메라별 최신 프레임 우선 처리 테스트
+"""
+
+import os
+import json
+import time
+import threading
+import pytest
+from app import create_app
+from app.api import routes
+from app.services.frame_coalescing import FrameCoalescer
+
+FRAME_PACKET_PATH = os.path.join(os.path.dirname(__file__), '..', 'test_frame_packet.json')
+KEY = (1, 1, 0)
+SECOND_NS = 1_000_000_000
+
+def _acquire_async(coalescer, timestamp_ns, results):
+    thread = threading.Thread(target=lambda: results.__setitem__(timestamp_ns, coalescer.acquire(KEY, timestamp_ns)))
+    thread.start()
+    return thread
+
+def test_newer_frame_supersedes_waiting_frame():
+    """
+    처리 중에 도착한 프레임 중 가장 최신 프레임만 처리
+    """
+    coalescer = FrameCoalescer(enabled=True)
+    assert coalescer.acquire(KEY, 100)
+    
+    results = {}
+    waiting = _acquire_async(coalescer, 200, results)
+    time.sleep(0.05)
+    newest = _acquire_async(coalescer, 300, results)
+    
+    # 대기 중이던 프레임은 처리 중인 프레임이 끝나기 전에 즉시 대체됨
+    waiting.join(timeout=1.0)
+    assert results[200] is False
+    
+    coalescer.release(KEY)
+    newest.join(timeout=1.0)
+    assert results[300] is True
+    coalescer.release(KEY)
+    
+    config = coalescer.get_config()
+    assert config['admitted'] == 2
+    assert config['superseded'] == 1
+
+def test_stale_and_restarted_streams():
+    """
+    이미 본 프레임보다 오래된 프레임은 거절하고, 크게 되돌아간 타임스탬프는 재시작으로 처리
+    """
+    coalescer = FrameCoalescer(enabled=True, restart_gap=10.0)
+    assert coalescer.acquire(KEY, 50 * SECOND_NS)
+    coalescer.release(KEY)
+    assert coalescer.acquire(KEY, 49 * SECOND_NS) is False
+    assert coalescer.get_config()['stale'] == 1
+    
+    assert coalescer.acquire(KEY, SECOND_NS)
+    coalescer.release(KEY)
+    
+    with pytest.raises(ValueError):
+        coalescer.configure(restart_gap=0)
+
+def test_idle_streams_are_bounded():
+    """
+    유휴 스트림 수 제한
+    """
+    coalescer = FrameCoalescer(enabled=True, max_streams=2)
+    for camera in range(5):
+        assert coalescer.acquire((1, 1, camera), 0)
+        coalescer.release((1, 1, camera))
+    assert coalescer.get_config()['streams'] == 2
+
+def test_coalescing_api():
+    """
+    설정 API와 오래된 프레임의 409 응답
+    """
+    with open(FRAME_PACKET_PATH) as f:
+        frame = json.load(f)
+    client = create_app().test_client()
+    assert client.post('/api/coalescing', json={'enabled': True}).status_code == 200
+    try:
+        frame['timestamp_ns'] = 5 * SECOND_NS
+        assert client.post('/api/image', json=frame).status_code == 200
+        
+        frame['timestamp_ns'] = 5 * SECOND_NS - 1
+        response = client.post('/api/image', json=frame)
+        assert response.status_code == 409
+        assert response.get_json()['superseded'] is True
+        assert client.get('/api/coalescing').get_json()['stale'] == 1
+    finally:
+        routes.frame_coalescer.configure(enabled=False)
@@ -0,0 +1,185 @@
+"""
+다중 카메라 프레임 그룹화 테스트
+"""
+
+import os
+import json
+import time
+import threading
+import pytest
+from app import create_app
+from app.api import routes
+from app.services.frame_grouping import FrameGrouper, fuse_poses
+from app.services.image_processor import set_pose_noise_seed
+from app.services.pose_pipeline import PosePipeline
+from app.services.transform_graph import default_graph
+
+FRAME_PACKET_PATH = os.path.join(os.path.dirname(__file__), '..', 'test_frame_packet.json')
+
+@pytest.fixture
+def frame():
+    with open(FRAME_PACKET_PATH) as f:
+        return json.load(f)
+
+def _camera_frame(frame, camera, user=1, x=0.0):
+    data = json.loads(json.dumps(frame))
+    data['ID'].update({'UserID': user, 'cameraId': camera})
+    data['pose']['position_m'] = [x, 0.0, 0.0]
+    return data
+
+def _submit_all(grouper, frames):
+    results = [None] * len(frames)
+    
+    def worker(i):
+        results[i] = grouper.process(frames[i])
+    
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(frames))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+def test_group_fuses_cameras_of_same_user(frame):
+    """
+    같은 사용자의 카메라 프레임을 한 그룹으로 처리하고 융합 포즈 반환
+    """
+    grouper = FrameGrouper(enabled=True, window_ms=200, max_group_size=3)
+    frames = [_camera_frame(frame, camera, x=10.0 * camera) for camera in range(3)]
+    start = time.monotonic()
+    results = _submit_all(grouper, frames)
+    
+    # 그룹이 가득 차면 창이 끝나기 전에 처리
+    assert time.monotonic() - start < 0.2
+    assert [result['ID']['cameraId'] for result, _, _ in results] == [0, 1, 2]
+    fused = results[0][2]
+    assert all(other is fused for _, _, other in results)
+    assert sorted(fused['cameras']) == [0, 1, 2]
+    assert fused['pose']['position_m'][0] == pytest.approx(
+        sum(result['pose']['position_m'][0] for result, _, _ in results) / 3)
+    
+    config = grouper.get_config()
+    assert config['groups'] == 1
+    assert config['mean_group_size'] == 3
+    assert config['open_groups'] == 0
+
+def test_grouped_frames_run_full_pipeline(frame):
+    """
+    그룹화한 프레임도 파이프라인의 모든 단계와 단계 선택을 거쳐 단독 처리와 같은 결과와 형식을 받음
+    """
+    set_pose_noise_seed(5)
+    try:
+        pipeline = PosePipeline()
+        grouper = FrameGrouper(enabled=True, window_ms=200, max_group_size=2, pipeline=pipeline)
+        frames = [_camera_frame(frame, camera, x=3.0 * camera) for camera in range(2)]
+        results = _submit_all(grouper, frames)
+        for data, (result, timings, _) in zip(frames, results):
+            expected, expected_timings = pipeline.run(data)
+            assert set(result) == set(expected)
+            assert result['pose'] == expected['pose']
+            assert set(timings) == set(expected_timings) | {'group'}
+        
+        # 단계 선택이 같은 프레임끼리만 그룹화하고 선택한 구현을 적용
+        results = [None] * 2
+        overrides = [{'localize': 'passthrough'}, {}]
+        
+        def worker(i):
+            results[i] = grouper.process(frames[i], overrides[i])
+        
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results[0][0]['pose']['position_m'] == frames[0]['pose']['position_m']
+        assert results[0][2]['cameras'] == [0] and results[1][2]['cameras'] == [1]
+    finally:
+        set_pose_noise_seed(None)
+
+def test_window_bounds_latency_and_memory(frame):
+    """
+    창이 끝나면 혼자 처리되고, 열린 그룹 수를 넘으면 그룹화하지 않음
+    """
+    grouper = FrameGrouper(enabled=True, window_ms=30, max_groups=1)
+    start = time.monotonic()
+    result, _, fused = grouper.process(_camera_frame(frame, 0))
+    elapsed = time.monotonic() - start
+    assert 0.03 <= elapsed < 0.5
+    assert fused['cameras'] == [0]
+    
+    # 다른 사용자 그룹이 열려 있는 동안 한도 초과 프레임은 단독 처리
+    results = _submit_all(grouper, [_camera_frame(frame, 0, user=1), _camera_frame(frame, 0, user=2)])
+    assert sorted(fused is None for _, _, fused in results) == [False, True]
+    assert grouper.get_config()['bypassed'] == 1
+
+def test_duplicate_camera_starts_new_group(frame):
+    """
+    같은 카메라의 다음 프레임은 새 그룹을 시작하고, replace 방식은 포즈를 융합 포즈로 대체
+    """
+    grouper = FrameGrouper(enabled=True, window_ms=100, mode='replace')
+    results = _submit_all(grouper, [_camera_frame(frame, 0, x=1.0), _camera_frame(frame, 0, x=2.0)])
+    assert all(fused is None for _, _, fused in results)
+    assert grouper.get_config()['groups'] == 2
+    
+    with pytest.raises(ValueError):
+        grouper.configure(mode='unknown')
+
+def test_grouping_api(frame):
+    """
+    그룹화 설정 API와 응답의 융합 포즈
+    """
+    client = create_app().test_client()
+    response = client.post('/api/grouping', json={'enabled': True, 'window_ms': 5, 'max_group_size': 2})
+    assert response.status_code == 200
+    try:
+        response = client.post('/api/image', json=_camera_frame(frame, 0))
+        assert response.status_code == 200
+        assert response.get_json()['fused']['cameras'] == [0]
+        assert client.get('/api/grouping').get_json()['groups'] == 1
+        assert client.post('/api/grouping', json={'window_ms': -1}).status_code == 400
+    finally:
+        routes.frame_grouper.configure(enabled=False)
+
+def test_grouping_api_output_frame(frame):
+    """
+    그룹화한 요청도 쿼리 문자열의 결과 좌표계/대상을 적용하고 융합 포즈도 같은 좌표계로 반환
+    """
+    default_graph.load({'transforms': [
+        {'parent': 'ship', 'child': 'deck:1', 'translation': [10.0, 0.0, 0.0]},
+        {'parent': 'body', 'child': 'camera:0', 'translation': [0.0, 0.5, 0.0]}
+    ]})
+    client = create_app().test_client()
+    data = _camera_frame(frame, 0, x=12.0)
+    query = '/api/image?localize=passthrough&frame=deck&subject=body'
+    try:
+        expected = client.post(query, json=data).get_json()
+        client.post('/api/grouping', json={'enabled': True, 'window_ms': 5})
+        response = client.post(query, json=data)
+        assert response.status_code == 200
+        body = response.get_json()
+        assert body['pose']['frame'] == 'deck:1'
+        assert body['pose']['position_m'] == pytest.approx(expected['pose']['position_m'])
+        assert body['pose']['position_m'] == pytest.approx([2.0, -0.5, 0.0])
+        assert body['fused']['pose']['frame'] == 'deck:1'
+        assert body['fused']['pose']['position_m'] == pytest.approx([2.0, -0.5, 0.0])
+    finally:
+        routes.frame_grouper.configure(enabled=False, window_ms=20.0)
+        default_graph.load({})
+
+def test_fuse_poses_in_different_frames():
+    """
+    좌표계가 다른 카메라 결과는 첫 결과의 좌표계로 변환한 뒤 융합
+    """
+    default_graph.load({'transforms': [{'parent': 'ship', 'child': 'deck:1', 'translation': [10.0, 0.0, 0.0]}]})
+    try:
+        zone = {'deck': 1, 'compartment': 'Main', 'zone_id': 1}
+        results = [
+            {'ID': {'cameraId': camera}, 'timestamp_ns': 100,
+             'pose': {'position_m': position, 'quaternion': [0.0, 0.0, 0.0, 1.0], 'zone': zone, 'frame': name}}
+            for camera, (name, position) in enumerate([('deck:1', [1.0, 0.0, 0.0]), ('ship', [13.0, 0.0, 0.0])])
+        ]
+        fused = fuse_poses(results)
+        assert fused['pose']['frame'] == 'deck:1'
+        assert fused['pose']['position_m'] == pytest.approx([2.0, 0.0, 0.0])
+    finally:
+        default_graph.load({})
@@ -0,0 +1,52 @@
+"""
+이미지 처리 테스트
+"""
+
+import os
+import json
+import numpy as np
+import pytest
+from app.services.image_processor import process_image, process_images_batch, set_pose_noise_seed
+
+FRAME_PACKET_PATH = os.path.join(os.path.dirname(__file__), '..', 'test_frame_packet.json')
+
+@pytest.fixture
+def frames():
+    with open(FRAME_PACKET_PATH) as f:
+        frame = json.load(f)
+    return [dict(frame, ID=dict(frame['ID'], imageID=i)) for i in range(200)]
+
+def test_batch_matches_single_frame_path(frames):
+    """
+    시드가 같으면 배치 처리와 프레임별 처리가 같은 포즈를 만듦
+    """
+    # 이미지가 없는 프레임은 변형 없이 기본 포즈
+    frames = frames + [dict(frames[0], image="")]
+    try:
+        set_pose_noise_seed(9)
+        batch = process_images_batch(frames)
+        single = [process_image(frame) for frame in frames]
+    finally:
+        set_pose_noise_seed(None)
+    
+    assert len(batch) == len(frames)
+    for b, s in zip(batch, single):
+        assert b['ID'] == s['ID']
+        assert b['pose']['zone'] == s['pose']['zone']
+        assert b['pose']['position_m'] == pytest.approx(s['pose']['position_m'])
+        assert b['pose']['quaternion'] == pytest.approx(s['pose']['quaternion'])
+    assert batch[-1]['pose']['quaternion'] == [0.0, 0.0, 0.0, 1.0]
+
+def test_batch_unseeded_noise(frames):
+    """
+    시드가 없을 때 배치 변형 범위와 정규화
+    """
+    base = np.array(frames[0]['pose']['position_m'])
+    batch = process_images_batch(frames)
+    positions = np.array([packet['pose']['position_m'] for packet in batch])
+    quaternions = np.array([packet['pose']['quaternion'] for packet in batch])
+    
+    assert np.all(np.abs(positions - base) <= 1.0)
+    assert np.linalg.norm(quaternions, axis=1) == pytest.approx(np.ones(len(frames)))
+    assert len({tuple(row) for row in positions}) == len(frames)
+    assert process_images_batch([]) == []
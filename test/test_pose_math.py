@@ -0,0 +1,78 @@
+"""
+포즈 수학 테스트
+"""
+
+import numpy as np
+import pytest
+from app.services.pose_math import (
+    quat_normalize,
+    quat_multiply,
+    axis_angle_to_quat,
+    quat_slerp,
+    quat_angle,
+    quat_average,
+    perturb_quaternions
+)
+
+IDENTITY = np.array([0.0, 0.0, 0.0, 1.0])
+
+def test_quaternion_ops():
+    """
+    쿼터니언 곱, 축-각 변환, 정규화
+    """
+    # z축 90도 회전 두 번은 180도 회전
+    q90 = axis_angle_to_quat([0.0, 0.0, 1.0], np.pi / 2)
+    q180 = quat_multiply(q90, q90)
+    assert q180 == pytest.approx([0.0, 0.0, 1.0, 0.0], abs=1e-12)
+    assert quat_multiply(IDENTITY, q90) == pytest.approx(q90)
+    
+    # 배치와 브로드캐스트
+    axes = np.tile([1.0, 0.0, 0.0], (5, 1))
+    angles = np.linspace(0.0, np.pi, 5)
+    batch = axis_angle_to_quat(axes, angles)
+    assert batch.shape == (5, 4)
+    assert quat_angle(batch, IDENTITY) == pytest.approx(angles)
+    
+    normalized = quat_normalize([[0.0, 0.0, 0.0, 2.0], [0.0, 0.0, 0.0, 0.0]])
+    assert normalized == pytest.approx(np.array([IDENTITY, IDENTITY]))
+
+def test_slerp():
+    """
+    구면 선형 보간
+    """
+    q = axis_angle_to_quat([0.0, 1.0, 0.0], 1.0)
+    assert quat_slerp(IDENTITY, q, 0.0) == pytest.approx(IDENTITY)
+    assert quat_slerp(IDENTITY, q, 1.0) == pytest.approx(q)
+    assert quat_angle(quat_slerp(IDENTITY, q, 0.25), IDENTITY) == pytest.approx(0.25)
+    
+    # 반대 부호 쿼터니언은 같은 회전이므로 최단 경로로 보간
+    assert quat_angle(quat_slerp(IDENTITY, -q, 0.5), IDENTITY) == pytest.approx(0.5)
+    assert quat_slerp(q, q, 0.3) == pytest.approx(q)
+
+def test_perturbation_is_orientation_independent():
+    """
+    임의 회전 합성은 입력 자세와 무관하게 같은 각도 분포를 가짐
+    """
+    rng = np.random.default_rng(0)
+    u = rng.random((10000, 3))
+    
+    base_a = np.tile(IDENTITY, (10000, 1))
+    base_b = np.tile(axis_angle_to_quat([1.0, 1.0, 0.0], 2.5), (10000, 1))
+    angles_a = quat_angle(perturb_quaternions(base_a, u, 0.2), base_a)
+    angles_b = quat_angle(perturb_quaternions(base_b, u, 0.2), base_b)
+    
+    assert angles_a == pytest.approx(angles_b, abs=1e-9)
+    assert angles_a.max() <= 0.2 + 1e-12
+    assert angles_a.mean() == pytest.approx(0.1, abs=0.005)
+
+def test_quat_average():
+    """
+    부호가 다른 같은 자세와 가까운 자세의 평균
+    """
+    q = axis_angle_to_quat([0.0, 0.0, 1.0], 0.3)
+    assert quat_average([q, -q]) == pytest.approx(q)
+    
+    # z축 0.2rad, 0.4rad 회전의 평균은 0.3rad 회전
+    pair = axis_angle_to_quat([[0.0, 0.0, 1.0]] * 2, np.array([0.2, 0.4]))
+    assert quat_average(pair) == pytest.approx(q)
+    assert quat_average(pair, [1.0, 0.0]) == pytest.approx(pair[0])
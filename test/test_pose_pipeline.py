@@ -0,0 +1,75 @@
+"""
+포즈 처리 파이프라인 테스트
+"""
+
+import os
+import json
+import pytest
+from app import create_app
+from app.services.pose_pipeline import PosePipeline, STAGE_KINDS, register_stage
+
+FRAME_PACKET_PATH = os.path.join(os.path.dirname(__file__), '..', 'test_frame_packet.json')
+
+@pytest.fixture
+def frame():
+    with open(FRAME_PACKET_PATH) as f:
+        return json.load(f)
+
+@register_stage('localize', 'test_fixed')
+def _localize_test_fixed(context):
+    """
+    테스트용 고정 포즈 측위 단계
+    """
+    from app.models.frame_packet import PoseBlock
+    context.pose_block = PoseBlock(position_m=[1.0, 2.0, 3.0], quaternion=[0.0, 0.0, 0.0, 2.0])
+
+def test_pipeline_stages_and_timings(frame):
+    """
+    단계 선택과 단계별 계측
+    """
+    pipeline = PosePipeline()
+    result, timings = pipeline.run(frame)
+    assert list(timings) == list(STAGE_KINDS)
+    assert all(elapsed_ns >= 0 for elapsed_ns in timings.values())
+    assert result['ID'] == frame['ID']
+    
+    # 요청별 단계 교체 (등록한 측위 단계 + 정규화 후처리)
+    result, _ = pipeline.run(frame, {'localize': 'test_fixed'})
+    assert result['pose']['position_m'] == [1.0, 2.0, 3.0]
+    assert result['pose']['quaternion'] == [0.0, 0.0, 0.0, 1.0]
+    
+    # 설정으로 단계 교체
+    pipeline.set_stages({'localize': 'passthrough'})
+    result, _ = pipeline.run(frame)
+    assert result['pose'] == dict(frame['pose'], frame='ship')
+    
+    summary = pipeline.get_config()
+    assert summary['timings']['localize']['count'] == 1
+    assert 'test_fixed' in summary['available']['localize']
+    
+    with pytest.raises(ValueError):
+        pipeline.set_stages({'localize': 'unknown'})
+    
+    # 검증 단계는 잘못된 입력 포즈를 거부
+    bad = dict(frame, pose=dict(frame['pose'], quaternion=[0.0, 1.0]))
+    with pytest.raises(ValueError):
+        pipeline.run(bad)
+
+def test_pipeline_api(frame):
+    """
+    파이프라인 설정 API와 요청별 단계 선택
+    """
+    app = create_app()
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        response = client.post('/api/image?localize=passthrough', json=frame)
+        assert response.status_code == 200
+        assert json.loads(response.data)['pose'] == dict(frame['pose'], frame='ship')
+        
+        response = client.get('/api/pipeline')
+        config = json.loads(response.data)
+        assert config['stages']['localize'] == 'random_offset'
+        assert config['timings']['decode']['count'] >= 1
+        
+        response = client.post('/api/pipeline', json={'stages': {'localize': 'unknown'}})
+        assert response.status_code == 400
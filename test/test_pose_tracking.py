@@ -0,0 +1,81 @@
+"""
+스트림별 포즈 추적 필터 테스트
+"""
+
+import os
+import json
+import pytest
+from app.services.pose_tracking import PoseTracker
+from app.services.pose_pipeline import PosePipeline
+from app.services import pose_tracking
+
+FRAME_PACKET_PATH = os.path.join(os.path.dirname(__file__), '..', 'test_frame_packet.json')
+IDENTITY = [0.0, 0.0, 0.0, 1.0]
+SECOND_NS = 1_000_000_000
+
+def test_tracker_converges_to_constant_velocity():
+    """
+    등속 이동 스트림에서 속도를 추정하여 측정 위치를 따라감
+    """
+    tracker = PoseTracker(alpha=0.5, beta=0.2)
+    key = ('ship', 'user', 'cam')
+    for i in range(200):
+        position, quaternion = tracker.update(key, i * SECOND_NS // 10, [i * 0.1, 0.0, 0.0], IDENTITY)
+    assert position[0] == pytest.approx(19.9, abs=1e-3)
+    assert quaternion == pytest.approx(IDENTITY)
+    
+    # 순서가 뒤바뀐 프레임은 상태를 바꾸지 않음
+    assert tracker.update(key, 0, [100.0, 0.0, 0.0], IDENTITY)[0] == position
+    
+    # 긴 공백 후에는 측정값으로 다시 시작
+    position, _ = tracker.update(key, 100 * SECOND_NS, [5.0, 5.0, 5.0], IDENTITY)
+    assert position == [5.0, 5.0, 5.0]
+
+def test_tracker_smooths_rotation_and_validates():
+    """
+    자세는 이전 추정값과 측정값 사이로 보간
+    """
+    tracker = PoseTracker(rotation_alpha=0.5)
+    key = ('ship', 'user', 'cam')
+    tracker.update(key, 0, [0.0, 0.0, 0.0], IDENTITY)
+    _, quaternion = tracker.update(key, SECOND_NS // 10, [0.0, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0])
+    assert quaternion == pytest.approx([0.0, 0.0, 0.7071068, 0.7071068])
+    
+    with pytest.raises(ValueError):
+        tracker.configure(alpha=0.0)
+    with pytest.raises(ValueError):
+        tracker.configure(gain=0.5)
+
+def test_tracker_evicts_idle_and_excess_streams(monkeypatch):
+    """
+    오래 갱신되지 않은 스트림과 한도를 넘는 스트림 제거
+    """
+    now = [0.0]
+    monkeypatch.setattr(pose_tracking.time, 'monotonic', lambda: now[0])
+    tracker = PoseTracker(idle_timeout=10.0, max_streams=3)
+    for camera in range(5):
+        tracker.update(('ship', 'user', camera), 0, [0.0, 0.0, 0.0], IDENTITY)
+    config = tracker.get_config()
+    assert config['streams'] == 3
+    assert config['evicted'] == 2
+    
+    now[0] = 5.0
+    tracker.update(('ship', 'user', 4), SECOND_NS, [0.0, 0.0, 0.0], IDENTITY)
+    now[0] = 12.0
+    tracker.update(('ship', 'user', 9), 0, [0.0, 0.0, 0.0], IDENTITY)
+    config = tracker.get_config()
+    assert config['streams'] == 2
+    assert config['evicted'] == 4
+
+def test_pipeline_track_stage(monkeypatch):
+    """
+    파이프라인의 'track' 후처리 단계
+    """
+    with open(FRAME_PACKET_PATH) as f:
+        frame = json.load(f)
+    tracker = PoseTracker(alpha=1.0, rotation_alpha=1.0)
+    monkeypatch.setattr('app.services.pose_pipeline.default_tracker', tracker)
+    pipeline = PosePipeline({'localize': 'passthrough', 'postprocess': 'track'})
+    result, _ = pipeline.run(frame)
+    assert result['pose']['position_m'] == pytest.approx(frame['pose']['position_m'])
+    assert tracker.get_config()['streams'] == 1
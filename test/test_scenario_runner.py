@@ -0,0 +1,93 @@
+"""
+시나리오 자동 실행기 테스트
+"""
+
+import time
+import pytest
+from app.services.delay_simulator import DelaySimulator, STRATEGY_DEFAULTS
+from app.services.scenario_runner import ScenarioRunner, SCENARIOS
+
+def test_scenario_runner_phases():
+    """
+    단계별 전략 전환, 요청 태깅, 단계별 요약 테스트
+    """
+    simulator = DelaySimulator()
+    runner = ScenarioRunner(simulator)
+    runner.start([
+        {'scenario': 1, 'params': {'delay_seconds': 0.0}, 'duration': 0.3},
+        {'scenario': 'FixedDelayStrategy', 'params': {'delay_seconds': 0.02}, 'duration': 0.3}
+    ])
+    
+    def send():
+        phase = runner.current_phase()
+        record = simulator.apply_delay()
+        runner.observe(phase, record)
+        return phase
+    
+    time.sleep(0.1)
+    assert send() == 0
+    assert simulator.get_config()['params']['delay_seconds'] == 0.0
+    time.sleep(0.35)
+    assert send() == 1
+    assert send() == 1
+    assert simulator.get_config()['params']['delay_seconds'] == 0.02
+    
+    runner.join(timeout=2.0)
+    status = runner.get_status()
+    assert not status['running']
+    assert status['phase'] is None
+    assert [phase['requests'] for phase in status['phases']] == [1, 2]
+    assert status['phases'][1]['requested']['mean_ms'] == pytest.approx(20.0)
+    assert all(abs(phase['switch_error_ms']) < 50 for phase in status['phases'])
+    
+    # 실행이 끝나면 실행 전 전략으로 복원
+    assert simulator.get_config()['params']['delay_seconds'] == 0.0
+
+def test_scenario_runner_validation():
+    """
+    단계 정의 검증 테스트
+    """
+    runner = ScenarioRunner(DelaySimulator())
+    with pytest.raises(ValueError):
+        runner.start([])
+    with pytest.raises(ValueError):
+        runner.start([{'scenario': 9, 'duration': 1}])
+    with pytest.raises(ValueError):
+        runner.start([{'scenario': 1, 'duration': 0}])
+    with pytest.raises(ValueError):
+        runner.start([{'scenario': 'UnknownStrategy', 'duration': 1}])
+
+def test_scenario_defaults_shared():
+    """
+    시나리오 실행기 단계, 시뮬레이터 설정 함수, 엔드포인트가 같은 기본 매개변수를 사용하는지 테스트
+    """
+    from app import create_app
+    
+    simulator = DelaySimulator()
+    for number, strategy_name in SCENARIOS.items():
+        defaults = STRATEGY_DEFAULTS[strategy_name]
+        phase = ScenarioRunner._normalize_phase({'scenario': number, 'duration': 1})
+        assert phase['params'] == defaults
+        
+        simulator.set_strategy(strategy_name)
+        params = simulator.get_config()['params']
+        assert {key: params[key] for key in defaults} == defaults
+    
+    client = create_app().test_client()
+    for path, strategy_name in (('/api/delay/step', 'StepDelayStrategy'),
+                                ('/api/delay/scenario/4', 'StepDelayStrategy'),
+                                ('/api/delay/random', 'RandomDelayStrategy')):
+        response = client.post(path, json={})
+        assert response.status_code == 200
+        params = response.get_json()['config']['params']
+        defaults = STRATEGY_DEFAULTS[strategy_name]
+        assert {key: params[key] for key in defaults} == defaults
+    
+    # 지정한 값만 기본값을 덮어씀
+    response = client.post('/api/delay/random', json={'max_delay': 1.0})
+    params = response.get_json()['config']['params']
+    assert params['max_delay'] == 1.0
+    assert params['min_delay'] == STRATEGY_DEFAULTS['RandomDelayStrategy']['min_delay']
+    
+    # 다른 테스트에 영향을 주지 않도록 지연 없음으로 복원
+    client.post('/api/delay/fixed/0.0')
@@ -0,0 +1,82 @@
+"""
+프로세스 간 지연 전략 공유 상태 테스트
+"""
+
+import os
+import multiprocessing
+import pytest
+from app.services.delay_simulator import DelaySimulator
+from app.services.shared_delay_state import SharedDelayState
+
+@pytest.fixture
+def shared_state():
+    """
+    테스트용 공유 상태 생성
+    """
+    state = SharedDelayState(name=f'dtlt_test_{os.getpid()}')
+    yield state
+    state.close()
+    state.unlink()
+
+def _worker_config(name, queue):
+    """
+    다른 프로세스에서 공유 상태에 연결하여 현재 전략 설정 반환
+    """
+    simulator = DelaySimulator()
+    simulator.attach_shared_state(SharedDelayState(name=name))
+    queue.put(simulator.get_config())
+
+def test_strategy_shared_across_simulators(shared_state):
+    """
+    한 시뮬레이터의 전략 변경이 다른 시뮬레이터에 반영되는지 테스트
+    """
+    writer = DelaySimulator()
+    reader = DelaySimulator()
+    writer.attach_shared_state(shared_state)
+    reader.attach_shared_state(SharedDelayState(name=shared_state.name))
+    
+    writer.set_no_response(30.0)
+    
+    # 읽기 쪽은 버전 카운터 변경을 감지하여 같은 전략과 기준 시각을 따름
+    config = reader.get_config()
+    assert config['strategy'] == 'NoResponseDelayStrategy'
+    assert config['params']['no_response_duration'] == 30.0
+    assert abs(reader.strategy.start_time - writer.strategy.start_time) < 1e-6
+
+def test_strategy_shared_across_processes(shared_state):
+    """
+    다른 프로세스에서 공유 전략을 읽는지 테스트
+    """
+    simulator = DelaySimulator()
+    simulator.attach_shared_state(shared_state)
+    simulator.set_fixed_delay(0.2)
+    
+    ctx = multiprocessing.get_context('spawn')
+    queue = ctx.Queue()
+    process = ctx.Process(target=_worker_config, args=(shared_state.name, queue))
+    process.start()
+    config = queue.get(timeout=10)
+    process.join(timeout=10)
+    
+    assert config['strategy'] == 'FixedDelayStrategy'
+    assert config['params']['delay_seconds'] == 0.2
+
+def test_oversized_strategy_not_applied(shared_state):
+    """
+    공유 상태에 기록할 수 없는 설정은 어느 시뮬레이터에도 적용되지 않는지 테스트
+    """
+    writer = DelaySimulator()
+    reader = DelaySimulator()
+    writer.attach_shared_state(shared_state)
+    reader.attach_shared_state(SharedDelayState(name=shared_state.name))
+    writer.set_fixed_delay(0.2)
+    
+    # 표본 20000개는 JSON으로 64KB를 넘음
+    samples = [0.1 + i * 1e-6 for i in range(20000)]
+    with pytest.raises(ValueError):
+        writer.set_strategy('EmpiricalDelayStrategy', {'samples': samples})
+    
+    for simulator in (writer, reader):
+        config = simulator.get_config()
+        assert config['strategy'] == 'FixedDelayStrategy'
+        assert config['params']['delay_seconds'] == 0.2
@@ -0,0 +1,156 @@
+"""
+파이프라인 단계 프로세스 풀 실행기 테스트
+"""
+
+import os
+import json
+import time
+import threading
+import pytest
+from app.models.frame_packet import PoseBlock
+from app.services.pose_pipeline import PosePipeline, STAGE_KINDS, available_stages, get_stage, register_stage
+from app.services.stage_executor import StageExecutor, StageQueueFull
+from app.services.image_processor import set_pose_noise_seed
+from app.services.zone_index import load_layout_file, load_layout
+from app.services.transform_graph import default_graph
+
+FRAME_PACKET_PATH = os.path.join(os.path.dirname(__file__), '..', 'test_frame_packet.json')
+SHIP_LAYOUT_PATH = os.path.join(os.path.dirname(__file__), '..', 'ship_layout.json')
+TRANSFORMS = {
+    'localization_frame': 'ship',
+    'transforms': [
+        {'parent': 'ship', 'child': 'deck:1', 'translation': [10.0, 0.0, 0.0]},
+        {'parent': 'body', 'child': 'camera:0', 'translation': [0.0, 0.5, 0.0]}
+    ]
+}
+
+@register_stage('localize', 'test_image_stats')
+def _localize_test_image_stats(context):
+    """
+    테스트용 측위 단계: 이미지 바이트 길이/합계와 처리 프로세스 ID를 포즈로 반환
+    """
+    data = context.image_bytes
+    context.pose_block = PoseBlock(position_m=[float(len(data)), float(sum(data)), float(os.getpid())])
+
+@register_stage('localize', 'test_sleep')
+def _localize_test_sleep(context):
+    """
+    테스트용 측위 단계: 0.5초 대기
+    """
+    time.sleep(0.5)
+    context.pose_block = PoseBlock()
+
+@pytest.fixture
+def frame():
+    with open(FRAME_PACKET_PATH) as f:
+        return json.load(f)
+
+def test_offloaded_stage_runs_in_worker(frame):
+    """
+    단계가 워커 프로세스에서 공유 메모리의 이미지 바이트로 실행됨
+    """
+    executor = StageExecutor(max_workers=1, stage_modules=('test.test_stage_executor',))
+    try:
+        pipeline = PosePipeline({'localize': 'test_image_stats', 'postprocess': 'none'})
+        local, _ = pipeline.run(frame)
+        
+        pipeline.set_executor(executor, offload=('localize',))
+        remote, timings = pipeline.run(frame)
+        
+        assert remote['pose']['position_m'][:2] == local['pose']['position_m'][:2]
+        assert remote['pose']['position_m'][0] > 0
+        assert remote['pose']['position_m'][2] != float(os.getpid())
+        assert remote['ID'] == frame['ID']
+        assert 'localize' in timings
+        assert pipeline.get_config()['executor']['submitted'] == 1
+    finally:
+        executor.shutdown()
+
+def test_offload_queue_limit(frame):
+    """
+    대기열 한도에 도달하면 StageQueueFull로 거절
+    """
+    executor = StageExecutor(max_workers=1, max_pending=1, submit_timeout=0.05,
+                             stage_modules=('test.test_stage_executor',))
+    try:
+        pipeline = PosePipeline({'localize': 'test_sleep'})
+        pipeline.set_executor(executor, offload=('localize',))
+        pipeline.run(frame)  # 워커 시작 대기
+        
+        worker = threading.Thread(target=pipeline.run, args=(frame,))
+        worker.start()
+        time.sleep(0.1)
+        with pytest.raises(StageQueueFull):
+            pipeline.run(frame)
+        worker.join()
+        assert executor.get_config()['rejected'] == 1
+    finally:
+        executor.shutdown()
+
+def test_decode_stays_in_process(frame):
+    """
+    디코딩 단계는 offload에 포함되어도 워커로 보내지 않음 (원본 요청을 워커로 피클링하지 않음)
+    """
+    executor = StageExecutor(max_workers=1)
+    try:
+        pipeline = PosePipeline({'localize': 'passthrough'})
+        pipeline.set_executor(executor, offload=('decode',))
+        result, timings = pipeline.run(frame)
+        assert 'decode' in timings
+        assert result['ID'] == frame['ID']
+        assert executor.get_config()['submitted'] == 0
+    finally:
+        executor.shutdown()
+
+def test_offload_every_registered_stage(frame):
+    """
+    모든 기본 단계 구현을 워커로 보내도 현재 프로세스에서 실행한 결과와 같음
+    """
+    builtin = {
+        kind: [name for name in names if get_stage(kind, name).__module__ == 'app.services.pose_pipeline']
+        for kind, names in available_stages().items()
+    }
+    executor = StageExecutor(max_workers=1)
+    try:
+        local = PosePipeline({'localize': 'passthrough'})
+        remote = PosePipeline({'localize': 'passthrough'})
+        remote.set_executor(executor, offload=STAGE_KINDS)
+        for kind, names in builtin.items():
+            for name in names:
+                expected, _ = local.run(frame, {kind: name})
+                result, timings = remote.run(frame, {kind: name})
+                assert list(timings) == list(STAGE_KINDS)
+                assert result['ID'] == expected['ID']
+                assert result['timestamp_ns'] == expected['timestamp_ns']
+                if name != 'random_offset':
+                    assert result['pose'] == expected['pose'], (kind, name)
+        assert executor.get_config()['submitted'] > 0
+    finally:
+        executor.shutdown()
+
+def test_offloaded_stages_use_frontend_state(frame):
+    """
+    시드/선박 배치/변환 그래프를 설정한 프레임은 워커에서 처리해도 현재 프로세스와 같은 포즈를 받음
+    (실행기 생성 후 바뀐 상태도 워커에 반영)
+    """
+    frame['pose']['position_m'] = [5.0, 1.0, 5.0]
+    set_pose_noise_seed(42)
+    load_layout_file(SHIP_LAYOUT_PATH)
+    default_graph.load(TRANSFORMS)
+    executor = StageExecutor(max_workers=1)
+    try:
+        local = PosePipeline()
+        remote = PosePipeline()
+        remote.set_executor(executor, offload=STAGE_KINDS)
+        for _ in range(2):
+            expected, _ = local.run(frame, output_frame='deck', subject='body')
+            result, _ = remote.run(frame, output_frame='deck', subject='body')
+            assert result['pose'] == expected['pose']
+            assert result['pose']['zone']['compartment'] == 'Engine'
+            set_pose_noise_seed(7)
+            default_graph.set_transform('ship', 'deck:1', [0.0, 0.0, 10.0])
+    finally:
+        executor.shutdown()
+        set_pose_noise_seed(None)
+        load_layout(None)
+        default_graph.load({})
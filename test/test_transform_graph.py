@@ -0,0 +1,122 @@
+"""
+좌표계 변환 그래프 테스트
+"""
+
+import os
+import json
+import numpy as np
+import pytest
+from app import create_app
+from app.services.pose_math import axis_angle_to_quat, quat_rotate, quat_angle, pose_compose, pose_inverse
+from app.services.transform_graph import TransformGraph, default_graph
+from app.services.image_processor import process_images_batch
+from app.services.pose_pipeline import PosePipeline
+
+FRAME_PACKET_PATH = os.path.join(os.path.dirname(__file__), '..', 'test_frame_packet.json')
+YAW_90 = axis_angle_to_quat([0.0, 1.0, 0.0], np.pi / 2).tolist()
+
+TRANSFORMS = {
+    'localization_frame': 'ship',
+    'transforms': [
+        {'parent': 'ship', 'child': 'deck:1', 'translation': [10.0, 0.0, 0.0]},
+        {'parent': 'ship', 'child': 'deck:2', 'translation': [0.0, 3.0, 0.0], 'quaternion': YAW_90},
+        {'parent': 'body', 'child': 'camera:0', 'translation': [0.0, 0.5, 0.0]}
+    ]
+}
+
+@pytest.fixture
+def graph():
+    graph = TransformGraph()
+    graph.load(TRANSFORMS)
+    return graph
+
+@pytest.fixture
+def frame():
+    with open(FRAME_PACKET_PATH) as f:
+        return json.load(f)
+
+def test_pose_compose_and_inverse():
+    """
+    강체 변환 합성과 역변환
+    """
+    t, q = [1.0, 2.0, 3.0], YAW_90
+    t_id, q_id = pose_compose(t, q, *pose_inverse(t, q))
+    assert t_id == pytest.approx([0.0, 0.0, 0.0], abs=1e-12)
+    assert quat_angle(q_id, [0.0, 0.0, 0.0, 1.0]) == pytest.approx(0.0, abs=1e-6)
+    
+    # y축 90도 회전은 x축을 -z축으로 보냄
+    assert quat_rotate(YAW_90, [1.0, 0.0, 0.0]) == pytest.approx([0.0, 0.0, -1.0], abs=1e-12)
+
+def test_lookup_between_frames(graph):
+    """
+    같은 트리의 좌표계 사이 변환과 연결되지 않은 좌표계
+    """
+    # 선박 좌표계 위치를 데크 1 좌표계로
+    positions, _ = graph.transform_poses([[12.0, 1.0, 0.0]], [[0.0, 0.0, 0.0, 1.0]], 'ship', 'deck:1')
+    assert positions[0] == pytest.approx([2.0, 1.0, 0.0])
+    
+    # 데크 2 좌표계의 위치를 데크 1 좌표계로 (선박 좌표계를 거쳐)
+    positions, quaternions = graph.transform_poses([[1.0, 0.0, 0.0]], [[0.0, 0.0, 0.0, 1.0]], 'deck:2', 'deck:1')
+    assert positions[0] == pytest.approx([-10.0, 3.0, -1.0])
+    assert quat_angle(quaternions[0], YAW_90) == pytest.approx(0.0, abs=1e-6)
+    
+    with pytest.raises(ValueError):
+        graph.lookup('ship', 'body')
+    with pytest.raises(ValueError):
+        graph.set_transform('camera:0', 'body')
+
+def test_batch_transform_matches_rows(graph):
+    """
+    행마다 대상 좌표계가 다른 배치 변환은 행별 변환과 같음
+    """
+    rng = np.random.default_rng(1)
+    positions = rng.normal(size=(50, 3))
+    quaternions = rng.normal(size=(50, 4))
+    targets = ['deck:1' if i % 2 else 'deck:2' for i in range(50)]
+    batch_positions, batch_quaternions = graph.transform_poses(positions, quaternions, 'ship', targets)
+    for i in range(50):
+        row_position, row_quaternion = graph.transform_poses(positions[i], quaternions[i], 'ship', targets[i])
+        assert batch_positions[i] == pytest.approx(row_position[0])
+        assert quat_angle(batch_quaternions[i], row_quaternion[0]) == pytest.approx(0.0, abs=1e-6)
+    
+    # 카메라 포즈를 몸체 포즈로 (카메라가 몸체보다 0.5m 위에 장착)
+    body_positions, _ = graph.transform_poses([[0.0, 1.7, 0.0]], [[0.0, 0.0, 0.0, 1.0]], 'ship', 'ship', cameras=[0])
+    assert body_positions[0] == pytest.approx([0.0, 1.2, 0.0])
+
+def test_pipeline_and_batch_output_frame(frame, monkeypatch):
+    """
+    파이프라인과 배치 처리가 요청한 좌표계로 결과를 반환하고 좌표계를 표시
+    """
+    monkeypatch.setattr(default_graph, '_parents', {})
+    monkeypatch.setattr(default_graph, '_cache', {})
+    default_graph.load(TRANSFORMS)
+    frame['pose']['position_m'] = [12.0, 1.0, 0.0]
+    
+    pipeline = PosePipeline({'localize': 'passthrough'})
+    result, _ = pipeline.run(frame)
+    assert result['pose']['frame'] == 'ship'
+    
+    # zone.deck = 1이므로 'deck'은 deck:1 좌표계
+    result, _ = pipeline.run(frame, output_frame='deck', subject='body')
+    assert result['pose']['frame'] == 'deck:1'
+    assert result['pose']['position_m'] == pytest.approx([2.0, 0.5, 0.0])
+    with pytest.raises(ValueError):
+        pipeline.run(frame, subject='head')
+    
+    batch = process_images_batch([frame, frame], output_frame='deck:2')
+    assert [packet['pose']['frame'] for packet in batch] == ['deck:2', 'deck:2']
+
+def test_transforms_api():
+    """
+    변환 그래프 적재/조회 API
+    """
+    client = create_app().test_client()
+    try:
+        response = client.post('/api/transforms', json=TRANSFORMS)
+        assert response.status_code == 200
+        assert len(client.get('/api/transforms').get_json()['transforms']) == 3
+        
+        cyclic = {'transforms': [{'parent': 'a', 'child': 'b'}, {'parent': 'b', 'child': 'a'}]}
+        assert client.post('/api/transforms', json=cyclic).status_code == 400
+    finally:
+        default_graph.load({})
@@ -0,0 +1,121 @@
+"""
+선박 구역 공간 색인 테스트
+"""
+
+import os
+import json
+import numpy as np
+import pytest
+from app import create_app
+from app.services import zone_index
+from app.services.zone_index import ZoneIndex
+from app.services.pose_pipeline import PosePipeline
+
+LAYOUT_PATH = os.path.join(os.path.dirname(__file__), '..', 'ship_layout.json')
+FRAME_PACKET_PATH = os.path.join(os.path.dirname(__file__), '..', 'test_frame_packet.json')
+
+@pytest.fixture
+def layout():
+    with open(LAYOUT_PATH) as f:
+        return json.load(f)
+
+@pytest.fixture
+def loaded_layout(layout):
+    zone_index.load_layout(layout)
+    yield layout
+    zone_index.load_layout(None)
+
+def test_resolve_position(layout):
+    """
+    위치(y축이 높이)로 데크/구획/영역 ID 조회
+    """
+    index = ZoneIndex(layout)
+    zone = index.resolve([5.0, 1.0, 5.0])
+    assert zone.to_dict() == {'deck': 1, 'compartment': 'Engine', 'zone_id': 101}
+    assert index.resolve([45.0, 4.5, 5.0]).compartment == 'Bridge'
+    assert index.resolve([20.0, 4.5, 5.0]).compartment == 'Cabin'
+    
+    # 경계: min 포함, max 제외
+    assert index.resolve([20.0, 0.0, 0.0]).compartment == 'Main'
+    assert index.resolve([60.0, 1.0, 0.0]) is None
+    
+    # 데크 높이 밖, 평면 밖
+    assert index.resolve([5.0, 7.0, 5.0]) is None
+    assert index.resolve([-1.0, 1.0, 5.0]) is None
+
+def test_lookup_batch_matches_brute_force(layout):
+    """
+    배치 조회 결과가 모든 구획을 검사한 결과와 같음
+    """
+    index = ZoneIndex(layout)
+    rng = np.random.default_rng(0)
+    positions = rng.uniform([-5.0, -1.0, -2.0], [65.0, 7.0, 14.0], size=(2000, 3))
+    found = index.lookup(positions)
+    
+    expected = []
+    for x, y, z in positions:
+        match = -1
+        number = 0
+        for deck in layout['decks']:
+            for compartment in deck['compartments']:
+                if (match < 0 and deck['height'][0] <= y < deck['height'][1]
+                        and compartment['min'][0] <= x < compartment['max'][0]
+                        and compartment['min'][1] <= z < compartment['max'][1]):
+                    match = number
+                number += 1
+        expected.append(match)
+    assert found.tolist() == expected
+    
+    # 위치 하나 조회 경로도 같은 결과
+    for position, index_found in zip(positions[:200].tolist(), found[:200].tolist()):
+        zone = index.resolve(position)
+        assert (zone.zone_id if zone else None) == (index.compartments[index_found][2] if index_found >= 0 else None)
+    assert index.resolve_batch(positions[:3])[0] == index.zone_block(int(found[0]))
+
+def test_invalid_layout(layout):
+    """
+    잘못된 배치 거부
+    """
+    with pytest.raises(ValueError):
+        ZoneIndex(dict(layout, decks=[]))
+    overlapping = json.loads(json.dumps(layout))
+    overlapping['decks'][1]['height'] = [2.0, 6.0]
+    with pytest.raises(ValueError):
+        ZoneIndex(overlapping)
+    with pytest.raises(ValueError):
+        ZoneIndex(dict(layout, cell_size=0.0001))
+
+def test_pipeline_zone_stage(loaded_layout):
+    """
+    파이프라인 영역 단계가 위치로 영역을 결정
+    """
+    with open(FRAME_PACKET_PATH) as f:
+        frame = json.load(f)
+    frame['pose']['position_m'] = [30.0, 1.0, 6.0]
+    pipeline = PosePipeline({'localize': 'passthrough'})
+    result, _ = pipeline.run(frame)
+    assert result['pose']['zone'] == {'deck': 1, 'compartment': 'Main', 'zone_id': 102}
+    
+    # 클라이언트 영역 유지
+    result, _ = pipeline.run(frame, {'zone': 'client'})
+    assert result['pose']['zone'] == {'deck': 1, 'compartment': 'Main', 'zone_id': 1}
+
+def test_zone_api(layout):
+    """
+    배치 적재/조회 API
+    """
+    client = create_app().test_client()
+    response = client.post('/api/zones/resolve', json={'positions': [[5.0, 1.0, 5.0]]})
+    assert response.status_code == 404
+    
+    response = client.post('/api/zones/layout', json=layout)
+    assert response.status_code == 200
+    assert response.get_json()['layout']['compartments'] == 4
+    try:
+        response = client.post('/api/zones/resolve', json={'positions': [[5.0, 1.0, 5.0], [5.0, 9.0, 5.0]]})
+        assert response.get_json()['zones'] == [{'deck': 1, 'compartment': 'Engine', 'zone_id': 101}, None]
+        
+        response = client.post('/api/zones/layout', json=dict(layout, vertical_axis=5))
+        assert response.status_code == 400
+    finally:
+        zone_index.load_layout(None)